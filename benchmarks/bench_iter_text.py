@@ -0,0 +1,92 @@
+# encoding: utf-8
+
+"""Benchmark `docx.fast.iter_text()` against reading text through the document API.
+
+Usage::
+
+    python benchmarks/bench_iter_text.py [path ...]
+
+Each *path* is a .docx file to include in the corpus. When no paths are given, a
+synthetic corpus of large generated documents is written to a temporary directory.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from docx.api import Document
+from docx.fast import iter_text
+from docx.streaming import StreamingDocument
+
+DOCUMENT_COUNT = 3
+PARAGRAPH_COUNT = 20000
+
+
+def generate_corpus(dirpath):
+    """Return list of paths to generated documents written into *dirpath*."""
+    paths = []
+    for n in range(DOCUMENT_COUNT):
+        path = os.path.join(dirpath, 'generated-%d.docx' % n)
+        with StreamingDocument(path) as document:
+            for i in range(PARAGRAPH_COUNT):
+                text = 'Paragraph %d of document %d.' % (i, n)
+                paragraph = document.add_paragraph(text)
+                paragraph.add_run('\tbold text').bold = True
+                if i % 100 == 0:
+                    table = document.add_table(rows=5, cols=4)
+                    for cell in table._cells:
+                        cell.text = 'cell'
+        paths.append(path)
+    return paths
+
+
+def proxy_text(path):
+    """Return count of body paragraphs read through the proxy API."""
+    document = Document(path)
+    return len([paragraph.text for paragraph in document.paragraphs])
+
+
+def document_text(path):
+    """Return count of paragraphs, including table cells, read by `Document`."""
+    return len(list(Document(path).iter_paragraph_text(recursive=True)))
+
+
+def fast_text(path):
+    """Return count of paragraphs, including table cells, read by `iter_text()`."""
+    return len(list(iter_text(path)))
+
+
+def timed(fn, paths):
+    start = time.time()
+    count = sum(fn(path) for path in paths)
+    return time.time() - start, count
+
+
+def main(paths):
+    tmpdir = None
+    if not paths:
+        tmpdir = tempfile.mkdtemp()
+        print('generating corpus in %s ...' % tmpdir)
+        paths = generate_corpus(tmpdir)
+    try:
+        proxy_secs, proxy_count = timed(proxy_text, paths)
+        document_secs, document_count = timed(document_text, paths)
+        fast_secs, fast_count = timed(fast_text, paths)
+    finally:
+        if tmpdir is not None:
+            shutil.rmtree(tmpdir)
+    tmpl = '%-40s %7.3fs  (%d paragraphs)'
+    print(tmpl % ('Document(path).paragraphs:', proxy_secs, proxy_count))
+    print(tmpl % (
+        'Document(path).iter_paragraph_text(True):', document_secs, document_count
+    ))
+    print(tmpl % ('docx.fast.iter_text(path):', fast_secs, fast_count))
+    print('speedup: %.1fx' % (proxy_secs / fast_secs))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,77 @@
+# encoding: utf-8
+
+"""Benchmark opening a large document sequentially and with a pool of worker threads.
+
+Usage::
+
+    python benchmarks/bench_open.py [sections] [workers]
+
+Builds a document with *sections* (default 50) sections, each having its own header
+and footer and 200 body paragraphs, saves it to a temporary file, then reports the time
+taken by ``Document(path)`` and by ``Document(path, workers=workers)`` (default 4),
+taking the best of several runs of each. The speedup depends on the number of CPU cores
+available; a single-core machine shows none.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import sys
+import tempfile
+import time
+
+from docx import Document
+
+SECTION_COUNT = 50
+WORKERS = 4
+PARAGRAPHS_PER_SECTION = 200
+RUNS = 5
+
+
+def main(section_count, workers):
+    path = build_document(section_count)
+    try:
+        sequential = best_time(lambda: Document(path))
+        report('Document(path)', sequential)
+        concurrent = best_time(lambda: Document(path, workers=workers))
+        report('Document(path, workers=%d)' % workers, concurrent)
+        print('%-40s %7.2fx' % ('speedup', sequential / concurrent))
+    finally:
+        os.remove(path)
+
+
+def build_document(section_count):
+    """Return the path of a temporary file holding a document to open."""
+    document = Document()
+    for n in range(section_count):
+        section = document.sections[-1] if n == 0 else document.add_section()
+        section.header.is_linked_to_previous = False
+        section.header.paragraphs[0].text = 'Header of section %d' % n
+        section.footer.is_linked_to_previous = False
+        section.footer.paragraphs[0].text = 'Footer of section %d' % n
+        for m in range(PARAGRAPHS_PER_SECTION):
+            document.add_paragraph('Paragraph %d of section %d. ' % (m, n) * 4)
+    fd, path = tempfile.mkstemp(suffix='.docx')
+    os.close(fd)
+    document.save(path)
+    return path
+
+
+def best_time(fn):
+    times = []
+    for _ in range(RUNS):
+        start = time.time()
+        fn()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def report(label, seconds):
+    print('%-40s %7.3fs' % (label, seconds))
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else SECTION_COUNT,
+        int(sys.argv[2]) if len(sys.argv) > 2 else WORKERS,
+    )
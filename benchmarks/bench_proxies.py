@@ -0,0 +1,96 @@
+# encoding: utf-8
+
+"""Benchmark walking a large document with and without proxy object caching.
+
+Usage::
+
+    python benchmarks/bench_proxies.py [paragraphs] [passes]
+
+Builds a document of *paragraphs* (default 10000) paragraphs of three runs each and
+a 50 x 8 table, then walks it *passes* (default 3) times, reading ``run.font.bold`` for
+every run and the text of every table cell through ``table.cell()``. Each walk keeps
+a reference to every paragraph and run it visits, as code that collects them for
+later use does. Reports the best time of several runs and the memory allocated by
+one walk, first with ``document.cache_proxies`` off and then with it on.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import sys
+import time
+import tracemalloc
+
+from docx import Document
+
+PARAGRAPH_COUNT = 10000
+PASSES = 3
+RUNS = 5
+
+
+def main(paragraph_count, passes):
+    document = build_document(paragraph_count)
+    for cache_proxies in (False, True):
+        document.cache_proxies = cache_proxies
+        label = 'cache_proxies=%s' % cache_proxies
+        report(label, best_time(lambda: walk(document, passes)), peak_bytes(
+            lambda: walk(document, passes)
+        ))
+
+
+def build_document(paragraph_count):
+    document = Document()
+    for n in range(paragraph_count):
+        paragraph = document.add_paragraph('Paragraph %d. ' % n)
+        paragraph.add_run('Bold text. ').bold = True
+        paragraph.add_run('Plain text.')
+    table = document.add_table(rows=50, cols=8)
+    for row_idx in range(50):
+        for col_idx in range(8):
+            table.cell(row_idx, col_idx).text = '%d, %d' % (row_idx, col_idx)
+    return document
+
+
+def walk(document, passes):
+    """Visit the content of *document* *passes* times, returning what was kept."""
+    kept = []
+    for _ in range(passes):
+        for paragraph in document.paragraphs:
+            kept.append(paragraph)
+            for run in paragraph.runs:
+                kept.append(run)
+                run.font.bold
+        table = document.tables[0]
+        for row_idx in range(50):
+            for col_idx in range(8):
+                table.cell(row_idx, col_idx).text
+    return kept
+
+
+def best_time(fn):
+    times = []
+    for _ in range(RUNS):
+        start = time.time()
+        fn()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def peak_bytes(fn):
+    """Return the peak memory allocated while calling *fn*, in bytes."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report(label, seconds, bytes_):
+    print('%-40s %7.3fs %9.1f MB' % (label, seconds, bytes_ / 1e6))
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else PARAGRAPH_COUNT,
+        int(sys.argv[2]) if len(sys.argv) > 2 else PASSES,
+    )
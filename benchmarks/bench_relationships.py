@@ -0,0 +1,59 @@
+# encoding: utf-8
+
+"""Benchmark adding and looking up relationships in a large |Relationships| collection.
+
+Usage::
+
+    python benchmarks/bench_relationships.py [count]
+
+Adds *count* (default 10,000) relationships to internal parts and the same number of
+external hyperlink relationships to a single source part, the way a document with many
+images and hyperlinks is built, then looks each one up again.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import sys
+import time
+
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+
+RELATIONSHIP_COUNT = 10000
+
+
+def main(count):
+    source = Part(PackURI('/word/document.xml'), CT.WML_DOCUMENT_MAIN)
+    targets = [
+        Part(PackURI('/word/media/image%d.png' % n), CT.PNG)
+        for n in range(1, count + 1)
+    ]
+    urls = ['https://example.com/page/%d' % n for n in range(count)]
+
+    start = time.time()
+    for target in targets:
+        source.relate_to(target, RT.IMAGE)
+    report('relate_to() x %d' % count, start)
+
+    start = time.time()
+    for url in urls:
+        source.relate_to(url, RT.HYPERLINK, is_external=True)
+    report('relate_to(is_external=True) x %d' % count, start)
+
+    start = time.time()
+    for target in targets:
+        source.relate_to(target, RT.IMAGE)
+    for url in urls:
+        source.relate_to(url, RT.HYPERLINK, is_external=True)
+    report('existing relationship lookups x %d' % (2 * count), start)
+
+    assert len(source.rels) == 2 * count
+
+
+def report(label, start):
+    print('%-40s %7.3fs' % (label, time.time() - start))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else RELATIONSHIP_COUNT)
@@ -0,0 +1,115 @@
+# encoding: utf-8
+
+"""Benchmark reading formatting properties with and without memoized conversions.
+
+Usage::
+
+    python benchmarks/bench_simpletypes.py [paragraphs]
+
+Builds a document of *paragraphs* (default 10000) formatted paragraphs, each having a
+formatted run, then reports the time taken to read every |ParagraphFormat| property of
+each paragraph and every |Font| property of each run, first with the memoized
+attribute-value conversions of `docx.oxml.simpletypes` and then with memoization
+turned off, taking the best of several runs of each.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import sys
+import time
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_UNDERLINE
+from docx.oxml import simpletypes
+from docx.shared import Pt, RGBColor
+
+PARAGRAPH_COUNT = 10000
+RUNS = 5
+
+PARAGRAPH_FORMAT_PROPERTIES = (
+    'alignment', 'first_line_indent', 'keep_together', 'keep_with_next',
+    'left_indent', 'line_spacing', 'line_spacing_rule', 'page_break_before',
+    'right_indent', 'space_after', 'space_before', 'widow_control',
+)
+FONT_PROPERTIES = (
+    'all_caps', 'bold', 'complex_script', 'cs_bold', 'cs_italic', 'double_strike',
+    'emboss', 'hidden', 'highlight_color', 'imprint', 'italic', 'math', 'name',
+    'no_proof', 'outline', 'rtl', 'shadow', 'size', 'small_caps', 'snap_to_grid',
+    'spec_vanish', 'strike', 'subscript', 'superscript', 'underline', 'web_hidden',
+)
+
+
+class _NoMemo(dict):
+    """Stand-in for a memo dict that never remembers anything."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def main(paragraph_count):
+    document = build_document(paragraph_count)
+    memoized = best_time(lambda: read_properties(document))
+    report('memoized', memoized)
+    from_xml_memo, to_xml_memo = simpletypes._from_xml_memo, simpletypes._to_xml_memo
+    simpletypes._from_xml_memo = _NoMemo()
+    simpletypes._to_xml_memo = _NoMemo()
+    try:
+        unmemoized = best_time(lambda: read_properties(document))
+    finally:
+        simpletypes._from_xml_memo = from_xml_memo
+        simpletypes._to_xml_memo = to_xml_memo
+    report('not memoized', unmemoized)
+    print('%-40s %7.2fx' % ('speedup', unmemoized / memoized))
+
+
+def build_document(paragraph_count):
+    """Return a document having *paragraph_count* formatted paragraphs."""
+    document = Document()
+    for n in range(paragraph_count):
+        paragraph = document.add_paragraph()
+        paragraph_format = paragraph.paragraph_format
+        paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        paragraph_format.first_line_indent = Pt(18)
+        paragraph_format.left_indent = Pt(n % 4 * 9)
+        paragraph_format.space_after = Pt(6)
+        paragraph_format.space_before = Pt(n % 3 * 6)
+        paragraph_format.line_spacing = 1.15
+        paragraph_format.keep_together = True
+        run = paragraph.add_run('Paragraph %d.' % n)
+        font = run.font
+        font.bold = n % 2 == 0
+        font.italic = n % 3 == 0
+        font.size = Pt(10 + n % 3)
+        font.name = 'Calibri'
+        font.underline = WD_UNDERLINE.DOUBLE if n % 5 == 0 else None
+        font.color.rgb = RGBColor(0x1F, 0x49, 0x7D)
+    return document
+
+
+def read_properties(document):
+    for paragraph in document.paragraphs:
+        paragraph_format = paragraph.paragraph_format
+        for name in PARAGRAPH_FORMAT_PROPERTIES:
+            getattr(paragraph_format, name)
+        for run in paragraph.runs:
+            font = run.font
+            for name in FONT_PROPERTIES:
+                getattr(font, name)
+            font.color.rgb
+
+
+def best_time(fn):
+    times = []
+    for _ in range(RUNS):
+        start = time.time()
+        fn()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def report(label, seconds):
+    print('%-40s %7.3fs' % (label, seconds))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else PARAGRAPH_COUNT)
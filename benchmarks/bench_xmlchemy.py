@@ -0,0 +1,73 @@
+# encoding: utf-8
+
+"""Benchmark the per-access cost of properties added by the xmlchemy descriptors.
+
+Usage::
+
+    python benchmarks/bench_xmlchemy.py [accesses]
+
+Times *accesses* (default 200000) reads of ``run.bold``, ``rPr.sz_val`` and
+``tc.grid_span``, and of the ``rPr.b`` child-element and ``sz.val`` attribute
+properties they are built on. For the last two, the same lookup done the way the
+descriptors did before Clark names were computed at class creation, calling ``qn()``
+on each access, is timed alongside for comparison.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import sys
+import time
+
+from docx import Document
+from docx.oxml.ns import qn
+from docx.oxml.simpletypes import ST_HpsMeasure
+from docx.shared import Pt
+
+ACCESSES = 200000
+RUNS = 5
+
+
+def main(accesses):
+    document = Document()
+    run = document.add_paragraph().add_run('text')
+    run.bold = True
+    run.font.size = Pt(12)
+    rPr = run._r.rPr
+    sz = rPr.sz
+    tc = document.add_table(rows=1, cols=2).cell(0, 0)._tc
+    tc.grid_span = 1
+
+    def qn_per_access_b():
+        return rPr.find(qn('w:b'))
+
+    def qn_per_access_sz_val():
+        return ST_HpsMeasure.from_xml(sz.get(qn('w:val')))
+
+    report('run.bold', per_access(lambda: run.bold, accesses))
+    report('rPr.sz_val', per_access(lambda: rPr.sz_val, accesses))
+    report('tc.grid_span', per_access(lambda: tc.grid_span, accesses))
+    report('rPr.b', per_access(lambda: rPr.b, accesses))
+    report('rPr.find(qn("w:b"))', per_access(qn_per_access_b, accesses))
+    report('sz.val', per_access(lambda: sz.val, accesses))
+    report(
+        'from_xml(sz.get(qn("w:val")))', per_access(qn_per_access_sz_val, accesses)
+    )
+
+
+def per_access(fn, accesses):
+    """Return the best time in seconds over several runs for one call of *fn*."""
+    times = []
+    for _ in range(RUNS):
+        start = time.time()
+        for _ in range(accesses):
+            fn()
+        times.append(time.time() - start)
+    return min(times) / accesses
+
+
+def report(label, seconds):
+    print('%-40s %7.3fus' % (label, seconds * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ACCESSES)
@@ -73,6 +73,8 @@ rst_epilog = """
 
 .. |BaseStyle| replace:: :class:`.BaseStyle`
 
+.. |BatchResult| replace:: :class:`.BatchResult`
+
 .. |BlockItemContainer| replace:: :class:`.BlockItemContainer`
 
 .. |_Body| replace:: :class:`._Body`
@@ -97,6 +99,8 @@ rst_epilog = """
 
 .. |DocumentPart| replace:: :class:`.DocumentPart`
 
+.. |DocumentTemplate| replace:: :class:`.DocumentTemplate`
+
 .. |docx| replace:: ``python-docx``
 
 .. |Emu| replace:: :class:`.Emu`
@@ -163,6 +167,8 @@ rst_epilog = """
 
 .. |Run| replace:: :class:`.Run`
 
+.. |RuntimeError| replace:: :exc:`.RuntimeError`
+
 .. |Section| replace:: :class:`.Section`
 
 .. |Sections| replace:: :class:`.Sections`
@@ -171,6 +177,8 @@ rst_epilog = """
 
 .. |str| replace:: :class:`.str`
 
+.. |StreamingDocument| replace:: :class:`.StreamingDocument`
+
 .. |Styles| replace:: :class:`.Styles`
 
 .. |StylesPart| replace:: :class:`.StylesPart`
@@ -1,6 +1,6 @@
 # encoding: utf-8
 
-from docx.api import Document  # noqa
+from docx.api import Document, DocumentTemplate, register_template  # noqa
 
 __version__ = '0.8.9'
 
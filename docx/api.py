@@ -10,28 +10,154 @@ from __future__ import absolute_import, division, print_function
 
 import os
 
+from docx.compat import is_string
 from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.pkgreader import PackageSnapshot
 from docx.package import Package
 
+# ---maps the absolute path of each registered template to a
+#    `(file_key, document_template)` pair, or |None| until the template is
+#    first used. *file_key* is the `(mtime_ns, size)` of the file when it was
+#    read, or |None| for the built-in default template, which never changes
+#    and so is never checked again---
+_templates = {}
 
-def Document(docx=None):
+
+def Document(docx=None, lazy=False, workers=None):
     """
     Return a |Document| object loaded from *docx*, where *docx* can be
     either a path to a ``.docx`` file (a string) or a file-like object. If
     *docx* is missing or ``None``, the built-in default document "template"
     is loaded.
+
+    When *lazy* is |True|, the bytes of each part are read from *docx* only
+    when that part is first used, so parts that are never touched, such as
+    images when only text is read, are never loaded into memory. *docx* is
+    held open for the life of the document in that case, and a file-like
+    object passed as *docx* must not be closed while the document is in use.
+
+    Otherwise, when *workers* is an int, the parts of *docx* are decompressed
+    and their XML parsed by a pool of that many threads, which shortens the
+    time to open a large document with many headers, footers, footnotes or
+    comments on a multi-core machine. The document is the same either way.
+    On Python 2 this requires the ``futures`` backport of
+    :mod:`concurrent.futures`, and |RuntimeError| is raised without it.
+
+    The default template, and any template registered with
+    :func:`register_template`, is read and parsed only once per process.
+    Each document created from it gets its own copy of each part the first
+    time that part is used. *lazy* and *workers* don't apply to such
+    a template, and |ValueError| is raised when either is specified for one.
     """
     docx = _default_docx_path() if docx is None else docx
-    document_part = Package.open(docx).main_document_part
-    if document_part.content_type != CT.WML_DOCUMENT_MAIN:
-        tmpl = "file '%s' is not a Word file, content type is '%s'"
-        raise ValueError(tmpl % (docx, document_part.content_type))
+    template = _registered_template(docx)
+    if template is not None:
+        if lazy or workers is not None:
+            raise ValueError(
+                "lazy and workers can't be used with registered template '%s'"
+                % docx
+            )
+        return template.instantiate()
+    package = Package.open(docx, lazy, workers)
+    document_part = _main_document_part(package, docx)
     return document_part.document
 
 
+class DocumentTemplate(object):
+    """
+    A ``.docx`` package read and parsed once, from which any number of
+    independent |Document| objects can be created with :meth:`instantiate`.
+
+    *docx* is a path to a ``.docx`` file (a string) or a file-like object.
+    It is read completely when the template is created and not used after
+    that.
+    """
+    def __init__(self, docx):
+        super(DocumentTemplate, self).__init__()
+        package = Package.from_snapshot(PackageSnapshot.from_file(docx))
+        _main_document_part(package, docx)
+        self._package = package
+
+    def instantiate(self):
+        """
+        Return a new |Document| object containing the content of this
+        template. Changes to the document do not affect the template or any
+        other document created from it.
+
+        The parts of the new document share their bytes with the template
+        until first used, so creating a document costs microseconds rather
+        than the milliseconds needed to open the package file. The XML of a
+        part is copied for the document the first time the part is
+        accessed, and parts never accessed, such as images, fonts and the
+        theme, are written to the saved document in the compressed form
+        read from the template, without being compressed again.
+        """
+        return self._package.clone().main_document_part.document
+
+
+def register_template(path):
+    """
+    Register the ``.docx`` file at *path* as a template, so ``Document(path)``
+    creates its documents from a |DocumentTemplate| rather than opening the
+    file each time. The template is read again whenever the modification
+    time or size of the file changes.
+    """
+    _templates.setdefault(os.path.abspath(path), None)
+
+
 def _default_docx_path():
     """
     Return the path to the built-in default .docx package.
     """
     _thisdir = os.path.split(__file__)[0]
     return os.path.join(_thisdir, 'templates', 'default-docx-template')
+
+
+def _file_key(path):
+    """
+    Return a `(mtime_ns, size)` pair for the file at *path* that changes
+    when the file is rewritten. Python 2 has no `st_mtime_ns`, so the
+    float modification time is converted there.
+    """
+    st = os.stat(path)
+    mtime_ns = getattr(st, 'st_mtime_ns', None)
+    if mtime_ns is None:
+        mtime_ns = int(st.st_mtime * 1e9)
+    return mtime_ns, st.st_size
+
+
+def _main_document_part(package, docx):
+    """
+    Return the main document part of *package*, loaded from *docx*. Raises
+    |ValueError| if *package* is not a WordprocessingML package.
+    """
+    document_part = package.main_document_part
+    if document_part.content_type != CT.WML_DOCUMENT_MAIN:
+        tmpl = "file '%s' is not a Word file, content type is '%s'"
+        raise ValueError(tmpl % (docx, document_part.content_type))
+    return document_part
+
+
+def _registered_template(docx):
+    """
+    Return the |DocumentTemplate| for the registered template at path
+    *docx*, reading it if it has not been read yet or its file has changed
+    since. Returns |None| if *docx* is not the path of a registered
+    template.
+    """
+    if not is_string(docx):
+        return None
+    path = os.path.abspath(docx)
+    if path not in _templates:
+        return None
+    cached = _templates[path]
+    if cached is not None and cached[0] is None:
+        return cached[1]
+    is_default = path == os.path.abspath(_default_docx_path())
+    file_key = None if is_default else _file_key(path)
+    if cached is None or cached[0] != file_key:
+        cached = _templates[path] = (file_key, DocumentTemplate(path))
+    return cached[1]
+
+
+register_template(_default_docx_path())
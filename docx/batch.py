@@ -0,0 +1,265 @@
+# encoding: utf-8
+
+"""Apply a function to many documents using a pool of worker processes.
+
+:func:`map_documents` opens each document with :func:`docx.api.Document` in a worker
+process, calls a function with it there, and sends back only the value that function
+returns. Proxy objects like |Paragraph| and |Table| hold references to the XML of the
+document they belong to and cannot be sent between processes, so the function should
+extract plain data, like ``paragraph.text``, and return that.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import multiprocessing
+import pickle
+import traceback as tb
+from collections import deque, namedtuple
+from itertools import islice
+
+from docx.api import Document
+from docx.compat import futures
+
+try:
+    from concurrent.futures.process import BrokenProcessPool
+except ImportError:  # pragma: no cover
+
+    class BrokenProcessPool(RuntimeError):
+        """Stand-in for the exception the Python 2 `futures` backport lacks."""
+
+
+def map_documents(paths, fn, workers=None, ordered=True, chunksize=1,
+                  max_pending=None, progress=None, lazy=False):
+    """Generate a |BatchResult| for each document in *paths* after applying *fn* to it.
+
+    *paths* is any iterable of paths to `.docx` files and is consumed only as fast as
+    results are generated, so it can be a generator over a very large number of files.
+    Each document is opened as ``Document(path, lazy=lazy)`` in one of *workers*
+    worker processes (default one per CPU) and ``fn(document)`` is called there. *fn*
+    must be picklable, which means a function defined at module level, and must return
+    a picklable value.
+
+    An exception raised opening a document or by *fn*, or a value that cannot be
+    pickled, is captured in the result for that path rather than raised, so one bad
+    file does not stop the batch. A worker process that dies, for example killed for
+    running out of memory, fails every document pending in the pool. The pool is then
+    restarted and those documents processed again, and the one whose processing kills
+    its worker process again gets a |BrokenProcessPool| error in its result.
+
+    Results are generated in the order of *paths* when *ordered* is |True|, otherwise
+    as they are completed. Paths are sent to the workers *chunksize* at a time, which
+    cuts the overhead of passing many small jobs between processes. No more than
+    *max_pending* chunks (default twice the number of workers) are submitted ahead of
+    the results generated so far, which bounds memory use however many paths there
+    are. Closing the generator before it is exhausted cancels the chunks not yet
+    started and returns without waiting for the ones running in the workers.
+
+    When *progress* is provided, it is called in this process as ``progress(done,
+    total)`` just before each result is generated, where *done* is the count of results
+    so far and *total* is ``len(paths)``, or |None| when *paths* has no length.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    max_pending = max_pending or 2 * workers
+    total = len(paths) if hasattr(paths, '__len__') else None
+    chunks = _iter_chunks(paths, chunksize)
+    done = 0
+
+    with _ChunkPool(fn, lazy, workers) as pool:
+        # ---jobs for the submitted chunks, in the order they were submitted---
+        pending = deque()
+
+        def submit_chunks():
+            while len(pending) < max_pending:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                pending.append(pool.submit(chunk))
+
+        try:
+            submit_chunks()
+            while pending:
+                if ordered:
+                    job = pending.popleft()
+                else:
+                    completed = futures.wait(
+                        [j.future for j in pending],
+                        return_when=futures.FIRST_COMPLETED,
+                    )[0]
+                    job = next(j for j in pending if j.future in completed)
+                    pending.remove(job)
+                results = pool.results_for(job, pending)
+                submit_chunks()
+                for path, pickled_value, error, traceback in results:
+                    value = (
+                        None if pickled_value is None else pickle.loads(pickled_value)
+                    )
+                    done += 1
+                    if progress is not None:
+                        progress(done, total)
+                    yield BatchResult(path, value, error, traceback)
+        finally:
+            # ---chunks still pending when the generator is closed early, or on
+            #    an error, are not started; ones already running are abandoned---
+            for job in pending:
+                job.future.cancel()
+
+
+class BatchResult(object):
+    """The outcome of applying a function to one document in :func:`map_documents`."""
+
+    def __init__(self, path, value=None, error=None, traceback=None):
+        super(BatchResult, self).__init__()
+        self._path = path
+        self._value = value
+        self._error = error
+        self._traceback = traceback
+
+    @property
+    def error(self):
+        """The exception raised for this document, or |None| if there was none.
+
+        An exception that cannot be sent back from the worker process is replaced by a
+        |RuntimeError| with the same message.
+        """
+        return self._error
+
+    @property
+    def ok(self):
+        """|True| if the document was processed without error."""
+        return self._error is None
+
+    @property
+    def path(self):
+        """The path of the document, as it appeared in the paths passed in."""
+        return self._path
+
+    @property
+    def traceback(self):
+        """The formatted traceback of :attr:`error` as a string, or |None|."""
+        return self._traceback
+
+    @property
+    def value(self):
+        """The value returned by the function, or |None| when :attr:`ok` is |False|."""
+        return self._value
+
+
+class _ChunkPool(object):
+    """Pool of *workers* worker processes applying *fn* to chunks of paths.
+
+    A worker process that dies breaks the pool, which fails every chunk pending in it.
+    The pool is then replaced by a new one and the chunks it failed are processed again.
+    """
+
+    def __init__(self, fn, lazy, workers):
+        super(_ChunkPool, self).__init__()
+        self._fn = fn
+        self._lazy = lazy
+        self._workers = workers
+        self._executor = futures.ProcessPoolExecutor(workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # ---wait for the worker processes only when every chunk is done; when
+        #    the results are abandoned early, don't block on running chunks---
+        self._executor.shutdown(wait=exc_type is None)
+
+    def results_for(self, job, pending):
+        """Return the list of results for the chunk of *job*, once it is complete.
+
+        When the pool broke before *job* completed, each path in its chunk is processed
+        again in a pool of its own, one at a time, so a path that kills its worker
+        process again gets the error on its own. The jobs in *pending* that were failed
+        by the same pool are submitted again to a new pool.
+        """
+        try:
+            return job.future.result()
+        except BrokenProcessPool:
+            if job.executor is self._executor:
+                self._restart()
+            for idx, other_job in enumerate(pending):
+                if self._is_lost(other_job):
+                    pending[idx] = self.submit(other_job.chunk)
+            return [self._process_alone(path) for path in job.chunk]
+
+    def submit(self, chunk):
+        """Return a |_Job| for *chunk*, newly submitted to this pool."""
+        try:
+            future = self._executor.submit(_process_chunk, self._fn, chunk, self._lazy)
+        except BrokenProcessPool:
+            self._restart()
+            future = self._executor.submit(_process_chunk, self._fn, chunk, self._lazy)
+        return _Job(chunk, self._executor, future)
+
+    def _is_lost(self, job):
+        """|True| if *job* was submitted to a pool that broke before it completed."""
+        if job.executor is self._executor:
+            return False
+        return not job.future.done() or job.future.exception() is not None
+
+    def _process_alone(self, path):
+        """Return the result for *path* processed in a pool of its own."""
+        executor = futures.ProcessPoolExecutor(1)
+        try:
+            future = executor.submit(_process_chunk, self._fn, [path], self._lazy)
+            return future.result()[0]
+        except BrokenProcessPool as e:
+            return (path, None, e, tb.format_exc())
+        finally:
+            executor.shutdown()
+
+    def _restart(self):
+        """Replace the broken executor of this pool by a new one."""
+        self._executor.shutdown(wait=False)
+        self._executor = futures.ProcessPoolExecutor(self._workers)
+
+
+# ---a chunk of paths, the executor it was submitted to and its future---
+_Job = namedtuple('_Job', ('chunk', 'executor', 'future'))
+
+
+def _iter_chunks(paths, chunksize):
+    """Generate lists of up to *chunksize* consecutive items from iterable *paths*."""
+    paths = iter(paths)
+    while True:
+        chunk = list(islice(paths, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _process_chunk(fn, paths, lazy):
+    """Return a list of `(path, pickled_value, error, traceback)` tuples for *paths*.
+
+    Runs in a worker process. The value returned by *fn* is pickled here so a value
+    that cannot be pickled is reported as the error for its document rather than
+    failing the whole chunk.
+    """
+    results = []
+    for path in paths:
+        try:
+            value = fn(Document(path, lazy=lazy))
+            try:
+                pickled_value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                raise TypeError(
+                    "%s returned %r, which cannot be sent back from a worker process"
+                    " (%s); return plain data, e.g. paragraph.text rather than the"
+                    " paragraph" % (getattr(fn, '__name__', fn), value, e)
+                )
+        except Exception as e:
+            results.append((path, None, _picklable(e), tb.format_exc()))
+        else:
+            results.append((path, pickled_value, None, None))
+    return results
+
+
+def _picklable(exception):
+    """Return *exception*, or a |RuntimeError| like it if it cannot be pickled."""
+    try:
+        pickle.loads(pickle.dumps(exception))
+    except Exception:
+        return RuntimeError("%s: %s" % (type(exception).__name__, exception))
+    return exception
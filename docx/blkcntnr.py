@@ -8,8 +8,9 @@ specialized ones like structured document tags.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docx.oxml.ns import qn
 from docx.oxml.table import CT_Tbl
-from docx.shared import Parented
+from docx.shared import cached_proxy, Parented, proxies_for, proxy_cache, proxy_for
 from docx.text.paragraph import Paragraph
 
 
@@ -48,7 +49,74 @@ class BlockItemContainer(Parented):
         from .table import Table
         tbl = CT_Tbl.new_tbl(rows, cols, width)
         self._element._insert_tbl(tbl)
-        return Table(tbl, self)
+        return proxy_for(Table, tbl, self)
+
+    def add_table_from_rows(self, rows, width, style=None, header=None):
+        """
+        Return a table of *width* newly appended to the content in this
+        container, having a row for each sequence of cell values in *rows*.
+        The XML for the whole table is generated in a single pass, so this is
+        much faster than adding an empty table and assigning the text of each
+        cell. *rows* can be any iterable, including a generator. Each value
+        is converted to text like `str()` does, except that |None| becomes
+        an empty cell.
+
+        When *header* is a sequence of column headings, it is added as the
+        first row, which Word repeats at the top of each page the table
+        spans. The column count is the length of *header*, or of the first
+        row when *header* is |None|. Rows shorter than that are padded with
+        empty cells; a longer row raises |ValueError|. *width* is evenly
+        distributed between the table columns and table style *style* is
+        applied when it is not |None|.
+        """
+        from .table import Table
+        tbl = CT_Tbl.new_tbl_from_rows(rows, width, header)
+        self._element._insert_tbl(tbl)
+        table = proxy_for(Table, tbl, self)
+        if style is not None:
+            table.style = style
+        return table
+
+    def iter_inner_content(self, recursive=False):
+        """
+        Generate a |Paragraph| or |Table| object for each paragraph and
+        table in this container, in document order. Proxies are created one
+        at a time as the generator advances, so walking the content is
+        a single pass however long it is, and stopping early costs nothing
+        for the content not reached.
+
+        When *recursive* is |True|, the content of each cell of a table, in
+        row order, is generated right after the table itself, descending
+        into nested tables in the same way. The content should not be added
+        to or removed from while it is being iterated.
+        """
+        from .table import Table, _Cell
+        p_tag, tbl_tag = qn('w:p'), qn('w:tbl')
+        cache = proxy_cache(self)
+        for child in self._element.iterchildren(p_tag, tbl_tag):
+            if child.tag == p_tag:
+                yield cached_proxy(cache, Paragraph, child, self)
+                continue
+            table = cached_proxy(cache, Table, child, self)
+            yield table
+            if not recursive:
+                continue
+            for tr in child.tr_lst:
+                for tc in tr.tc_lst:
+                    cell = cached_proxy(cache, _Cell, tc, table)
+                    for item in cell.iter_inner_content(True):
+                        yield item
+
+    def iter_paragraph_text(self, recursive=False):
+        """
+        Generate the text of each paragraph in this container, in document
+        order, as :attr:`.Paragraph.text` reports it. No proxy objects are
+        created, so this is the fastest way to read the text of a large
+        container. When *recursive* is |True|, the paragraphs in table cells
+        are included, in the order :meth:`iter_inner_content` generates
+        them.
+        """
+        return _iter_paragraph_text(self._element, recursive)
 
     @property
     def paragraphs(self):
@@ -56,7 +124,7 @@ class BlockItemContainer(Parented):
         A list containing the paragraphs in this container, in document
         order. Read-only.
         """
-        return [Paragraph(p, self) for p in self._element.p_lst]
+        return proxies_for(Paragraph, self._element.p_lst, self)
 
     @property
     def tables(self):
@@ -65,11 +133,29 @@ class BlockItemContainer(Parented):
         Read-only.
         """
         from .table import Table
-        return [Table(tbl, self) for tbl in self._element.tbl_lst]
+        return proxies_for(Table, self._element.tbl_lst, self)
 
     def _add_paragraph(self):
         """
         Return a paragraph newly added to the end of the content in this
         container.
         """
-        return Paragraph(self._element.add_p(), self)
+        return proxy_for(Paragraph, self._element.add_p(), self)
+
+
+def _iter_paragraph_text(element, recursive):
+    """
+    Generate the text of each `w:p` child of *element*, and when *recursive*
+    is |True|, of each paragraph in the cells of each `w:tbl` child.
+    """
+    p_tag, tbl_tag = qn('w:p'), qn('w:tbl')
+    for child in element.iterchildren(p_tag, tbl_tag):
+        if child.tag == p_tag:
+            yield child.text
+            continue
+        if not recursive:
+            continue
+        for tr in child.tr_lst:
+            for tc in tr.tc_lst:
+                for text in _iter_paragraph_text(tc, True):
+                    yield text
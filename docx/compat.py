@@ -41,3 +41,15 @@ else:
         return isinstance(obj, basestring)
 
     Unicode = unicode
+
+# ===========================================================================
+# Optional standard library modules
+# ===========================================================================
+
+# ---`concurrent.futures` is in the standard library on Python 3; Python 2 has
+#    it only when the `futures` backport is installed, which the `workers`
+#    options require---
+try:
+    from concurrent import futures
+except ImportError:  # pragma: no cover
+    futures = None
@@ -8,7 +8,7 @@ from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
 from docx.section import Section, Sections
-from docx.shared import ElementProxy, Emu
+from docx.shared import ElementProxy, Emu, proxy_for
 
 
 class Document(ElementProxy):
@@ -80,7 +80,7 @@ class Document(ElementProxy):
         """
         new_sectPr = self._element.body.add_section_break()
         new_sectPr.start_type = start_type
-        return Section(new_sectPr, self._part)
+        return proxy_for(Section, new_sectPr, self._part)
 
     def add_table(self, rows, cols, style=None):
         """
@@ -93,6 +93,38 @@ class Document(ElementProxy):
         table.style = style
         return table
 
+    def add_table_from_rows(self, rows, style=None, header=None):
+        """
+        Add a table having a row for each sequence of cell values in *rows*
+        and table style of *style*, generating the XML for all its rows in
+        a single pass. *header* is an optional sequence of column headings
+        added as a repeating header row. See
+        :meth:`.BlockItemContainer.add_table_from_rows` for details.
+        """
+        return self._body.add_table_from_rows(
+            rows, self._block_width, style, header
+        )
+
+    @property
+    def cache_proxies(self):
+        """
+        Read/write boolean, |True| when proxy objects are reused. |False| by
+        default, which creates a new |Paragraph|, |Run|, |Table|, |_Row|,
+        |_Cell| or |Section| object each time one is asked for, as by
+        ``paragraph.runs`` or ``document.paragraphs``.
+
+        When |True|, asking the same parent object again for an element whose
+        proxy object is still referenced somewhere returns that same object,
+        which saves allocating objects in loops over a large document and lets
+        a |Table| reuse its cell layout. Objects no longer referenced are freed
+        as usual.
+        """
+        return self._part.package.cache_proxies
+
+    @cache_proxies.setter
+    def cache_proxies(self, value):
+        self._part.package.cache_proxies = bool(value)
+
     @property
     def core_properties(self):
         """
@@ -111,6 +143,26 @@ class Document(ElementProxy):
         """
         return self._part.inline_shapes
 
+    def iter_inner_content(self, recursive=False):
+        """
+        Generate a |Paragraph| or |Table| object for each paragraph and
+        table in the body of this document, in document order. Unlike
+        :attr:`paragraphs` and :attr:`tables`, no list is built, so this is
+        the way to walk a long document. When *recursive* is |True|, the
+        content of each table cell is generated right after its table. See
+        :meth:`.BlockItemContainer.iter_inner_content` for details.
+        """
+        return self._body.iter_inner_content(recursive)
+
+    def iter_paragraph_text(self, recursive=False):
+        """
+        Generate the text of each paragraph in the body of this document, in
+        document order, without creating a |Paragraph| object for each. When
+        *recursive* is |True|, the text of the paragraphs in table cells is
+        included. See :meth:`.BlockItemContainer.iter_paragraph_text`.
+        """
+        return self._body.iter_paragraph_text(recursive)
+
     @property
     def paragraphs(self):
         """
@@ -127,12 +179,45 @@ class Document(ElementProxy):
         """
         return self._part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, compression=None, workers=None,
+             incremental=False):
         """
         Save this document to *path_or_stream*, which can be either a path to
         a filesystem location (a string) or a file-like object.
+
+        *compression* is an optional zlib compression level from 0 to 9. The
+        default level is used when it is |None|. Lower levels save faster
+        and produce larger files; 0 stores every part uncompressed. When
+        a level is given, JPEG, PNG and GIF images, which are already
+        compressed, are stored as they are rather than deflated again. Parts
+        copied to the new package in their compressed form, as described
+        below for a document opened with ``lazy=True``, keep the compression
+        they were read with whatever *compression* is.
+
+        When *workers* is an int, the parts of the document are serialized
+        and compressed by a pool of that many threads before being written
+        to the package in the usual order. This shortens saving a document
+        with many large parts, like headers, footers and images, on
+        a multi-core machine. On Python 2 it requires the ``futures``
+        backport of :mod:`concurrent.futures`, and |RuntimeError| is raised
+        without it. Only a few parts per thread are compressed ahead of the
+        one being written, so memory use does not grow with the number of
+        parts.
+
+        When *incremental* is |True| and the document was opened with
+        ``lazy=True``, each part whose XML was read but serializes to the
+        same bytes it was read from is copied to the new package in its
+        compressed form, like the parts that were never read, rather than
+        being compressed again. Only parts that actually changed are
+        compressed, which makes stamping metadata like the core properties
+        onto a large document much faster. A document saved by |docx| always
+        serializes the same way, while one last saved by Word generally
+        does not, so the benefit comes from the second save onward in that
+        case. When saving back to the path the document was opened from,
+        the bytes a part was read from are not kept once its XML is read, so
+        only the parts never read are copied.
         """
-        self._part.save(path_or_stream)
+        self._part.save(path_or_stream, compression, workers, incremental)
 
     @property
     def sections(self):
@@ -191,22 +191,24 @@ class XmlEnumeration(Enumeration):
         Return the enumeration member corresponding to the XML value
         *xml_val*.
         """
-        if xml_val not in cls._xml_to_member:
+        try:
+            return cls._xml_to_member[xml_val]
+        except KeyError:
             raise InvalidXmlError(
                 "attribute value '%s' not valid for this type" % xml_val
             )
-        return cls._xml_to_member[xml_val]
 
     @classmethod
     def to_xml(cls, enum_val):
         """
         Return the XML value of the enumeration value *enum_val*.
         """
-        if enum_val not in cls._member_to_xml:
+        try:
+            return cls._member_to_xml[enum_val]
+        except KeyError:
             raise ValueError(
                 "value '%s' not in enumeration %s" % (enum_val, cls.__name__)
             )
-        return cls._member_to_xml[enum_val]
 
 
 class EnumMember(object):
@@ -0,0 +1,87 @@
+# encoding: utf-8
+
+"""Read-only fast path for extracting the text of a document.
+
+:func:`iter_text` streams story parts through `lxml.etree.iterparse()` rather than
+loading the package and building the full tree of custom element classes that
+|Document| provides. Elements are discarded as soon as their text has been read, so
+memory use does not grow with the size of the document.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from lxml import etree
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PACKAGE_URI
+from docx.opc.phys_pkg import PhysPkgReader
+from docx.opc.pkgreader import PackageReader
+from docx.oxml.ns import qn
+from docx.oxml.text.paragraph import paragraph_text
+
+_P = qn('w:p')
+_TBL = qn('w:tbl')
+
+# ---parents of the paragraphs reported by the proxy API, e.g. `Document.paragraphs`
+#    and `_Cell.paragraphs`---
+_BLOCK_CONTAINER_TAGS = frozenset(
+    (qn('w:body'), qn('w:tc'), qn('w:hdr'), qn('w:ftr'))
+)
+
+
+def iter_text(docx, include_headers_footers=False):
+    """Generate the text of each paragraph in *docx*, in document order.
+
+    *docx* is a path to a `.docx` file (a string) or a file-like object. Paragraphs in
+    table cells are included where they appear in the body. When
+    *include_headers_footers* is |True|, the paragraphs of each header and footer part
+    are generated after those of the body.
+
+    The text of each paragraph is the same as its |Paragraph| object reports, with
+    ``<w:tab/>`` mapped to ``\\t`` and ``<w:br/>`` and ``<w:cr/>`` mapped to ``\\n``.
+    """
+    phys_reader = PhysPkgReader(docx)
+    try:
+        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+        document_partname = _target_partname(pkg_srels, RT.OFFICE_DOCUMENT)
+        story_partnames = [document_partname]
+        if include_headers_footers:
+            document_srels = PackageReader._srels_for(phys_reader, document_partname)
+            story_partnames.extend(
+                srel.target_partname for srel in document_srels
+                if srel.reltype in (RT.HEADER, RT.FOOTER) and not srel.is_external
+            )
+        for partname in story_partnames:
+            stream = phys_reader.open(partname)
+            try:
+                for text in _iter_story_text(stream):
+                    yield text
+            finally:
+                stream.close()
+    finally:
+        phys_reader.close()
+
+
+def _iter_story_text(stream):
+    """Generate the text of each block-level paragraph in the story XML in *stream*."""
+    events = etree.iterparse(
+        stream, events=('end',), tag=(_P, _TBL), resolve_entities=False
+    )
+    for _, elm in events:
+        parent = elm.getparent()
+        if parent.tag not in _BLOCK_CONTAINER_TAGS:
+            continue
+        if elm.tag == _P:
+            yield paragraph_text(elm)
+        # ---free this block and the already-processed siblings before it---
+        elm.clear()
+        while elm.getprevious() is not None:
+            del parent[0]
+
+
+def _target_partname(srels, reltype):
+    """Return partname targeted by the single relationship of *reltype* in *srels*."""
+    for srel in srels:
+        if srel.reltype == reltype and not srel.is_external:
+            return srel.target_partname
+    raise KeyError("no relationship of type '%s' in package" % reltype)
@@ -11,6 +11,7 @@ from __future__ import (
 
 from docx.image.bmp import Bmp
 from docx.image.gif import Gif
+from docx.image.image import probe  # noqa
 from docx.image.jpeg import Exif, Jfif
 from docx.image.png import Png
 from docx.image.tiff import Tiff
@@ -110,6 +110,7 @@ class PNG_CHUNK_TYPE(object):
     """
     IHDR = 'IHDR'
     pHYs = 'pHYs'
+    IDAT = 'IDAT'
     IEND = 'IEND'
 
 
@@ -9,22 +9,29 @@ from __future__ import absolute_import, division, print_function
 
 import hashlib
 import os
+from functools import partial
 
 from ..compat import BytesIO, is_string
 from .exceptions import UnrecognizedImageError
 from ..shared import Emu, Inches, lazyproperty
 
+# ---size of the reads used to hash an image file without loading it whole---
+_CHUNK_SIZE = 64 * 1024
+
 
 class Image(object):
     """
     Graphical image stream such as JPEG, PNG, or GIF with properties and
     methods required by ImagePart.
     """
-    def __init__(self, blob, filename, image_header):
+    def __init__(self, blob, filename, image_header, path=None,
+                 load_blob=None):
         super(Image, self).__init__()
         self._blob = blob
         self._filename = filename
         self._image_header = image_header
+        self._path = path
+        self._load_blob = load_blob
 
     @classmethod
     def from_blob(cls, blob):
@@ -35,12 +42,29 @@ class Image(object):
         stream = BytesIO(blob)
         return cls._from_stream(stream, blob)
 
+    @classmethod
+    def from_view(cls, view, load_blob):
+        """
+        Return a new |Image| instance characterized from the image binary in
+        *view*, a memoryview or other buffer, which is read in place rather
+        than copied. The image does not keep *view*, so it can be released
+        once this returns; the image bytes are got by calling *load_blob*
+        when they are needed.
+        """
+        image_header = _ImageHeaderFactory(_BufferStream(view))
+        filename = 'image.%s' % image_header.default_ext
+        return cls(None, filename, image_header, load_blob=load_blob)
+
     @classmethod
     def from_file(cls, image_descriptor):
         """
         Return a new |Image| subclass instance loaded from the image file
-        identified by *image_descriptor*, a path or file-like object.
+        identified by *image_descriptor*, a path or file-like object. An
+        |Image| instance, such as :func:`probe` returns, is returned
+        unchanged.
         """
+        if isinstance(image_descriptor, Image):
+            return image_descriptor
         if is_string(image_descriptor):
             path = image_descriptor
             with open(path, 'rb') as f:
@@ -57,8 +81,16 @@ class Image(object):
     @property
     def blob(self):
         """
-        The bytes of the image 'file'
+        The bytes of the image 'file'. For an image characterized with
+        :func:`probe` or :meth:`from_view`, the bytes are read from the image
+        file or got from *load_blob* on each access rather than being held
+        in memory.
         """
+        if self._blob is None:
+            if self._load_blob is not None:
+                return self._load_blob()
+            with open(self._path, 'rb') as f:
+                return f.read()
         return self._blob
 
     @property
@@ -163,9 +195,16 @@ class Image(object):
     @lazyproperty
     def sha1(self):
         """
-        SHA1 hash digest of the image blob
+        SHA1 hash digest of the image blob. The image file of an image
+        characterized with :func:`probe` is hashed in chunks as it is read.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        if self._blob is not None or self._load_blob is not None:
+            return hashlib.sha1(self.blob).hexdigest()
+        sha1 = hashlib.sha1()
+        with open(self._path, 'rb') as f:
+            for chunk in iter(partial(f.read, _CHUNK_SIZE), b''):
+                sha1.update(chunk)
+        return sha1.hexdigest()
 
     @classmethod
     def _from_stream(cls, stream, blob, filename=None):
@@ -179,6 +218,53 @@ class Image(object):
         return cls(blob, filename, image_header)
 
 
+def probe(path):
+    """
+    Return an |Image| instance characterizing the image file at *path*,
+    reading only as much of the file as its header parser needs to determine
+    the content type, pixel dimensions and dpi of the image. The image bytes
+    are not loaded; they are read from the file when the image blob is
+    needed, for example when the document containing the image is saved, so
+    the file must not be removed or changed before then.
+    """
+    with open(path, 'rb') as f:
+        image_header = _ImageHeaderFactory(f)
+    return Image(None, os.path.basename(path), image_header, path)
+
+
+class _BufferStream(object):
+    """
+    Read-only, seekable file-like object over *buffer*, such as
+    a memoryview. Only the bytes asked for by each read are copied, which
+    for an image header parser is a few hundred bytes at most.
+    """
+    def __init__(self, buffer):
+        super(_BufferStream, self).__init__()
+        self._buffer = buffer
+        self._size = len(buffer)
+        self._pos = 0
+
+    def read(self, size=-1):
+        start = min(self._pos, self._size)
+        end = self._size if size is None or size < 0 else start + size
+        end = min(end, self._size)
+        self._pos = end
+        chunk = self._buffer[start:end]
+        return chunk.tobytes() if isinstance(chunk, memoryview) else chunk
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        base = (
+            0 if whence == os.SEEK_SET else
+            self._pos if whence == os.SEEK_CUR else
+            self._size
+        )
+        self._pos = max(base + offset, 0)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+
 def _ImageHeaderFactory(stream):
     """
     Return a |BaseImageHeader| subclass instance that knows how to parse the
@@ -29,6 +29,13 @@ if sys.version_info >= (3, 0):
         """
         return isinstance(obj, str)
 
+    def release_view(view):
+        """
+        Release memoryview *view*, so the buffer it is over, such as a file
+        mapped into memory, is no longer held by it.
+        """
+        view.release()
+
 # ===========================================================================
 # Python 2 versions
 # ===========================================================================
@@ -48,3 +55,10 @@ else:
         Return True if *obj* is a string, False otherwise.
         """
         return isinstance(obj, basestring)
+
+    def release_view(view):
+        """
+        Do nothing; a memoryview cannot be released on Python 2, where it is
+        never over a file mapped into memory.
+        """
+        pass
@@ -57,6 +57,17 @@ def serialize_part_xml(part_elm):
     return etree.tostring(part_elm, encoding='UTF-8', standalone=True)
 
 
+def write_part_xml(part_elm, stream):
+    """
+    Write *part_elm* etree element to writable file-like *stream* as the same
+    XML :func:`serialize_part_xml` produces. The XML is written in chunks as
+    it is serialized, so it is never held in memory as a single string.
+    """
+    with etree.xmlfile(stream, encoding='UTF-8') as xf:
+        xf.write_declaration(standalone=True)
+        xf.write(part_elm)
+
+
 def serialize_for_reading(element):
     """
     Serialize *element* to human-readable XML suitable for tests. No XML
@@ -4,6 +4,9 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from itertools import chain
+
+from docx.compat import futures
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.part import PartFactory
@@ -33,6 +36,30 @@ class OpcPackage(object):
         # subclass
         pass
 
+    def clone(self):
+        """
+        Return a new package of the same class as this one, holding a copy of
+        each of its parts related to one another as the parts of this package
+        are. Parts that have not changed since they were loaded share their
+        source with the copy, so their bytes are not read and their XML is
+        not copied until first used in the new package.
+        """
+        package = type(self)()
+        parts = dict((part, part.clone(package)) for part in self.iter_parts())
+        for source, source_clone in chain(((self, package),), parts.items()):
+            for rel in source.rels.values():
+                target = (
+                    rel.target_ref if rel.is_external
+                    else parts[rel.target_part]
+                )
+                source_clone.load_rel(
+                    rel.reltype, target, rel.rId, rel.is_external
+                )
+        for part in parts.values():
+            part.after_unmarshal()
+        package.after_unmarshal()
+        return package
+
     @property
     def core_properties(self):
         """
@@ -41,6 +68,18 @@ class OpcPackage(object):
         """
         return self._core_properties_part.core_properties
 
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Return a new |OpcPackage| instance unmarshalled from *snapshot*, a
+        |PackageSnapshot| object. No package file is read; the XML of each
+        part is copied from the snapshot when the part is first accessed, so
+        the packages created from one snapshot are independent of each other.
+        """
+        package = cls()
+        Unmarshaller.unmarshal(snapshot, package, PartFactory)
+        return package
+
     def iter_rels(self):
         """
         Generate exactly one reference to each relationship in the package by
@@ -120,14 +159,25 @@ class OpcPackage(object):
                 return PackURI(candidate_partname)
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, lazy=False, workers=None):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
-        """
-        pkg_reader = PackageReader.from_file(pkg_file)
+        *pkg_file*. When *lazy* is |True|, *pkg_file* is left open and the
+        bytes of each part are read (and XML parts parsed) only on first
+        access. Otherwise, when *workers* is an int, parts are decompressed
+        and parsed by a pool of that many threads, which requires
+        :mod:`concurrent.futures`; |RuntimeError| is raised without it.
+        """
+        if lazy:
+            workers = None
+        if workers is not None and futures is None:
+            raise RuntimeError(
+                'opening with workers requires concurrent.futures, which on '
+                'Python 2 is provided by the futures backport'
+            )
+        pkg_reader = PackageReader.from_file(pkg_file, lazy, workers)
         package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        Unmarshaller.unmarshal(pkg_reader, package, PartFactory, workers)
         return package
 
     def part_related_by(self, reltype):
@@ -162,14 +212,32 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, compression=None, workers=None,
+             incremental=False):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a file-like object. *compression* is an optional
+        zlib compression level from 0 to 9, as described for
+        |PhysPkgWriter|. When *workers* is an int, parts are serialized and
+        compressed by a pool of that many threads.
+
+        Parts of a lazily opened package that have not been changed are
+        copied to *pkg_file* in their compressed form. When *pkg_file* is the
+        package file the document was opened from, those parts are read into
+        memory first so the file can be safely overwritten, while parts whose
+        XML was parsed just drop their source. When *incremental* is |True|,
+        a part whose XML was parsed but serializes to the bytes it was read
+        from is also copied in compressed form, and the compressed form of
+        each unparsed part is read into memory along with its bytes when
+        overwriting the package file it was read from.
         """
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+            if part.source is not None and part.source.reads_from(pkg_file):
+                part.load_blob(keep_raw=incremental)
+        PackageWriter.write(
+            pkg_file, self.rels, self.parts, compression, workers, incremental
+        )
 
     @property
     def _core_properties_part(self):
@@ -189,14 +257,20 @@ class Unmarshaller(object):
     """Hosts static methods for unmarshalling a package from a |PackageReader|."""
 
     @staticmethod
-    def unmarshal(pkg_reader, package, part_factory):
+    def unmarshal(pkg_reader, package, part_factory, workers=None):
         """
         Construct graph of parts and realized relationships based on the
         contents of *pkg_reader*, delegating construction of each part to
-        *part_factory*. Package relationships are added to *pkg*.
-        """
-        parts = Unmarshaller._unmarshal_parts(
-            pkg_reader, package, part_factory
+        *part_factory*. Package relationships are added to *pkg*. When
+        *workers* is an int, parts are constructed by a pool of that many
+        threads.
+        """
+        parts = (
+            Unmarshaller._unmarshal_parts(pkg_reader, package, part_factory)
+            if workers is None else
+            Unmarshaller._unmarshal_parts_concurrently(
+                pkg_reader, package, part_factory, workers
+            )
         )
         Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
         for part in parts.values():
@@ -217,6 +291,31 @@ class Unmarshaller(object):
             )
         return parts
 
+    @staticmethod
+    def _unmarshal_parts_concurrently(pkg_reader, package, part_factory,
+                                      workers):
+        """
+        Return a dictionary of |Part| instances unmarshalled from
+        *pkg_reader* as :meth:`_unmarshal_parts` does, using a pool of
+        *workers* threads to construct the parts. lxml releases the GIL while
+        parsing, so the XML of the parts is parsed in parallel on a
+        multi-core machine. The dictionary is filled in the same order
+        :meth:`_unmarshal_parts` fills it, whatever order the threads finish
+        in.
+        """
+        def load_part(spart):
+            partname, content_type, reltype, blob = spart
+            return part_factory(
+                partname, content_type, reltype, blob, package
+            )
+
+        sparts = list(pkg_reader.iter_sparts())
+        with futures.ThreadPoolExecutor(workers) as executor:
+            loaded_parts = executor.map(load_part, sparts)
+            return dict(
+                (spart[0], part) for spart, part in zip(sparts, loaded_parts)
+            )
+
     @staticmethod
     def _unmarshal_relationships(pkg_reader, package, parts):
         """
@@ -9,9 +9,10 @@ from __future__ import (
 )
 
 from .compat import cls_method_fn
-from .oxml import serialize_part_xml
+from .oxml import serialize_part_xml, write_part_xml
 from ..oxml import parse_xml
 from .packuri import PackURI
+from .pkgreader import DeferredBlob, SnapshotBlob
 from .rel import Relationships
 from .shared import lazyproperty
 
@@ -26,7 +27,9 @@ class Part(object):
         super(Part, self).__init__()
         self._partname = partname
         self._content_type = content_type
-        self._blob = blob
+        self._blob, self._source = (
+            (None, blob) if isinstance(blob, DeferredBlob) else (blob, None)
+        )
         self._package = package
 
     def after_unmarshal(self):
@@ -54,10 +57,24 @@ class Part(object):
         """
         Contents of this package part as a sequence of bytes. May be text or
         binary. Intended to be overridden by subclasses. Default behavior is
-        to return load blob.
+        to return load blob, reading it from the package file on first
+        access when the package was opened lazily.
         """
+        if self._blob is None and self._source is not None:
+            self._blob = self._source.read()
         return self._blob
 
+    def clone(self, package):
+        """
+        Return a new part of the same class as this one, belonging to
+        *package* and having the same partname, content type and content.
+        Relationships are not copied. A part that has not changed since it
+        was loaded shares its source with the new part, so nothing is copied
+        until the new part is first accessed.
+        """
+        blob = self.blob if self.is_dirty else self._source
+        return self.load(self._partname, self._content_type, blob, package)
+
     @property
     def content_type(self):
         """
@@ -65,6 +82,16 @@ class Part(object):
         """
         return self._content_type
 
+    @property
+    def is_dirty(self):
+        """
+        |True| if this part must be serialized on save. |False| only for a
+        part lazily loaded from a package that is still open and whose
+        content cannot have changed since, which allows its compressed bytes
+        to be copied to the new package verbatim.
+        """
+        return self._source is None
+
     def drop_rel(self, rId):
         """
         Remove the relationship identified by *rId* if its reference count
@@ -78,6 +105,27 @@ class Part(object):
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
 
+    def load_blob(self, keep_raw=False):
+        """
+        Read the bytes of this part into memory if they are still deferred,
+        which is only the case when the package was opened with
+        ``lazy=True``. Afterward the part no longer depends on the package
+        file it was loaded from. Does nothing otherwise.
+
+        When *keep_raw* is |True|, the compressed form of the part is read
+        into memory too and the part keeps an in-memory source, so it can
+        still be copied to a new package without being compressed again.
+        """
+        if self._source is None:
+            return
+        if keep_raw:
+            source = self._source
+            self._source = SnapshotBlob(source.read(), source.read_raw())
+            return
+        if self._blob is None:
+            self._blob = self._source.read()
+        self._source = None
+
     def load_rel(self, reltype, target, rId, is_external=False):
         """
         Return newly added |_Relationship| instance of *reltype* between this
@@ -89,6 +137,23 @@ class Part(object):
         """
         return self.rels.add_relationship(reltype, target, rId, is_external)
 
+    def map_blob(self):
+        """
+        Return a read-only memoryview over the bytes of this part. When the
+        package was opened lazily and this part has not been read or
+        changed, and is in an expanded package or stored without compression
+        in a zip file, the view is over the package file mapped into memory
+        rather than over a copy of its bytes.
+
+        The caller must call ``release()`` on the view, or use it in a `with`
+        statement, once done with it and in any case before the package file
+        is overwritten, for example by saving the document over it, and must
+        not keep it in an object that may outlive the package file.
+        """
+        if self._blob is None and not self.is_dirty:
+            return self._source.view()
+        return memoryview(self.blob)
+
     @property
     def package(self):
         """
@@ -147,6 +212,15 @@ class Part(object):
         """
         return Relationships(self._partname.baseURI)
 
+    @property
+    def source(self):
+        """
+        |DeferredBlob| for the package member this part was lazily loaded
+        from, or |None| if the part was not lazily loaded or has since been
+        detached from its package file by :meth:`load_blob`.
+        """
+        return self._source
+
     def target_ref(self, rId):
         """
         Return URL contained in target ref of relationship identified by
@@ -217,6 +291,9 @@ class XmlPart(Part):
 
     @property
     def blob(self):
+        if self._root is None and self._is_unparsed:
+            # ---never parsed, so the source bytes are still current---
+            return super(XmlPart, self).blob
         return serialize_part_xml(self._element)
 
     @property
@@ -228,9 +305,39 @@ class XmlPart(Part):
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
+        """
+        Return an instance of this part class loaded from *blob*. When *blob*
+        is a |DeferredBlob|, parsing is put off until the element is first
+        accessed.
+        """
+        if isinstance(blob, DeferredBlob):
+            part = cls(partname, content_type, None, package)
+            part._source = blob
+            return part
         element = parse_xml(blob)
         return cls(partname, content_type, element, package)
 
+    @property
+    def is_dirty(self):
+        """
+        |True| unless this part was lazily loaded and its XML has never been
+        parsed. Once parsed, the element tree may have been changed in ways
+        that cannot be cheaply detected, so the part is always reserialized.
+        """
+        return self._root is not None or self._source is None
+
+    def load_blob(self, keep_raw=False):
+        """
+        Detach this part from the package file it was lazily loaded from, as
+        :meth:`.Part.load_blob` does. A part whose XML has been parsed is
+        serialized from its element from then on, so its source is just
+        dropped rather than read into memory, whatever *keep_raw* is.
+        """
+        if self._root is not None:
+            self._source = None
+            return
+        super(XmlPart, self).load_blob(keep_raw)
+
     @property
     def part(self):
         """
@@ -239,3 +346,43 @@ class XmlPart(Part):
         chain of delegation ends here for child objects.
         """
         return self
+
+    def write_blob(self, stream):
+        """
+        Write the bytes :attr:`blob` provides to writable file-like *stream*.
+        The XML of a parsed part is serialized straight into *stream* rather
+        than first into a bytes object holding the whole part.
+        """
+        if self._root is None and self._is_unparsed:
+            stream.write(super(XmlPart, self).blob)
+            return
+        write_part_xml(self._element, stream)
+
+    @property
+    def _element(self):
+        """
+        Root element of this part, parsed from its deferred blob on first
+        access when the package was opened lazily. A part unmarshalled from
+        a |PackageSnapshot| gets a copy of the element the snapshot parsed.
+        """
+        if self._root is None and self._is_unparsed:
+            source = self._source
+            self._root = (
+                source.copy_element()
+                if self._blob is None and isinstance(source, SnapshotBlob)
+                else parse_xml(super(XmlPart, self).blob)
+            )
+            self._blob = None
+        return self._root
+
+    @_element.setter
+    def _element(self, element):
+        self._root = element
+
+    @property
+    def _is_unparsed(self):
+        """
+        |True| if this part still holds (or defers) the source bytes of its
+        XML rather than a parsed element.
+        """
+        return self._blob is not None or self._source is not None
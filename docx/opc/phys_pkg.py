@@ -6,15 +6,40 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+import mmap
 import os
+import struct
+import sys
+import threading
+import time
+import zlib
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from io import BytesIO
+from numbers import Integral
+from zipfile import (
+    BadZipfile, ZipFile, ZipInfo, is_zipfile, ZIP_DEFLATED, ZIP_STORED
+)
 
 from .compat import is_string
 from .exceptions import PackageNotFoundError
 from .packuri import CONTENT_TYPES_URI
 
 
+# ---signature, size and layout of the fixed part of a zip local file header---
+_LOCAL_FILE_HEADER_SIGNATURE = b'PK\x03\x04'
+_LOCAL_FILE_HEADER_SIZE = 30
+_LOCAL_FILE_HEADER_FORMAT = '<4s2B4HL2L2H'
+# ---general-purpose flag bit that marks a trailing data descriptor---
+_DATA_DESCRIPTOR_FLAG = 0x08
+# ---bytes of a member written through `_ZipPkgWriter.open()` held in memory
+#    before it is taken to be large and streamed with ZIP64 extensions---
+_MEMBER_BUFFER_SIZE = 16 * 1024 * 1024
+# ---extensions of members whose content is already compressed; like the
+#    `zip -n` suffix list, these are stored rather than deflated again when
+#    a compression level is specified---
+_PRECOMPRESSED_EXTS = frozenset(('gif', 'jpeg', 'jpg', 'png'))
+
+
 class PhysPkgReader(object):
     """
     Factory for physical package reader objects.
@@ -38,9 +63,11 @@ class PhysPkgReader(object):
 
 class PhysPkgWriter(object):
     """
-    Factory for physical package writer objects.
+    Factory for physical package writer objects. *compression* is an
+    optional zlib compression level from 0 to 9; the zlib default level is
+    used when it is |None|.
     """
-    def __new__(cls, pkg_file):
+    def __new__(cls, pkg_file, compression=None):
         return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
 
 
@@ -55,6 +82,10 @@ class _DirPkgReader(PhysPkgReader):
         """
         super(_DirPkgReader, self).__init__()
         self._path = os.path.abspath(path)
+        # ---membername -> view over that file mapped into memory, or |None|
+        #    when it cannot be mapped; each file is mapped at most once---
+        self._mappings = {}
+        self._lock = threading.Lock()
 
     def blob_for(self, pack_uri):
         """
@@ -66,12 +97,44 @@ class _DirPkgReader(PhysPkgReader):
             blob = f.read()
         return blob
 
+    def open(self, pack_uri):
+        """
+        Return a readable binary file object for the file corresponding to
+        *pack_uri* in the package directory.
+        """
+        return open(os.path.join(self._path, pack_uri.membername), 'rb')
+
+    def raw_member_for(self, pack_uri):
+        """
+        Return |None|. Files in an expanded package are not compressed, so
+        there is no compressed form of a member to copy.
+        """
+        return None
+
+    def raw_view_for(self, pack_uri):
+        """
+        Return |None|, as :meth:`raw_member_for` does.
+        """
+        return None
+
+    def reads_from(self, pkg_file):
+        """
+        Return |True| if *pkg_file* is the path of the directory this reader
+        reads from.
+        """
+        if not is_string(pkg_file):
+            return False
+        return _same_path(pkg_file, self._path)
+
     def close(self):
         """
-        Provides interface consistency with |ZipFileSystem|, but does
-        nothing, a directory file system doesn't need closing.
+        Unmap the files mapped into memory by :meth:`view_for`. A file is
+        unmapped only once the views returned for it are released.
         """
-        pass
+        with self._lock:
+            mappings, self._mappings = self._mappings, {}
+        for view in mappings.values():
+            _unmap(view)
 
     @property
     def content_types_xml(self):
@@ -91,6 +154,26 @@ class _DirPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def view_for(self, pack_uri):
+        """
+        Return a read-only memoryview over the contents of the file
+        corresponding to *pack_uri*, which is mapped into memory rather than
+        read where possible, so pages are only loaded as the view is used.
+        Each file is mapped once and the mapping shared by the views over it
+        until this reader is closed. The caller must release the view before
+        the file is overwritten.
+        """
+        membername = pack_uri.membername
+        with self._lock:
+            if membername not in self._mappings:
+                path = os.path.join(self._path, membername)
+                with open(path, 'rb') as f:
+                    self._mappings[membername] = _map_file(f)
+            file_view = self._mappings[membername]
+        if file_view is None:
+            return memoryview(self.blob_for(pack_uri))
+        return file_view[:]
+
 
 class _ZipPkgReader(PhysPkgReader):
     """
@@ -98,20 +181,79 @@ class _ZipPkgReader(PhysPkgReader):
     """
     def __init__(self, pkg_file):
         super(_ZipPkgReader, self).__init__()
+        self._pkg_file = pkg_file
         self._zipf = ZipFile(pkg_file, 'r')
+        # ---ZipFile reads can be made from several threads at once on Python
+        #    3, where it locks the archive file around each of its own seeks
+        #    and reads. On Python 2 it has no such lock, so its reads are
+        #    serialized with one of our own---
+        zip_lock = getattr(self._zipf, '_lock', None)
+        self._lock = threading.RLock() if zip_lock is None else zip_lock
+        self._serializes_reads = zip_lock is None
+        # ---view over the archive mapped into memory, shared by all the
+        #    views this reader returns; mapped on first use---
+        self._archive_view = None
+        self._archive_is_mapped = False
 
     def blob_for(self, pack_uri):
         """
         Return blob corresponding to *pack_uri*. Raises |ValueError| if no
         matching member is present in zip archive.
         """
-        return self._zipf.read(pack_uri.membername)
+        return self._read_member(pack_uri.membername)
 
     def close(self):
         """
-        Close the zip archive, releasing any resources it is using.
+        Close the zip archive, releasing any resources it is using. The
+        archive is unmapped from memory once the views returned by
+        :meth:`view_for` and :meth:`raw_view_for` are released.
         """
         self._zipf.close()
+        with self._lock:
+            archive_view, self._archive_view = self._archive_view, None
+        _unmap(archive_view)
+
+    def open(self, pack_uri):
+        """
+        Return a readable file-like object for the member corresponding to
+        *pack_uri*. The member is decompressed as it is read rather than all
+        at once. Raises |KeyError| if no matching member is present.
+        """
+        return self._zipf.open(pack_uri.membername)
+
+    def raw_member_for(self, pack_uri):
+        """
+        Return a `(zipinfo, compressed_bytes)` 2-tuple for the member
+        corresponding to *pack_uri*. The bytes are the member data exactly as
+        stored in the archive, without being decompressed.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        return zinfo, self._read_at(self._data_offset(zinfo), zinfo.compress_size)
+
+    def raw_view_for(self, pack_uri):
+        """
+        Return a `(zipinfo, compressed_view)` 2-tuple for the member
+        corresponding to *pack_uri*, like :meth:`raw_member_for`, but with
+        a read-only memoryview over the compressed bytes. When the archive is
+        a file on disk, the view is a slice of the archive mapped into
+        memory, so the bytes are not copied. The caller must release the
+        view before the archive is overwritten.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        start, size = self._data_offset(zinfo), zinfo.compress_size
+        archive_view = self._archive()
+        if archive_view is None:
+            return zinfo, memoryview(self._read_at(start, size))
+        return zinfo, archive_view[start:start + size]
+
+    def reads_from(self, pkg_file):
+        """
+        Return |True| if *pkg_file* is the file or stream this reader reads
+        from.
+        """
+        if is_string(pkg_file) and is_string(self._pkg_file):
+            return _same_path(pkg_file, self._pkg_file)
+        return pkg_file is self._pkg_file
 
     @property
     def content_types_xml(self):
@@ -131,14 +273,113 @@ class _ZipPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def view_for(self, pack_uri):
+        """
+        Return a read-only memoryview over the contents of the member
+        corresponding to *pack_uri*. A member stored without compression in
+        a zip file on disk is not copied; the view is a slice of the archive
+        mapped into memory, which the caller must release before the archive
+        is overwritten. Otherwise the view is over the decompressed bytes, as
+        :meth:`blob_for` returns them.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        archive_view = (
+            self._archive() if zinfo.compress_type == ZIP_STORED else None
+        )
+        if archive_view is None:
+            return memoryview(self._read_member(zinfo))
+        start = self._data_offset(zinfo)
+        return archive_view[start:start + zinfo.file_size]
+
+    def _archive(self):
+        """
+        Return the view over the archive mapped into memory, mapping it on
+        first use, or |None| when the archive cannot be mapped, such as when
+        it is an in-memory stream.
+        """
+        with self._lock:
+            if not self._archive_is_mapped:
+                self._archive_view = _map_file(self._zipf.fp)
+                self._archive_is_mapped = True
+            return self._archive_view
+
+    def _data_offset(self, zinfo):
+        """
+        Return the offset in the archive of the first byte of the data of
+        the member described by *zinfo*, just past its local file header.
+        Raises |BadZipfile| if no local file header is found at the offset
+        *zinfo* gives for it.
+        """
+        fheader = struct.unpack(
+            _LOCAL_FILE_HEADER_FORMAT,
+            self._read_at(zinfo.header_offset, _LOCAL_FILE_HEADER_SIZE)
+        )
+        if fheader[0] != _LOCAL_FILE_HEADER_SIGNATURE:
+            raise BadZipfile(
+                'bad local file header for member %r' % zinfo.filename
+            )
+        name_len, extra_len = fheader[10], fheader[11]
+        return (
+            zinfo.header_offset + _LOCAL_FILE_HEADER_SIZE + name_len +
+            extra_len
+        )
+
+    def _read_at(self, offset, size):
+        """
+        Return *size* bytes read from the archive starting at *offset*. The
+        archive file is shared with the member reads done by |ZipFile|, which
+        may be in progress in other threads, so the seek and read are done
+        while holding the lock those reads take.
+        """
+        fp = self._zipf.fp
+        with self._lock:
+            fp.seek(offset)
+            return fp.read(size)
+
+    def _read_member(self, name_or_zinfo):
+        """
+        Return the decompressed bytes of the member identified by
+        *name_or_zinfo*, holding the archive lock for the whole read on
+        Python 2 only; on Python 3, |ZipFile| locks each of its own reads, so
+        members are decompressed in parallel.
+        """
+        if not self._serializes_reads:
+            return self._zipf.read(name_or_zinfo)
+        with self._lock:
+            return self._zipf.read(name_or_zinfo)
+
 
 class _ZipPkgWriter(PhysPkgWriter):
     """
     Implements |PhysPkgWriter| interface for a zip file OPC package.
+
+    When a *compression* level is specified, members are deflated at that
+    level, or stored uncompressed when it is 0, and images in an already
+    compressed format are always stored. The level itself is applied on
+    Python 3.7 and later; earlier versions use the zlib default. Members
+    copied verbatim with :meth:`write_raw`, like the unchanged parts of
+    a lazily opened package, keep the compression they were read with
+    whatever *compression* is.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, compression=None):
         super(_ZipPkgWriter, self).__init__()
-        self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        if compression is None:
+            self._zipf = _RawZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        else:
+            self._zipf = _open_zip_for_write(pkg_file, compression)
+        self._compression = compression
+        self._store_precompressed = compression is not None
+        self._path = pkg_file if is_string(pkg_file) else None
+
+    def abort(self):
+        """
+        Close the zip archive without completing it, and remove the package
+        file when it was written to a path, so a package that could not be
+        written in full is not left behind looking like a complete one.
+        """
+        self._zipf.abort()
+        if self._path is not None:
+            os.remove(self._path)
 
     def close(self):
         """
@@ -147,9 +388,272 @@ class _ZipPkgWriter(PhysPkgWriter):
         """
         self._zipf.close()
 
+    def compress(self, pack_uri, blob):
+        """
+        Return a `(zipinfo, compressed_bytes)` 2-tuple for *blob* compressed
+        as :meth:`write` would compress it for the member corresponding to
+        *pack_uri*, without writing it. The result is written with
+        :meth:`write_raw`. Nothing in this package is changed, so this
+        method can be called from several threads at once; zlib releases
+        the GIL while it compresses.
+        """
+        zinfo = ZipInfo(pack_uri.membername, time.localtime(time.time())[:6])
+        zinfo.external_attr = 0o600 << 16
+        zinfo.file_size = len(blob)
+        zinfo.CRC = zlib.crc32(blob) & 0xffffffff
+        if self._compression == 0 or self._is_stored(pack_uri):
+            zinfo.compress_type = ZIP_STORED
+            raw_bytes = blob
+        else:
+            level = (
+                zlib.Z_DEFAULT_COMPRESSION if self._compression is None
+                else self._compression
+            )
+            # ---negative window bits produce the raw deflate stream, with no
+            #    zlib header or trailer, that a zip member holds---
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+            zinfo.compress_type = ZIP_DEFLATED
+            raw_bytes = compressor.compress(blob) + compressor.flush()
+        zinfo.compress_size = len(raw_bytes)
+        return zinfo, raw_bytes
+
+    def open(self, pack_uri, force_zip64=None):
+        """
+        Return a writable file-like object for the member with the
+        membername corresponding to *pack_uri*. Bytes written to it are
+        compressed into the package as they arrive, so the complete blob is
+        never held in memory. No other member can be written until the
+        returned object is closed.
+
+        When *force_zip64* is |None|, the first bytes written are held in
+        memory, and a member that ends within them is written like one
+        written with :meth:`write`. A larger member is then streamed with
+        ZIP64 extensions, which it needs if it exceeds 2 GiB. When
+        *force_zip64* is |False|, the member is streamed without them and
+        cannot exceed 2 GiB.
+        """
+        if sys.version_info < (3, 6):
+            return _BufferedZipMember(self._zipf, pack_uri.membername)
+        if force_zip64 is None:
+            return _SpillingZipMember(self._zipf, pack_uri.membername)
+        return self._zipf.open(
+            pack_uri.membername, 'w', force_zip64=force_zip64
+        )
+
     def write(self, pack_uri, blob):
         """
         Write *blob* to this zip package with the membername corresponding to
         *pack_uri*.
         """
+        if self._is_stored(pack_uri):
+            self._zipf.writestr(pack_uri.membername, blob, ZIP_STORED)
+            return
         self._zipf.writestr(pack_uri.membername, blob)
+
+    def write_raw(self, pack_uri, src_zinfo, raw_bytes):
+        """
+        Write *raw_bytes*, member data already compressed as described by
+        *src_zinfo*, to this zip package with the membername corresponding to
+        *pack_uri*. The data is copied verbatim, without being decompressed
+        and compressed again.
+        """
+        zinfo = ZipInfo(pack_uri.membername, src_zinfo.date_time)
+        zinfo.compress_type = src_zinfo.compress_type
+        zinfo.create_system = src_zinfo.create_system
+        zinfo.external_attr = src_zinfo.external_attr
+        zinfo.flag_bits = src_zinfo.flag_bits & ~_DATA_DESCRIPTOR_FLAG
+        zinfo.CRC = src_zinfo.CRC
+        zinfo.compress_size = src_zinfo.compress_size
+        zinfo.file_size = src_zinfo.file_size
+        self._zipf.write_raw(zinfo, raw_bytes)
+
+    def _is_stored(self, pack_uri):
+        """
+        |True| if the member for *pack_uri* is to be stored uncompressed
+        because its content is an already compressed image.
+        """
+        if not self._store_precompressed:
+            return False
+        return pack_uri.ext.lower() in _PRECOMPRESSED_EXTS
+
+
+class _RawZipFile(ZipFile):
+    """
+    |ZipFile| that can also add a member from data that is already
+    compressed, so a member can be copied from another archive without
+    being decompressed and compressed again.
+
+    |ZipFile| has no public API for this, so :meth:`write_raw` adds the
+    member the way ``ZipFile.writestr()`` does, using the same attributes
+    of |ZipFile| it uses: ``fp``, ``filelist``, ``NameToInfo``,
+    ``start_dir`` and ``_didModify``, and on Python 3 also ``_lock``,
+    ``_seekable`` and ``_writing``. :meth:`abort` uses ``fp`` and
+    ``_filePassed``. This class is the only place that depends on them.
+    """
+    def __init__(self, *args, **kwargs):
+        super(_RawZipFile, self).__init__(*args, **kwargs)
+        # ---`ZipFile` has its own lock from Python 3.5 on---
+        self._raw_lock = getattr(self, '_lock', None) or threading.RLock()
+
+    def abort(self):
+        """
+        Close this archive without writing its central directory, so what
+        has been written of it is not readable as a complete archive. A file
+        object passed in is left open, as ``ZipFile.close()`` leaves it.
+        """
+        with self._raw_lock:
+            fp, self.fp = self.fp, None
+            if fp is not None and not self._filePassed:
+                fp.close()
+
+    def write_raw(self, zinfo, raw_bytes):
+        """
+        Write member *raw_bytes*, compressed as *zinfo* describes, to this
+        archive as a new member described by *zinfo*. Raises |ValueError|
+        if a member opened with ``ZipFile.open()`` is still being written.
+        """
+        with self._raw_lock:
+            if getattr(self, '_writing', False):
+                raise ValueError(
+                    "can't write a member while another member is open for "
+                    "writing"
+                )
+            self._writecheck(zinfo)
+            self._didModify = True
+            if getattr(self, '_seekable', False):
+                self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+            self.fp.write(zinfo.FileHeader())
+            self.fp.write(raw_bytes)
+            self.start_dir = self.fp.tell()
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+
+
+class _BufferedZipMember(BytesIO):
+    """
+    Stand-in for the writable member file ``ZipFile.open()`` provides on
+    Python 3.6 and later. Collects the bytes written to it in memory and
+    writes them to the zip archive as a single member when closed.
+    """
+    def __init__(self, zipf, membername):
+        super(_BufferedZipMember, self).__init__()
+        self._zipf = zipf
+        self._membername = membername
+
+    def close(self):
+        if not self.closed:
+            self._zipf.writestr(self._membername, self.getvalue())
+        super(_BufferedZipMember, self).close()
+
+
+class _SpillingZipMember(object):
+    """
+    Writable member file that holds the first *buffer_size* bytes written to
+    it in memory. A member that ends within them is written to the zip
+    archive with ``ZipFile.writestr()``, which adds ZIP64 extensions only
+    when the member needs them. Once more is written, the member is
+    streamed into the archive with ZIP64 extensions, as its final size is
+    not known in advance.
+    """
+    def __init__(self, zipf, membername, buffer_size=_MEMBER_BUFFER_SIZE):
+        super(_SpillingZipMember, self).__init__()
+        self._zipf = zipf
+        self._membername = membername
+        self._buffer_size = buffer_size
+        self._buffer = BytesIO()
+        self._member = None
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self._member is None:
+            self._zipf.writestr(self._membername, self._buffer.getvalue())
+            self._buffer = None
+            return
+        self._member.close()
+
+    def write(self, data):
+        if self._member is not None:
+            return self._member.write(data)
+        self._buffer.write(data)
+        if self._buffer.tell() > self._buffer_size:
+            self._member = self._zipf.open(
+                self._membername, 'w', force_zip64=True
+            )
+            self._member.write(self._buffer.getvalue())
+            self._buffer = None
+        return len(data)
+
+
+def _open_zip_for_write(pkg_file, compression):
+    """
+    Return a |_RawZipFile| object writing to *pkg_file* that compresses
+    members with zlib compression level *compression*, an int from 0 to 9. Raises
+    |TypeError| when *compression* is not an int, which includes a bool.
+    """
+    if isinstance(compression, bool) or not isinstance(compression, Integral):
+        tmpl = "compression must be an int from 0 to 9, got '%s'"
+        raise TypeError(tmpl % type(compression).__name__)
+    if not 0 <= compression <= 9:
+        raise ValueError(
+            'compression must be an int from 0 to 9, got %r' % (compression,)
+        )
+    if compression == 0:
+        return _RawZipFile(pkg_file, 'w', compression=ZIP_STORED)
+    if sys.version_info < (3, 7):
+        return _RawZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+    return _RawZipFile(
+        pkg_file, 'w', compression=ZIP_DEFLATED, compresslevel=compression
+    )
+
+
+def _map_file(f):
+    """
+    Return a read-only memoryview over the contents of open file *f* mapped
+    into memory, or |None| when *f* cannot be mapped, such as an in-memory
+    stream, or on Python 2, where a memoryview cannot be taken of a mapping.
+    The mapping stays valid after *f* is closed, until it is closed with
+    :func:`_unmap`. An empty file gives an empty view.
+    """
+    try:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b'')
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except (AttributeError, EnvironmentError, TypeError, ValueError):
+        return None
+
+
+def _unmap(file_view):
+    """
+    Release *file_view*, a view returned by :func:`_map_file` or |None|, and
+    close the mapping it is over. A mapping that views sliced from
+    *file_view* still use is closed when the last of them is released.
+    """
+    if file_view is None:
+        return
+    mapping = file_view.obj
+    file_view.release()
+    if not isinstance(mapping, mmap.mmap):
+        return
+    try:
+        mapping.close()
+    except BufferError:
+        pass
+
+
+def _same_path(path, other_path):
+    """
+    Return |True| if *path* and *other_path* refer to the same file.
+    """
+    def canonical(p):
+        return os.path.normcase(os.path.realpath(p))
+    return canonical(path) == canonical(other_path)
@@ -7,6 +7,10 @@ Provides a low-level, read-only API to a serialized Open Packaging Convention
 
 from __future__ import absolute_import
 
+from copy import deepcopy
+
+from ..compat import futures
+from ..oxml import parse_xml as parse_part_xml
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
@@ -25,17 +29,28 @@ class PackageReader(object):
         self._sparts = sparts
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, lazy=False, workers=None):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
+
+        When *lazy* is |True|, part blobs are not read here. Each serialized
+        part is given a |DeferredBlob| instead and the physical package is
+        left open so the bytes can be read on first access. Otherwise, when
+        *workers* is an int, part blobs are read and decompressed by a pool
+        of that many threads.
         """
         phys_reader = PhysPkgReader(pkg_file)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
         pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
         sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, lazy or workers is not None
         )
-        phys_reader.close()
+        if not lazy:
+            if workers is not None:
+                sparts = PackageReader._read_blobs_concurrently(
+                    sparts, workers
+                )
+            phys_reader.close()
         return PackageReader(content_types, pkg_srels, sparts)
 
     def iter_sparts(self):
@@ -58,14 +73,17 @@ class PackageReader(object):
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def _load_serialized_parts(phys_reader, pkg_srels, content_types,
+                               lazy=False):
         """
         Return a list of |_SerializedPart| instances corresponding to the
         parts in *phys_reader* accessible by walking the relationship graph
         starting with *pkg_srels*.
         """
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        part_walker = PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels, lazy=lazy
+        )
         for partname, blob, reltype, srels in part_walker:
             content_type = content_types[partname]
             spart = _SerializedPart(
@@ -74,6 +92,26 @@ class PackageReader(object):
             sparts.append(spart)
         return tuple(sparts)
 
+    @staticmethod
+    def _read_blobs_concurrently(sparts, workers):
+        """
+        Return a tuple of |_SerializedPart| instances like *sparts*, in the
+        same order, each holding the bytes read from the |DeferredBlob| of
+        the corresponding part in *sparts*. The blobs are read by a pool of
+        *workers* threads; zlib releases the GIL while decompressing. On
+        Python 2, where a zip file cannot be read by several threads at once,
+        the physical package reader serializes the reads.
+        """
+        with futures.ThreadPoolExecutor(workers) as executor:
+            blobs = executor.map(lambda spart: spart.blob.read(), sparts)
+            return tuple(
+                _SerializedPart(
+                    spart.partname, spart.content_type, spart.reltype, blob,
+                    spart.srels
+                )
+                for spart, blob in zip(sparts, blobs)
+            )
+
     @staticmethod
     def _srels_for(phys_reader, source_uri):
         """
@@ -85,11 +123,12 @@ class PackageReader(object):
             source_uri.baseURI, rels_xml)
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_phys_parts(phys_reader, srels, visited_partnames=None,
+                         lazy=False):
         """
         Generate a 4-tuple `(partname, blob, reltype, srels)` for each of the
         parts in *phys_reader* by walking the relationship graph rooted at
-        srels.
+        srels. *blob* is a |DeferredBlob| when *lazy* is |True|.
         """
         if visited_partnames is None:
             visited_partnames = []
@@ -102,15 +141,65 @@ class PackageReader(object):
             visited_partnames.append(partname)
             reltype = srel.reltype
             part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
+            blob = (
+                DeferredBlob(phys_reader, partname) if lazy
+                else phys_reader.blob_for(partname)
+            )
             yield (partname, blob, reltype, part_srels)
             next_walker = PackageReader._walk_phys_parts(
-                phys_reader, part_srels, visited_partnames
+                phys_reader, part_srels, visited_partnames, lazy
             )
             for partname, blob, reltype, srels in next_walker:
                 yield (partname, blob, reltype, srels)
 
 
+class PackageSnapshot(PackageReader):
+    """
+    The contents of a package read into memory once, from which any number of
+    independent packages can be unmarshalled without going back to the
+    package file. Each part is provided with a |SnapshotBlob| that also holds
+    the compressed form of the part when the package is a zip archive, so a
+    part that is never changed is written to a new package without being
+    compressed again.
+    """
+    def __init__(self, content_types, pkg_srels, sparts, blobs):
+        super(PackageSnapshot, self).__init__(content_types, pkg_srels, sparts)
+        self._blobs = blobs
+
+    @classmethod
+    def from_file(cls, pkg_file):
+        """
+        Return a |PackageSnapshot| instance holding the contents of
+        *pkg_file*, which is closed before returning.
+        """
+        phys_reader = PhysPkgReader(pkg_file)
+        try:
+            content_types = _ContentTypeMap.from_xml(
+                phys_reader.content_types_xml
+            )
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            sparts = PackageReader._load_serialized_parts(
+                phys_reader, pkg_srels, content_types, lazy=True
+            )
+            blobs = dict(
+                (spart.partname,
+                 SnapshotBlob(spart.blob.read(), spart.blob.read_raw()))
+                for spart in sparts
+            )
+        finally:
+            phys_reader.close()
+        return cls(content_types, pkg_srels, sparts, blobs)
+
+    def iter_sparts(self):
+        """
+        Generate a 4-tuple `(partname, content_type, reltype, blob)` for each
+        of the parts in the snapshot, where *blob* is a |SnapshotBlob|.
+        """
+        sparts = super(PackageSnapshot, self).iter_sparts()
+        for partname, content_type, reltype, _ in sparts:
+            yield (partname, content_type, reltype, self._blobs[partname])
+
+
 class _ContentTypeMap(object):
     """
     Value type providing dictionary semantics for looking up content type by
@@ -164,6 +253,122 @@ class _ContentTypeMap(object):
         self._overrides[partname] = content_type
 
 
+class DeferredBlob(object):
+    """
+    Stand-in for the blob of a part in a package opened with ``lazy=True``.
+    Holds a reference to the still-open physical package reader and reads
+    the part bytes from it only when :meth:`read` is called.
+    """
+    def __init__(self, phys_reader, partname):
+        super(DeferredBlob, self).__init__()
+        self._phys_reader = phys_reader
+        self._partname = partname
+
+    def read(self):
+        """
+        Return the bytes of this part read from the physical package. The
+        bytes are not cached; each call reads the member again.
+        """
+        return self._phys_reader.blob_for(self._partname)
+
+    def read_raw(self):
+        """
+        Return a `(zipinfo, compressed_bytes)` 2-tuple for the zip member
+        holding this part, or |None| when the physical package is not a zip
+        archive.
+        """
+        return self._phys_reader.raw_member_for(self._partname)
+
+    def reads_from(self, pkg_file):
+        """
+        Return |True| if this blob is read from *pkg_file*, which may be a
+        path or a file-like object.
+        """
+        return self._phys_reader.reads_from(pkg_file)
+
+    def view(self):
+        """
+        Return a read-only memoryview over the bytes of this part. For a part
+        in an expanded package, or stored without compression in a zip file,
+        the view is over the package file mapped into memory, so the bytes
+        are not copied, and must be released before that file is overwritten.
+        """
+        return self._phys_reader.view_for(self._partname)
+
+    def view_raw(self):
+        """
+        Return a `(zipinfo, compressed_view)` 2-tuple like :meth:`read_raw`
+        returns, but with a read-only memoryview over the compressed bytes,
+        which for a zip file on disk are not copied, or |None| when the
+        physical package is not a zip archive. The view must be released
+        before the package file is overwritten.
+        """
+        return self._phys_reader.raw_view_for(self._partname)
+
+
+class SnapshotBlob(DeferredBlob):
+    """
+    Stand-in for the blob of a part in a package unmarshalled from a
+    |PackageSnapshot|. The bytes are shared by every package created from the
+    snapshot. The XML of the part is parsed at most once, the first time any
+    of those packages needs it, and each package gets its own deep copy of
+    the parsed element.
+    """
+    def __init__(self, blob, raw_member=None):
+        super(SnapshotBlob, self).__init__(None, None)
+        self._blob = blob
+        self._raw_member = raw_member
+        self._element = None
+
+    def copy_element(self):
+        """
+        Return a new copy of the root element parsed from the XML of this
+        part.
+        """
+        if self._element is None:
+            self._element = parse_part_xml(self._blob)
+        return deepcopy(self._element)
+
+    def read(self):
+        """
+        Return the bytes of this part, shared with the snapshot.
+        """
+        return self._blob
+
+    def read_raw(self):
+        """
+        Return the `(zipinfo, compressed_bytes)` 2-tuple for the zip member
+        this part was read from, shared with the snapshot, or |None| when the
+        snapshot was not read from a zip archive.
+        """
+        return self._raw_member
+
+    def reads_from(self, pkg_file):
+        """
+        Return |False|; the bytes of this part are held in memory so no
+        package file needs to be kept readable.
+        """
+        return False
+
+    def view(self):
+        """
+        Return a read-only memoryview over the bytes of this part, shared
+        with the snapshot.
+        """
+        return memoryview(self._blob)
+
+    def view_raw(self):
+        """
+        Return a `(zipinfo, compressed_view)` 2-tuple with a memoryview over
+        the compressed bytes shared with the snapshot, or |None| when the
+        snapshot was not read from a zip archive.
+        """
+        if self._raw_member is None:
+            return None
+        zinfo, raw_bytes = self._raw_member
+        return zinfo, memoryview(raw_bytes)
+
+
 class _SerializedPart(object):
     """
     Value object for an OPC package part. Provides access to the partname,
@@ -7,9 +7,14 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+from collections import deque
+
+from ..compat import futures
+from .compat import release_view
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from .part import XmlPart
 from .phys_pkg import PhysPkgWriter
 from .shared import CaseInsensitiveDict
 from .spec import default_content_types
@@ -23,18 +28,83 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, compression=None, workers=None,
+              incremental=False):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. *compression* is an optional zlib
+        compression level. When *workers* is not |None|, parts are
+        serialized and compressed by a pool of that many threads. When
+        *incremental* is |True|, a dirty part whose blob is unchanged from
+        its source is copied like a part that is not dirty.
         """
-        phys_writer = PhysPkgWriter(pkg_file)
+        if workers is not None and futures is None:
+            raise RuntimeError(
+                'saving with workers requires concurrent.futures, which on '
+                'Python 2 is provided by the futures backport'
+            )
+        phys_writer = PhysPkgWriter(pkg_file, compression)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        if workers is None:
+            PackageWriter._write_parts(phys_writer, parts, incremental)
+        else:
+            PackageWriter._write_parts_concurrently(
+                phys_writer, parts, workers, incremental
+            )
         phys_writer.close()
 
+    @staticmethod
+    def write_streamed(phys_writer, pkg_rels, parts, streamed_part):
+        """
+        Complete the physical package being written by *phys_writer*, into
+        which the blob of *streamed_part* has already been written
+        incrementally. Writes the content types stream, *pkg_rels*, the
+        parts in *parts* other than *streamed_part*, and the rels item of
+        *streamed_part*, then closes *phys_writer*.
+        """
+        PackageWriter._write_content_types_stream(phys_writer, parts)
+        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+        PackageWriter._write_parts(
+            phys_writer, [p for p in parts if p is not streamed_part]
+        )
+        if len(streamed_part._rels):
+            phys_writer.write(
+                streamed_part.partname.rels_uri, streamed_part._rels.xml
+            )
+        phys_writer.close()
+
+    @staticmethod
+    def _changed_blob(part):
+        """
+        Return the blob of dirty *part*, or |None| when it is the same as the
+        bytes of the source the part was loaded from, in which case the part
+        can be copied from its source rather than compressed again.
+        """
+        blob = part.blob
+        if part.source is not None and blob == part.source.read():
+            return None
+        return blob
+
+    @staticmethod
+    def _copy_part(phys_writer, part):
+        """
+        Write the unchanged *part* to the package, copying its compressed
+        bytes from the source zip archive when available. The compressed
+        bytes are written from the source archive mapped into memory where
+        it can be, so they are not first read into a bytes object.
+        """
+        raw_member = part.source.view_raw()
+        if raw_member is None:
+            phys_writer.write(part.partname, part.blob)
+            return
+        zinfo, raw_view = raw_member
+        try:
+            phys_writer.write_raw(part.partname, zinfo, raw_view)
+        finally:
+            release_view(raw_view)
+
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
         """
@@ -45,16 +115,83 @@ class PackageWriter(object):
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer, parts):
+    def _write_parts(phys_writer, parts, incremental=False):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. A part
+        that is not dirty is copied from its source package without being
+        recompressed when the source is a zip archive. The XML of an XML part
+        is serialized straight into its package member. When *incremental*
+        is |True|, a dirty part with a source is first serialized in memory
+        and copied from its source instead when its blob is unchanged.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            if not part.is_dirty:
+                PackageWriter._copy_part(phys_writer, part)
+            elif incremental and part.source is not None:
+                blob = PackageWriter._changed_blob(part)
+                if blob is None:
+                    PackageWriter._copy_part(phys_writer, part)
+                else:
+                    phys_writer.write(part.partname, blob)
+            elif isinstance(part, XmlPart):
+                member = phys_writer.open(part.partname)
+                with member:
+                    part.write_blob(member)
+            else:
+                phys_writer.write(part.partname, part.blob)
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
+    @staticmethod
+    def _write_parts_concurrently(phys_writer, parts, workers,
+                                  incremental=False):
+        """
+        Write *parts* to the package as :meth:`_write_parts` does, using a
+        pool of *workers* threads to serialize and compress the blob and
+        rels item of each part. lxml and zlib release the GIL while they
+        work, so this proceeds in parallel on a multi-core machine. Members
+        are written in the same order :meth:`_write_parts` writes them, so
+        the package does not depend on the order the threads finish in.
+        Parts are submitted at most ``2 * workers`` ahead of the part being
+        written, so only that many compressed parts are held in memory at
+        once.
+        """
+        def compress_members(part):
+            blob = (
+                None if not part.is_dirty else
+                PackageWriter._changed_blob(part) if incremental else
+                part.blob
+            )
+            part_member = (
+                None if blob is None else
+                phys_writer.compress(part.partname, blob)
+            )
+            rels_member = (
+                phys_writer.compress(part.partname.rels_uri, part._rels.xml)
+                if len(part._rels) else None
+            )
+            return part_member, rels_member
+
+        def write_members(part, future):
+            part_member, rels_member = future.result()
+            if part_member is None:
+                PackageWriter._copy_part(phys_writer, part)
+            else:
+                phys_writer.write_raw(part.partname, *part_member)
+            if rels_member is not None:
+                phys_writer.write_raw(part.partname.rels_uri, *rels_member)
+
+        max_pending = 2 * workers
+        with futures.ThreadPoolExecutor(workers) as executor:
+            pending = deque()
+            for part in parts:
+                pending.append((part, executor.submit(compress_members, part)))
+                if len(pending) >= max_pending:
+                    write_members(*pending.popleft())
+            while pending:
+                write_members(*pending.popleft())
+
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
         """
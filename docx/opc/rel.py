@@ -8,17 +8,37 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from .compat import is_string
 from .oxml import CT_Relationships
 
 
 class Relationships(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+
+    Secondary indexes of the relationships by reltype and by (reltype, target)
+    are kept up to date as items are set and deleted, so finding a matching
+    relationship does not require a scan of the collection.
     """
     def __init__(self, baseURI):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._rels_by_reltype = {}
+        self._rels_by_target = {}
+        # ---every 'rId{n}' with n less than this is known to be in use---
+        self._rId_floor = 1
+
+    def __delitem__(self, rId):
+        rel = self[rId]
+        super(Relationships, self).__delitem__(rId)
+        self._unindex(rId, rel)
+
+    def __setitem__(self, rId, rel):
+        if rId in self:
+            self._unindex(rId, self[rId])
+        super(Relationships, self).__setitem__(rId, rel)
+        self._index(rId, rel)
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -89,20 +109,7 @@ class Relationships(dict):
         Return relationship of matching *reltype*, *target*, and
         *is_external* from collection, or None if not found.
         """
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        return self._rels_by_target.get((reltype, is_external, target))
 
     def _get_rel_of_type(self, reltype):
         """
@@ -110,14 +117,23 @@ class Relationships(dict):
         Raises |KeyError| if no matching relationship is found. Raises
         |ValueError| if more than one matching relationship is found.
         """
-        matching = [rel for rel in self.values() if rel.reltype == reltype]
+        matching = self._rels_by_reltype.get(reltype, {})
         if len(matching) == 0:
             tmpl = "no relationship of type '%s' in collection"
             raise KeyError(tmpl % reltype)
         if len(matching) > 1:
             tmpl = "multiple relationships of type '%s' in collection"
             raise ValueError(tmpl % reltype)
-        return matching[0]
+        return next(iter(matching.values()))
+
+    def _index(self, rId, rel):
+        """
+        Add *rel*, stored under *rId*, to the secondary indexes. When more
+        than one relationship has the same reltype and target, the first one
+        added is the one found by :meth:`_get_matching`.
+        """
+        self._rels_by_reltype.setdefault(rel.reltype, {})[rId] = rel
+        self._rels_by_target.setdefault(_target_key(rel), rel)
 
     @property
     def _next_rId(self):
@@ -125,10 +141,44 @@ class Relationships(dict):
         Next available rId in collection, starting from 'rId1' and making use
         of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
         """
-        for n in range(1, len(self)+2):
-            rId_candidate = 'rId%d' % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        n = self._rId_floor
+        while 'rId%d' % n in self:
+            n += 1
+        self._rId_floor = n
+        return 'rId%d' % n
+
+    def _unindex(self, rId, rel):
+        """
+        Remove *rel*, stored under *rId*, from the secondary indexes.
+        """
+        self._target_parts_by_rId.pop(rId, None)
+
+        rels_of_type = self._rels_by_reltype[rel.reltype]
+        del rels_of_type[rId]
+        if not rels_of_type:
+            del self._rels_by_reltype[rel.reltype]
+
+        key = _target_key(rel)
+        if self._rels_by_target.get(key) is rel:
+            del self._rels_by_target[key]
+            for other_rel in rels_of_type.values():
+                if _target_key(other_rel) == key:
+                    self._rels_by_target[key] = other_rel
+                    break
+
+        # ---a deleted 'rId{n}' is a gap that _next_rId must consider again---
+        if is_string(rId) and rId.startswith('rId') and rId[3:].isdigit():
+            self._rId_floor = max(min(self._rId_floor, int(rId[3:])), 1)
+
+
+def _target_key(rel):
+    """
+    Return the key of *rel* in the (reltype, target) index of
+    |Relationships|. The target is the target part of an internal
+    relationship or the target reference (a URL) of an external one.
+    """
+    target = rel.target_ref if rel.is_external else rel.target_part
+    return (rel.reltype, rel.is_external, target)
 
 
 class _Relationship(object):
@@ -7,6 +7,8 @@ corresponding to Open XML elements.
 
 from __future__ import absolute_import
 
+import threading
+
 from lxml import etree
 
 from .ns import NamespacePrefixedTag, nsmap
@@ -17,15 +19,19 @@ element_class_lookup = etree.ElementNamespaceClassLookup()
 oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
+# ---an lxml parser parses one document at a time, so each thread gets its
+#    own copy of the oxml parser; copies share its element class lookup---
+_thread_local = threading.local()
+
 
 def parse_xml(xml):
     """
     Return root lxml element obtained by parsing XML character string in
     *xml*, which can be either a Python 2.x string or unicode. The custom
     parser is used, so custom element classes are produced for elements in
-    *xml* that have them.
+    *xml* that have them. Safe to call from several threads at once.
     """
-    root_element = etree.fromstring(xml, oxml_parser)
+    root_element = etree.fromstring(xml, _parser())
     return root_element
 
 
@@ -60,6 +66,16 @@ def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
     )
 
 
+def _parser():
+    """
+    Return the copy of `oxml_parser` for use by the current thread.
+    """
+    parser = getattr(_thread_local, 'parser', None)
+    if parser is None:
+        parser = _thread_local.parser = oxml_parser.copy()
+    return parser
+
+
 # ===========================================================================
 # custom element class mappings
 # ===========================================================================
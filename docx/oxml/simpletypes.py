@@ -14,16 +14,41 @@ from ..exceptions import InvalidXmlError
 from ..shared import Emu, Pt, RGBColor, Twips
 
 
+# ---most attributes take one of a small number of distinct values, so
+#    conversions are memoized. The memos are keyed by simple type as well as
+#    value, and `to_xml()` also keys on the type of the value so `1.0` is not
+#    taken for `1`. Each is cleared when it reaches `_MEMO_SIZE` entries.---
+_MEMO_SIZE = 4096
+_from_xml_memo = {}
+_to_xml_memo = {}
+
+
 class BaseSimpleType(object):
 
     @classmethod
     def from_xml(cls, str_value):
-        return cls.convert_from_xml(str_value)
+        key = (cls, str_value)
+        try:
+            return _from_xml_memo[key]
+        except KeyError:
+            pass
+        value = cls.convert_from_xml(str_value)
+        _memoize(_from_xml_memo, key, value)
+        return value
 
     @classmethod
     def to_xml(cls, value):
+        key = (cls, type(value), value)
+        try:
+            return _to_xml_memo[key]
+        except KeyError:
+            pass
+        except TypeError:  # value is not hashable, so can't be memoized
+            cls.validate(value)
+            return cls.convert_to_xml(value)
         cls.validate(value)
         str_value = cls.convert_to_xml(value)
+        _memoize(_to_xml_memo, key, str_value)
         return str_value
 
     @classmethod
@@ -407,3 +432,12 @@ class ST_VerticalAlignRun(XsdStringEnumeration):
     SUBSCRIPT = 'subscript'
 
     _members = (BASELINE, SUPERSCRIPT, SUBSCRIPT)
+
+
+def _memoize(memo, key, value):
+    """
+    Add *value* to *memo* under *key*, first clearing *memo* if it is full.
+    """
+    if len(memo) >= _MEMO_SIZE:
+        memo.clear()
+    memo[key] = value
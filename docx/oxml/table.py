@@ -6,7 +6,14 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import re
+
+from collections import namedtuple
+from itertools import chain
+from xml.sax.saxutils import escape
+
 from . import parse_xml
+from ..compat import Unicode
 from ..enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_ROW_HEIGHT_RULE
 from ..exceptions import InvalidSpanError
 from .ns import nsdecls, qn
@@ -132,6 +139,20 @@ class CT_Tbl(BaseOxmlElement):
         else:
             tblPr.get_or_add_bidiVisual().val = value
 
+    def add_trs_from_rows(self, rows):
+        """
+        Append a ``<w:tr>`` element for each sequence of cell values in
+        *rows*, each cell having the width of its grid column. *rows* can be
+        any iterable, including a generator.
+        """
+        col_widths = [gridCol.w for gridCol in self.tblGrid.gridCol_lst]
+        tbl = parse_xml(
+            '<w:tbl %s>%s</w:tbl>' % (
+                nsdecls('w'), self._row_data_trs_xml(rows, col_widths)
+            )
+        )
+        self.extend(tbl.tr_lst)
+
     @property
     def col_count(self):
         """
@@ -149,6 +170,20 @@ class CT_Tbl(BaseOxmlElement):
             for tc in tr.tc_lst:
                 yield tc
 
+    def merge_regions(self, regions):
+        """
+        Merge each rectangular region in *regions*, in order, and return
+        a list containing the top-left ``<w:tc>`` element of each resulting
+        span. Each region is a (row_idx, col_idx, row_idx_2, col_idx_2)
+        4-tuple of the layout-grid positions of two diagonally opposite
+        corner cells. The layout grid is indexed once for the whole batch.
+        """
+        grid = _TcGrid(self)
+        return [
+            grid.merge(grid.tc_at(row_idx, col_idx), grid.tc_at(row_idx_2, col_idx_2))
+            for row_idx, col_idx, row_idx_2, col_idx_2 in regions
+        ]
+
     @classmethod
     def new_tbl(cls, rows, cols, width):
         """
@@ -157,6 +192,26 @@ class CT_Tbl(BaseOxmlElement):
         """
         return parse_xml(cls._tbl_xml(rows, cols, width))
 
+    @classmethod
+    def new_tbl_from_rows(cls, rows, width, header=None):
+        """
+        Return a new `w:tbl` element having a row for each sequence of cell
+        values in *rows* and *width* distributed evenly between the columns.
+        When *header* is a sequence of column headings, it becomes the first
+        row and is marked to repeat at the top of each page. The column count
+        is the length of *header*, or of the first row when *header* is
+        |None|. Shorter rows are padded with empty cells.
+        """
+        rows = iter(rows)
+        if header is not None:
+            cols = len(header)
+        else:
+            first_row = next(rows, None)
+            cols = 0 if first_row is None else len(first_row)
+            if first_row is not None:
+                rows = chain((first_row,), rows)
+        return parse_xml(cls._tbl_xml(rows, cols, width, header))
+
     @property
     def tblStyle_val(self):
         """
@@ -181,8 +236,17 @@ class CT_Tbl(BaseOxmlElement):
         tblPr._add_tblStyle().val = styleId
 
     @classmethod
-    def _tbl_xml(cls, rows, cols, width):
+    def _tbl_xml(cls, rows, cols, width, header=None):
+        """
+        *rows* is either a row count, producing rows of empty cells, or an
+        iterable of sequences of cell values, optionally preceded by the
+        *header* row.
+        """
         col_width = Emu(width/cols) if cols > 0 else Emu(0)
+        if isinstance(rows, int):
+            trs_xml = cls._trs_xml(rows, cols, col_width)
+        else:
+            trs_xml = cls._row_data_trs_xml(rows, [col_width] * cols, header)
         return (
             '<w:tbl %s>\n'
             '  <w:tblPr>\n'
@@ -197,7 +261,7 @@ class CT_Tbl(BaseOxmlElement):
         ) % (
             nsdecls('w'),
             cls._tblGrid_xml(cols, col_width),
-            cls._trs_xml(rows, cols, col_width)
+            trs_xml
         )
 
     @classmethod
@@ -233,6 +297,72 @@ class CT_Tbl(BaseOxmlElement):
             ) % col_width.twips
         return xml
 
+    @classmethod
+    def _row_data_trs_xml(cls, rows, col_widths, header=None):
+        """
+        Return the XML for a ``<w:tr>`` element for each sequence of cell
+        values in *rows*, preceded by a repeating header row for *header*
+        when it is not |None|. *col_widths* holds the |Length| of each
+        column, or |None| where a cell should have no explicit width.
+        """
+        tcPr_xmls = [
+            '' if width is None else
+            '<w:tcPr><w:tcW w:type="dxa" w:w="%d"/></w:tcPr>' % width.twips
+            for width in col_widths
+        ]
+        trs = []
+        if header is not None:
+            trs.append(cls._row_data_tr_xml(header, tcPr_xmls, True))
+        trs.extend(cls._row_data_tr_xml(row, tcPr_xmls) for row in rows)
+        return ''.join(trs)
+
+    @classmethod
+    def _row_data_tr_xml(cls, values, tcPr_xmls, is_header=False):
+        values = list(values)
+        col_count = len(tcPr_xmls)
+        if len(values) > col_count:
+            raise ValueError(
+                'row has %d cells but table has %d columns'
+                % (len(values), col_count)
+            )
+        values.extend([None] * (col_count - len(values)))
+        return '<w:tr>%s%s</w:tr>' % (
+            '<w:trPr><w:tblHeader/></w:trPr>' if is_header else '',
+            ''.join([
+                '<w:tc>%s%s</w:tc>' % (tcPr_xml, cls._row_data_p_xml(value))
+                for value, tcPr_xml in zip(values, tcPr_xmls)
+            ])
+        )
+
+    @classmethod
+    def _row_data_p_xml(cls, value):
+        """
+        Return the XML for a ``<w:p>`` element having the text of *value* in
+        a single run, translated to run content the same way assigning to
+        `_Cell.text` does. The paragraph is empty when *value* is |None|.
+        """
+        text = '' if value is None else Unicode(value)
+        if not text:
+            return '<w:p/>'
+        r_content = []
+        for item in _run_break_re.split(text):
+            if item == '\t':
+                r_content.append('<w:tab/>')
+            elif item in ('\n', '\r'):
+                r_content.append('<w:br/>')
+            elif item.strip() != item:
+                r_content.append(
+                    '<w:t xml:space="preserve">%s</w:t>' % escape(item)
+                )
+            elif item:
+                r_content.append('<w:t>%s</w:t>' % escape(item))
+        return '<w:p><w:r>%s</w:r></w:p>' % ''.join(r_content)
+
+
+# ---splits text into runs of regular characters and single tab or line-break
+#    characters---
+_run_break_re = re.compile('([\t\n\r])')
+
 
 class CT_TblGrid(BaseOxmlElement):
     """
@@ -440,10 +570,7 @@ class CT_Tc(BaseOxmlElement):
         merging the rectangular region defined by using this tc element and
         *other_tc* as diagonal corners.
         """
-        top, left, height, width = self._span_dimensions(other_tc)
-        top_tc = self._tbl.tr_lst[top].tc_at_grid_col(left)
-        top_tc._grow_to(width, height)
-        return top_tc
+        return _TcGrid(self._tbl).merge(self, other_tc)
 
     @classmethod
     def new(cls):
@@ -526,24 +653,6 @@ class CT_Tc(BaseOxmlElement):
         preceding_tcs = tr.tc_lst[:idx]
         return sum(tc.grid_span for tc in preceding_tcs)
 
-    def _grow_to(self, width, height, top_tc=None):
-        """
-        Grow this cell to *width* grid columns and *height* rows by expanding
-        horizontal spans and creating continuation cells to form vertical
-        spans.
-        """
-        def vMerge_val(top_tc):
-            if top_tc is not self:
-                return ST_Merge.CONTINUE
-            if height == 1:
-                return None
-            return ST_Merge.RESTART
-
-        top_tc = self if top_tc is None else top_tc
-        self._span_to_width(width, top_tc, vMerge_val(top_tc))
-        if height > 1:
-            self._tc_below._grow_to(width, height-1, top_tc)
-
     def _insert_tcPr(self, tcPr):
         """
         ``tcPr`` has a bunch of successors, but it comes first if it appears,
@@ -591,8 +700,7 @@ class CT_Tc(BaseOxmlElement):
         The `w:tc` element immediately following this one in this row, or
         |None| if this is the last `w:tc` element in the row.
         """
-        following_tcs = self.xpath('./following-sibling::w:tc')
-        return following_tcs[0] if following_tcs else None
+        return next(self.itersiblings(qn('w:tc')), None)
 
     def _remove(self):
         """
@@ -620,30 +728,7 @@ class CT_Tc(BaseOxmlElement):
         the merged cell formed by using this tc and *other_tc* as opposite
         corner extents.
         """
-        def raise_on_inverted_L(a, b):
-            if a.top == b.top and a.bottom != b.bottom:
-                raise InvalidSpanError('requested span not rectangular')
-            if a.left == b.left and a.right != b.right:
-                raise InvalidSpanError('requested span not rectangular')
-
-        def raise_on_tee_shaped(a, b):
-            top_most, other = (a, b) if a.top < b.top else (b, a)
-            if top_most.top < other.top and top_most.bottom > other.bottom:
-                raise InvalidSpanError('requested span not rectangular')
-
-            left_most, other = (a, b) if a.left < b.left else (b, a)
-            if left_most.left < other.left and left_most.right > other.right:
-                raise InvalidSpanError('requested span not rectangular')
-
-        raise_on_inverted_L(self, other_tc)
-        raise_on_tee_shaped(self, other_tc)
-
-        top = min(self.top, other_tc.top)
-        left = min(self.left, other_tc.left)
-        bottom = max(self.bottom, other_tc.bottom)
-        right = max(self.right, other_tc.right)
-
-        return top, left, bottom - top, right - left
+        return _span_dimensions(self, other_tc)
 
     def _span_to_width(self, grid_width, top_tc, vMerge):
         """
@@ -892,3 +977,189 @@ class CT_VMerge(BaseOxmlElement):
     ``<w:vMerge>`` element, specifying vertical merging behavior of a cell.
     """
     val = OptionalAttribute('w:val', ST_Merge, default=ST_Merge.CONTINUE)
+
+
+def _span_dimensions(a, b):
+    """
+    Return a (top, left, height, width) 4-tuple specifying the extents of the
+    merged cell formed by using *a* and *b* as opposite corner extents. *a*
+    and *b* each have `top`, `left`, `bottom` and `right` attributes, like
+    a |CT_Tc| element. Raises |InvalidSpanError| if the region they define is
+    not rectangular.
+    """
+    def raise_on_inverted_L(a, b):
+        if a.top == b.top and a.bottom != b.bottom:
+            raise InvalidSpanError('requested span not rectangular')
+        if a.left == b.left and a.right != b.right:
+            raise InvalidSpanError('requested span not rectangular')
+
+    def raise_on_tee_shaped(a, b):
+        top_most, other = (a, b) if a.top < b.top else (b, a)
+        if top_most.top < other.top and top_most.bottom > other.bottom:
+            raise InvalidSpanError('requested span not rectangular')
+
+        left_most, other = (a, b) if a.left < b.left else (b, a)
+        if left_most.left < other.left and left_most.right > other.right:
+            raise InvalidSpanError('requested span not rectangular')
+
+    raise_on_inverted_L(a, b)
+    raise_on_tee_shaped(a, b)
+
+    top = min(a.top, b.top)
+    left = min(a.left, b.left)
+    bottom = max(a.bottom, b.bottom)
+    right = max(a.right, b.right)
+
+    return top, left, bottom - top, right - left
+
+
+_TcExtents = namedtuple('_TcExtents', ('top', 'left', 'bottom', 'right'))
+
+
+class _TcGrid(object):
+    """
+    Index of the ``<w:tc>`` elements of a ``<w:tbl>`` element by layout-grid
+    position.
+
+    Rows are indexed top to bottom, once each and only as far down as the
+    queries made so far require. The index provides the row, grid column and
+    span extents of each cell without searching the XML, which is what makes
+    merging cells in a large table linear rather than quadratic. It is
+    updated as each merge is applied, so a batch of merges can be made
+    against a single instance.
+    """
+
+    def __init__(self, tbl):
+        self._tr_lst = tbl.tr_lst
+        self._reset()
+
+    def merge(self, tc, other_tc):
+        """
+        Return the top-left ``<w:tc>`` element of a new span formed by
+        merging the rectangular region defined by using *tc* and *other_tc*
+        as diagonal corners, as for :meth:`CT_Tc.merge`.
+        """
+        top, left, height, width = _span_dimensions(
+            self._extents(tc), self._extents(other_tc)
+        )
+        bottom = top + height
+        top_tc = self._tc_starting_at(top, left)
+        for row_idx in range(top, bottom):
+            row_tc = self._tc_starting_at(row_idx, left)
+            if height == 1:
+                vMerge = None
+            elif row_tc is top_tc:
+                vMerge = ST_Merge.RESTART
+            else:
+                vMerge = ST_Merge.CONTINUE
+            row_tc._span_to_width(width, top_tc, vMerge)
+            for grid_col in range(left, left + width):
+                self._tcs[(row_idx, grid_col)] = row_tc
+            self._origins[row_tc] = top_tc
+        self._bottoms[top_tc] = bottom
+
+        # ---a vertical span that continued below the merged region now
+        #    continues from a different cell, so start the index over---
+        self._index_through(bottom)
+        for grid_col in range(left, left + width):
+            tc_below = self._tcs.get((bottom, grid_col))
+            if tc_below is not None and tc_below.vMerge == ST_Merge.CONTINUE:
+                self._reset()
+                break
+
+        return top_tc
+
+    def tc_at(self, row_idx, col_idx):
+        """
+        Return the ``<w:tc>`` element that appears at grid position
+        (*row_idx*, *col_idx*), which is the top-left cell of its span when
+        that position is part of a merged cell. Raises |IndexError| if the
+        table has no cell at that position.
+        """
+        self._index_through(row_idx)
+        tc = self._tcs.get((row_idx, col_idx))
+        if tc is None:
+            raise IndexError(
+                'cell index (%d, %d) is out of range' % (row_idx, col_idx)
+            )
+        return self._origins[tc]
+
+    def _extents(self, tc):
+        """
+        Return a |_TcExtents| object describing the grid region covered by
+        the span *tc* belongs to.
+        """
+        while tc not in self._positions:
+            if self._row_count == len(self._tr_lst):
+                raise ValueError('cell is not in this table')
+            self._index_next_row()
+        origin = self._origins[tc]
+        # ---a vertical span is only known to have ended once the row below
+        #    it has been indexed---
+        while self._bottoms[origin] == self._row_count < len(self._tr_lst):
+            self._index_next_row()
+        grid_col = self._positions[tc][1]
+        return _TcExtents(
+            self._positions[origin][0], grid_col, self._bottoms[origin],
+            grid_col + tc.grid_span
+        )
+
+    def _index_next_row(self):
+        """
+        Add the first row not yet indexed to the index. Each ``<w:tc>``
+        element in it is mapped to its (row_idx, grid_col) position and to
+        the origin cell at the top of its vertical span, the origin to the
+        row index one past the bottom of that span, and each grid position
+        to the ``<w:tc>`` element covering it.
+        """
+        row_idx = self._row_count
+        grid_col = 0
+        for tc in self._tr_lst[row_idx].tc_lst:
+            tcPr = tc.tcPr
+            if tcPr is None:
+                grid_span, vMerge = 1, None
+            else:
+                grid_span, vMerge = tcPr.grid_span, tcPr.vMerge_val
+            tc_above = self._tcs.get((row_idx - 1, grid_col))
+            is_continuation = (
+                vMerge == ST_Merge.CONTINUE and
+                tc_above is not None and
+                self._positions[tc_above][1] == grid_col
+            )
+            origin = self._origins[tc_above] if is_continuation else tc
+            self._positions[tc] = (row_idx, grid_col)
+            self._origins[tc] = origin
+            self._bottoms[origin] = row_idx + 1
+            for col in range(grid_col, grid_col + grid_span):
+                self._tcs[(row_idx, col)] = tc
+            grid_col += grid_span
+        self._row_count += 1
+
+    def _index_through(self, row_idx):
+        """
+        Index rows up to and including the row at *row_idx*, or through the
+        last row when the table has fewer rows.
+        """
+        last_row_idx = min(row_idx, len(self._tr_lst) - 1)
+        while self._row_count <= last_row_idx:
+            self._index_next_row()
+
+    def _reset(self):
+        """
+        Discard the index, causing rows to be re-indexed from the current
+        table XML as they are needed.
+        """
+        self._tcs, self._positions = {}, {}
+        self._origins, self._bottoms = {}, {}
+        self._row_count = 0
+
+    def _tc_starting_at(self, row_idx, grid_col):
+        """
+        Return the ``<w:tc>`` element beginning at *grid_col* in the row at
+        *row_idx*. Raises |ValueError| if no cell begins at that position.
+        """
+        self._index_through(row_idx)
+        tc = self._tcs.get((row_idx, grid_col))
+        if tc is None or self._positions[tc][1] != grid_col:
+            raise ValueError('no cell on grid column %d' % grid_col)
+        return tc
@@ -4,9 +4,37 @@
 Custom element classes related to paragraphs (CT_P).
 """
 
-from ..ns import qn
+from lxml import etree
+
+from ..ns import nsmap, qn
 from ..xmlchemy import BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne
 
+_TAB = qn('w:tab')
+
+# ---text-bearing content of the runs of a paragraph, in document order; only
+#    runs that are direct children of the paragraph contribute, as for
+#    `Paragraph.runs`---
+_run_content = etree.XPath(
+    'w:r/w:t/text()|w:r/w:tab|w:r/w:br|w:r/w:cr',
+    namespaces={'w': nsmap['w']},
+    smart_strings=False,
+)
+
+
+def paragraph_text(p):
+    """
+    Return the text of the runs of `w:p` element *p*, with ``<w:tab/>``
+    translated to ``\t`` and ``<w:br/>`` and ``<w:cr/>`` to ``\n``, as
+    ``CT_R.text`` does for each run. Gathered with a single XPath query
+    rather than run by run. *p* need not be a |CT_P| object, so this also
+    serves `docx.fast`, which parses without the custom element classes.
+    """
+    return ''.join([
+        (('\t' if item.tag == _TAB else '\n')
+         if isinstance(item, etree._Element) else item)
+        for item in _run_content(p)
+    ])
+
 
 class CT_P(BaseOxmlElement):
     """
@@ -76,3 +104,11 @@ class CT_P(BaseOxmlElement):
     def style(self, style):
         pPr = self.get_or_add_pPr()
         pPr.style = style
+
+    @property
+    def text(self):
+        """
+        The text of the runs of this paragraph, as :func:`paragraph_text`
+        gathers it.
+        """
+        return paragraph_text(self)
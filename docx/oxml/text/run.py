@@ -10,6 +10,8 @@ from ..xmlchemy import (
     BaseOxmlElement, OptionalAttribute, ZeroOrMore, ZeroOrOne
 )
 
+_BR, _CR, _T, _TAB = qn('w:br'), qn('w:cr'), qn('w:t'), qn('w:tab')
+
 
 class CT_Br(BaseOxmlElement):
     """
@@ -87,16 +89,18 @@ class CT_R(BaseOxmlElement):
         child elements like ``<w:tab/>`` translated to their Python
         equivalent.
         """
-        text = ''
-        for child in self:
-            if child.tag == qn('w:t'):
+        pieces = []
+        for child in self.iterchildren(_T, _TAB, _BR, _CR):
+            tag = child.tag
+            if tag == _T:
                 t_text = child.text
-                text += t_text if t_text is not None else ''
-            elif child.tag == qn('w:tab'):
-                text += '\t'
-            elif child.tag in (qn('w:br'), qn('w:cr')):
-                text += '\n'
-        return text
+                if t_text is not None:
+                    pieces.append(t_text)
+            elif tag == _TAB:
+                pieces.append('\t')
+            else:
+                pieces.append('\n')
+        return ''.join(pieces)
 
     @text.setter
     def text(self, text):
@@ -93,7 +93,10 @@ class XmlString(Unicode):
 
 class MetaOxmlElement(type):
     """
-    Metaclass for BaseOxmlElement
+    Metaclass for BaseOxmlElement. Each child element and attribute
+    declared on a class computes its Clark name once here, when the class is
+    created, and binds it into the property and method functions it adds,
+    so accessing them does no string processing.
     """
     def __init__(cls, clsname, bases, clsdict):
         dispatchable = (
@@ -134,7 +137,7 @@ class BaseAttribute(object):
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
+    @lazyproperty
     def _clark_name(self):
         if ':' in self._attr_name:
             return qn(self._attr_name)
@@ -157,11 +160,14 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        from_xml = self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -184,13 +190,17 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        to_xml = self._simple_type.to_xml
+
         def set_attr_value(obj, value):
-            if value is None or value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value is None or value == default:
+                attrib = obj.attrib
+                if clark_name in attrib:
+                    del attrib[clark_name]
                 return
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = to_xml(value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -209,14 +219,17 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, attr_name = self._clark_name, self._attr_name
+        from_xml = self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" %
-                    (self._attr_name, obj.tag)
+                    (attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -237,9 +250,11 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name, to_xml = self._clark_name, self._simple_type.to_xml
+
         def set_attr_value(obj, value):
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = to_xml(value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -266,12 +281,15 @@ class _BaseChildElement(object):
         Add an ``_add_x()`` method to the element class for this child
         element.
         """
+        new_method_name = self._new_method_name
+        insert_method_name = self._insert_method_name
+
         def _add_child(obj, **attrs):
-            new_method = getattr(obj, self._new_method_name)
+            new_method = getattr(obj, new_method_name)
             child = new_method()
             for key, value in attrs.items():
                 setattr(child, key, value)
-            insert_method = getattr(obj, self._insert_method_name)
+            insert_method = getattr(obj, insert_method_name)
             insert_method(child)
             return child
 
@@ -307,8 +325,15 @@ class _BaseChildElement(object):
         Add an ``_insert_x()`` method to the element class for this child
         element.
         """
+        successor_clark_names = self._successor_clark_names
+
         def _insert_child(obj, child):
-            obj.insert_element_before(child, *self._successors)
+            for clark_name in successor_clark_names:
+                successor = obj.find(clark_name)
+                if successor is not None:
+                    successor.addprevious(child)
+                    return child
+            obj.append(child)
             return child
 
         _insert_child.__doc__ = (
@@ -334,8 +359,10 @@ class _BaseChildElement(object):
         """
         Add a public ``add_x()`` method to the parent element class.
         """
+        add_method_name = self._add_method_name
+
         def add_child(obj):
-            private_add_method = getattr(obj, self._add_method_name)
+            private_add_method = getattr(obj, add_method_name)
             child = private_add_method()
             return child
 
@@ -354,6 +381,14 @@ class _BaseChildElement(object):
             return
         setattr(self._element_cls, name, method)
 
+    @lazyproperty
+    def _clark_name(self):
+        """
+        The Clark-notation tag name of this child element, like
+        ``'{http://schemas.../main}p'`` for ``'w:p'``.
+        """
+        return qn(self._nsptagname)
+
     @property
     def _creator(self):
         """
@@ -371,8 +406,10 @@ class _BaseChildElement(object):
         descriptor. This default getter returns the child element with
         matching tag name or |None| if not present.
         """
+        clark_name = self._clark_name
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
         get_child_element.__doc__ = (
             '``<%s>`` child element or |None| if not present.'
             % self._nsptagname
@@ -389,8 +426,10 @@ class _BaseChildElement(object):
         Return a function object suitable for the "get" side of a list
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(clark_name)
         get_child_element_list.__doc__ = (
             'A list containing each of the ``<%s>`` child elements, in the o'
             'rder they appear.' % self._nsptagname
@@ -415,6 +454,15 @@ class _BaseChildElement(object):
     def _new_method_name(self):
         return '_new_%s' % self._prop_name
 
+    @property
+    def _successor_clark_names(self):
+        """
+        Tuple of the Clark-notation tag names of the elements that must
+        follow this child element, in the order they are searched for when
+        inserting it.
+        """
+        return tuple(qn(tagname) for tagname in self._successors)
+
 
 class Choice(_BaseChildElement):
     """
@@ -445,15 +493,17 @@ class Choice(_BaseChildElement):
         Add a ``get_or_change_to_x()`` method to the element class for this
         child element.
         """
+        prop_name = self._prop_name
+        remove_group_method_name = self._remove_group_method_name
+        add_method_name = self._add_method_name
+
         def get_or_change_to_child(obj):
-            child = getattr(obj, self._prop_name)
+            child = getattr(obj, prop_name)
             if child is not None:
                 return child
-            remove_group_method = getattr(
-                obj, self._remove_group_method_name
-            )
+            remove_group_method = getattr(obj, remove_group_method_name)
             remove_group_method()
-            add_method = getattr(obj, self._add_method_name)
+            add_method = getattr(obj, add_method_name)
             child = add_method()
             return child
 
@@ -507,12 +557,14 @@ class OneAndOnlyOne(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        clark_name, nsptagname = self._clark_name, self._nsptagname
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" %
-                    self._nsptagname
+                    nsptagname
                 )
             return child
 
@@ -583,10 +635,12 @@ class ZeroOrOne(_BaseChildElement):
         Add a ``get_or_add_x()`` method to the element class for this
         child element.
         """
+        prop_name, add_method_name = self._prop_name, self._add_method_name
+
         def get_or_add_child(obj):
-            child = getattr(obj, self._prop_name)
+            child = getattr(obj, prop_name)
             if child is None:
-                add_method = getattr(obj, self._add_method_name)
+                add_method = getattr(obj, add_method_name)
                 child = add_method()
             return child
         get_or_add_child.__doc__ = (
@@ -599,8 +653,11 @@ class ZeroOrOne(_BaseChildElement):
         Add a ``_remove_x()`` method to the element class for this child
         element.
         """
+        clark_name = self._clark_name
+
         def _remove_child(obj):
-            obj.remove_all(self._nsptagname)
+            for child in obj.findall(clark_name):
+                obj.remove(child)
         _remove_child.__doc__ = (
             'Remove all ``<%s>`` child elements.'
         ) % self._nsptagname
@@ -649,9 +706,12 @@ class ZeroOrOneChoice(_BaseChildElement):
         Add a ``_remove_eg_x()`` method to the element class for this choice
         group.
         """
+        clark_names = self._member_clark_names
+
         def _remove_choice_group(obj):
-            for tagname in self._member_nsptagnames:
-                obj.remove_all(tagname)
+            for clark_name in clark_names:
+                for child in obj.findall(clark_name):
+                    obj.remove(child)
 
         _remove_choice_group.__doc__ = (
             'Remove the current choice group child element if present.'
@@ -666,14 +726,28 @@ class ZeroOrOneChoice(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        clark_names = self._member_clark_names
+
         def get_group_member_element(obj):
-            return obj.first_child_found_in(*self._member_nsptagnames)
+            for clark_name in clark_names:
+                child = obj.find(clark_name)
+                if child is not None:
+                    return child
+            return None
         get_group_member_element.__doc__ = (
             'Return the child element belonging to this element group, or '
             '|None| if no member child is present.'
         )
         return get_group_member_element
 
+    @property
+    def _member_clark_names(self):
+        """
+        Tuple of Clark-notation tag names, one for each of the member
+        elements of this choice group.
+        """
+        return tuple(qn(tagname) for tagname in self._member_nsptagnames)
+
     @lazyproperty
     def _member_nsptagnames(self):
         """
@@ -9,7 +9,7 @@ from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.parts.image import ImagePart
-from docx.shared import lazyproperty
+from docx.shared import lazyproperty, proxy_caching_packages
 
 
 class Package(OpcPackage):
@@ -22,6 +22,21 @@ class Package(OpcPackage):
         """
         self._gather_image_parts()
 
+    @property
+    def cache_proxies(self):
+        """True when story parts in this package reuse proxy objects.
+
+        See `Document.cache_proxies`.
+        """
+        return self in proxy_caching_packages
+
+    @cache_proxies.setter
+    def cache_proxies(self, value):
+        if value:
+            proxy_caching_packages.add(self)
+        else:
+            proxy_caching_packages.discard(self)
+
     def get_or_add_image_part(self, image_descriptor):
         """Return |ImagePart| containing image specified by *image_descriptor*.
 
@@ -52,9 +67,14 @@ class ImageParts(object):
 
     def __init__(self):
         self._image_parts = []
+        self._image_part_set = set()
+        self._image_parts_by_sha1 = None
+        self._partname_numbers = set()
+        # ---every partname number less than this is known to be in use---
+        self._partname_floor = 1
 
     def __contains__(self, item):
-        return self._image_parts.__contains__(item)
+        return self._image_part_set.__contains__(item)
 
     def __iter__(self):
         return self._image_parts.__iter__()
@@ -64,6 +84,10 @@ class ImageParts(object):
 
     def append(self, item):
         self._image_parts.append(item)
+        self._image_part_set.add(item)
+        self._partname_numbers.add(item.partname.idx)
+        if self._image_parts_by_sha1 is not None:
+            self._image_parts_by_sha1.setdefault(item.sha1, item)
 
     def get_or_add_image_part(self, image_descriptor):
         """Return |ImagePart| object containing image identified by *image_descriptor*.
@@ -91,11 +115,17 @@ class ImageParts(object):
         """
         Return the image part in this collection having a SHA1 hash matching
         *sha1*, or |None| if not found.
+
+        The SHA1-to-image-part index is built on first use rather than when
+        the package is loaded, so opening a document does not read and hash
+        every image in it. From then on each image part is added to the
+        index as it is appended.
         """
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        if self._image_parts_by_sha1 is None:
+            self._image_parts_by_sha1 = {}
+            for image_part in self._image_parts:
+                self._image_parts_by_sha1.setdefault(image_part.sha1, image_part)
+        return self._image_parts_by_sha1.get(sha1)
 
     def _next_image_partname(self, ext):
         """
@@ -104,10 +134,8 @@ class ImageParts(object):
         partname is unique by number, without regard to the extension. *ext*
         does not include the leading period.
         """
-        def image_partname(n):
-            return PackURI('/word/media/image%d.%s' % (n, ext))
-        used_numbers = [image_part.partname.idx for image_part in self]
-        for n in range(1, len(self)+1):
-            if n not in used_numbers:
-                return image_partname(n)
-        return image_partname(len(self)+1)
+        n = self._partname_floor
+        while n in self._partname_numbers:
+            n += 1
+        self._partname_floor = n
+        return PackURI('/word/media/image%d.%s' % (n, ext))
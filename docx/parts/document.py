@@ -103,12 +103,16 @@ class DocumentPart(BaseStoryPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, compression=None, workers=None,
+             incremental=False):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object, using zlib
+        compression level *compression* when it is not |None| and a pool of
+        *workers* threads when that is not |None|. Unchanged parts are
+        copied without being compressed again when *incremental* is |True|.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, compression, workers, incremental)
 
     @property
     def settings(self):
@@ -11,8 +11,9 @@ from __future__ import (
 import hashlib
 
 from docx.image.image import Image
+from docx.opc.compat import release_view
 from docx.opc.part import Part
-from docx.shared import Emu, Inches
+from docx.shared import Emu, Inches, lazyproperty
 
 
 class ImagePart(Part):
@@ -24,6 +25,19 @@ class ImagePart(Part):
         super(ImagePart, self).__init__(partname, content_type, blob)
         self._image = image
 
+    @property
+    def blob(self):
+        """
+        The bytes of this image part. The bytes of an image part created from
+        an |Image| are those of the image, which are only read from the image
+        file when needed if the image was characterized with
+        :func:`docx.image.probe`.
+        """
+        if self._blob is None and self._source is None:
+            if self._image is not None:
+                return self._image.blob
+        return super(ImagePart, self).blob
+
     @property
     def default_cx(self):
         """
@@ -63,14 +77,27 @@ class ImagePart(Part):
     def from_image(cls, image, partname):
         """
         Return an |ImagePart| instance newly created from *image* and
-        assigned *partname*.
+        assigned *partname*. The part gets its bytes from *image*.
         """
-        return ImagePart(partname, image.content_type, image.blob, image)
+        return ImagePart(partname, image.content_type, None, image)
 
     @property
     def image(self):
+        """
+        |Image| object for the image in this part. The image of a part that
+        has not been read from a lazily opened package is characterized
+        from a view over the package file, which is mapped into memory where
+        possible, so the image bytes are only read if they are needed.
+        """
         if self._image is None:
-            self._image = Image.from_blob(self.blob)
+            if self._blob is None and not self.is_dirty:
+                view = self.map_blob()
+                try:
+                    self._image = Image.from_view(view, self._read_blob)
+                finally:
+                    release_view(view)
+            else:
+                self._image = Image.from_blob(self.blob)
         return self._image
 
     @classmethod
@@ -81,9 +108,25 @@ class ImagePart(Part):
         """
         return cls(partname, content_type, blob)
 
-    @property
+    @lazyproperty
     def sha1(self):
         """
-        SHA1 hash digest of the blob of this image part.
+        SHA1 hash digest of the blob of this image part. The digest is
+        computed only once because the blob of an image part never changes.
+        The bytes of a part not yet read from a lazily opened package are
+        hashed through a view, as for :attr:`image`.
+        """
+        if self._source is None and self._image is not None:
+            return self._image.sha1
+        view = self.map_blob()
+        try:
+            return hashlib.sha1(view).hexdigest()
+        finally:
+            release_view(view)
+
+    def _read_blob(self):
+        """
+        Return the bytes of this part, for an |Image| characterized without
+        them.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        return self.blob
@@ -4,11 +4,18 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from weakref import WeakValueDictionary
+
+from lxml import etree
+
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.part import XmlPart
 from docx.oxml.shape import CT_Inline
 from docx.shared import lazyproperty
 
+# ---True when some element in the XML has an `id` attribute equal to $id---
+_id_is_used = etree.XPath("boolean(//@id[. = $id])")
+
 
 class BaseStoryPart(XmlPart):
     """Base class for story parts.
@@ -18,6 +25,16 @@ class BaseStoryPart(XmlPart):
     `.add_paragraph()`, `.add_table()` etc.
     """
 
+    _reserved_id = 0
+    _proxy_cache = None
+    # ---the root element last scanned for id values, and the largest id value
+    #    found in it---
+    _id_scan_root = None
+    _max_scanned_id = 0
+    # ---last element of the XML, in document order, when id values were last
+    #    scanned or checked---
+    _id_check_mark = None
+
     def get_or_add_image(self, image_descriptor):
         """Return (rId, image) pair for image identified by *image_descriptor*.
 
@@ -56,8 +73,24 @@ class BaseStoryPart(XmlPart):
         rId, image = self.get_or_add_image(image_descriptor)
         cx, cy = image.scaled_dimensions(width, height)
         shape_id, filename = self.next_id, image.filename
+        self.reserve_id(shape_id)
         return CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
 
+    @property
+    def proxy_cache(self):
+        """Mapping of (element, parent) to the proxy object for that element.
+
+        |None| unless proxy caching is turned on for the package, as it is by
+        :attr:`.Document.cache_proxies`. Proxy objects like |Paragraph| and |Run| are
+        held only weakly, so an object is dropped from the cache once nothing else
+        refers to it.
+        """
+        if not self._package.cache_proxies:
+            return None
+        if self._proxy_cache is None:
+            self._proxy_cache = WeakValueDictionary()
+        return self._proxy_cache
+
     @property
     def next_id(self):
         """Next available positive integer id value in this story XML document.
@@ -65,14 +98,59 @@ class BaseStoryPart(XmlPart):
         The value is determined by incrementing the maximum existing id value. Gaps in
         the existing id sequence are not filled. The id attribute value is unique in the
         document, without regard to the element type it appears on.
+
+        The XML is scanned for existing id values only the first time, and again when
+        the root element of this part has been replaced. After that the value is kept
+        current by :meth:`reserve_id`. When the last element of the XML has changed,
+        as it does when content is appended to the XML directly, for example by
+        copying paragraphs from another document, the value is checked against the XML
+        and the XML is scanned again if the value is already in use. Content added
+        before the last element, as `.add_paragraph()` adds it, is not checked.
         """
-        id_str_lst = self._element.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        if not used_ids:
-            return 1
-        return max(used_ids) + 1
+        element = self._element
+        id_ = max(self._max_scanned_id_in(element), self._reserved_id) + 1
+        last = _last_element_in(element)
+        if last is not self._id_check_mark:
+            self._id_check_mark = last
+            if _id_is_used(element, id=id_):
+                self._id_scan_root = None
+                id_ = max(self._max_scanned_id_in(element), self._reserved_id) + 1
+        return id_
+
+    def reserve_id(self, id_):
+        """Prevent `.next_id` from returning *id_* or any lower value.
+
+        Called for each id allocated from `.next_id`. Also used when content is written
+        out of this part incrementally, so id values it carried are no longer present in
+        the XML but are still in use.
+        """
+        self._reserved_id = max(self._reserved_id, id_)
+
+    def _max_scanned_id_in(self, element):
+        """Return the largest integer id value in *element*, the root of this part.
+
+        The scan is done only when *element* is not the element last scanned.
+        """
+        if element is not self._id_scan_root:
+            id_str_lst = element.xpath('//@id')
+            used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
+            self._id_scan_root = element
+            self._id_check_mark = _last_element_in(element)
+            self._max_scanned_id = max(used_ids + [0])
+        return self._max_scanned_id
 
     @lazyproperty
     def _document_part(self):
         """|DocumentPart| object for this package."""
         return self.package.main_document_part
+
+
+def _last_element_in(element):
+    """Return the last element in *element*, in document order.
+
+    Only the last child at each level is visited, so this takes about as long as the
+    XML is deep rather than as long as it is.
+    """
+    while len(element):
+        element = element[-1]
+    return element
@@ -8,7 +8,7 @@ from collections import Sequence
 
 from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_HEADER_FOOTER
-from docx.shared import lazyproperty
+from docx.shared import lazyproperty, proxies_for, proxy_for
 
 
 class Sections(Sequence):
@@ -24,15 +24,16 @@ class Sections(Sequence):
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return [
-                Section(sectPr, self._document_part)
-                for sectPr in self._document_elm.sectPr_lst[key]
-            ]
-        return Section(self._document_elm.sectPr_lst[key], self._document_part)
+            return proxies_for(
+                Section, self._document_elm.sectPr_lst[key], self._document_part
+            )
+        return proxy_for(
+            Section, self._document_elm.sectPr_lst[key], self._document_part
+        )
 
     def __iter__(self):
         for sectPr in self._document_elm.sectPr_lst:
-            yield Section(sectPr, self._document_part)
+            yield proxy_for(Section, sectPr, self._document_part)
 
     def __len__(self):
         return len(self._document_elm.sectPr_lst)
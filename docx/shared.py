@@ -6,6 +6,8 @@ Objects shared by docx modules.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import weakref
+
 
 class Length(int):
     """
@@ -248,3 +250,67 @@ class Parented(object):
         The package part containing this object
         """
         return self._parent.part
+
+
+# ---packages whose story parts currently cache proxy objects. While there are
+#    none, which is the default, proxies are constructed without looking for
+#    the part they belong to---
+proxy_caching_packages = weakref.WeakSet()
+
+
+def proxy_for(proxy_cls, element, parent):
+    """
+    Return a *proxy_cls* object for *element*, constructed as
+    ``proxy_cls(element, parent)``. When the part *parent* belongs to caches
+    proxy objects, the object already created for *element* and *parent*, if
+    still in use, is returned instead.
+    """
+    if not proxy_caching_packages:
+        return proxy_cls(element, parent)
+    return cached_proxy(proxy_cache(parent), proxy_cls, element, parent)
+
+
+def proxies_for(proxy_cls, elements, parent):
+    """
+    Return a list containing a *proxy_cls* object for each of *elements*, in
+    the same order, reusing cached proxy objects as :func:`proxy_for` does.
+    """
+    cache = proxy_cache(parent)
+    if cache is None:
+        return [proxy_cls(element, parent) for element in elements]
+    return [
+        cached_proxy(cache, proxy_cls, element, parent)
+        for element in elements
+    ]
+
+
+def cached_proxy(cache, proxy_cls, element, parent):
+    """
+    Return the *proxy_cls* object for *element* and *parent* in *cache*,
+    newly created and added to *cache* if not present. A new object is
+    returned when *cache* is |None|. Lets a caller creating many proxies look
+    up *cache* just once, with :func:`proxy_cache`.
+    """
+    if cache is None:
+        return proxy_cls(element, parent)
+    # ---the key holds *element*, and so keeps its lxml proxy and that proxy's
+    #    identity, only as long as the cached object is alive. *parent* is
+    #    keyed by identity, which can't be reused by another object while the
+    #    cached object, which holds *parent*, is alive---
+    key = (element, id(parent))
+    proxy = cache.get(key)
+    if type(proxy) is not proxy_cls:
+        proxy = cache[key] = proxy_cls(element, parent)
+    return proxy
+
+
+def proxy_cache(parent):
+    """
+    Return the proxy cache of the part *parent* belongs to, or |None| if
+    that part does not cache proxy objects. The part is not looked for when
+    no package caches proxy objects.
+    """
+    if not proxy_caching_packages:
+        return None
+    part = getattr(parent, 'part', None)
+    return getattr(part, 'proxy_cache', None)
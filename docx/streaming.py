@@ -0,0 +1,239 @@
+# encoding: utf-8
+
+"""
+|StreamingDocument| object, for writing very large documents incrementally.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from lxml import etree
+
+from docx.api import Document
+from docx.enum.section import WD_SECTION
+from docx.opc.phys_pkg import PhysPkgWriter
+from docx.opc.pkgwriter import PackageWriter
+
+
+class StreamingDocument(object):
+    """
+    Write-only document that writes its body content to a package as it is
+    added.
+
+    Content is added with the same methods a |Document| object provides, like
+    :meth:`add_paragraph` and :meth:`add_table`, and each returns the usual
+    proxy object. That block item remains in memory, and so can be further
+    modified through its proxy, until the next block item is added or
+    :meth:`flush` is called. At that point it is written to the
+    ``word/document.xml`` member of the package and dropped, so memory use
+    stays flat no matter how long the document grows.
+
+    Intended to be used as a context manager::
+
+        with StreamingDocument('report.docx') as document:
+            for record in records:
+                document.add_paragraph(record.text)
+
+    The package is completed when the `with` block exits normally or when
+    :meth:`close` is called. When the `with` block exits with an exception,
+    the package is discarded instead, as by :meth:`abort`. *template* is
+    a path or file-like object for a `.docx` file providing styles, page
+    setup, headers, footers and any leading body content. The built-in
+    default template is used when *template* is |None|. *compression* is an
+    optional zlib compression level, as for :meth:`.Document.save`.
+    """
+
+    def __init__(self, path_or_stream, template=None, compression=None):
+        super(StreamingDocument, self).__init__()
+        self._document = Document(template)
+        self._phys_writer = PhysPkgWriter(path_or_stream, compression)
+        self._member = self._phys_writer.open(self._document.part.partname)
+        self._block_sink = _write_document_xml(self._member, self._document.element)
+        next(self._block_sink)
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+            return
+        self.close()
+
+    def abort(self):
+        """
+        Stop writing the package without completing it. A package being
+        written to a path is removed; a file-like object is left holding an
+        incomplete zip archive that can't be opened as a document. Calling
+        :meth:`abort` again, or after :meth:`close`, has no effect.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._block_sink.close()
+            self._member.close()
+        finally:
+            self._phys_writer.abort()
+
+    def add_heading(self, text="", level=1):
+        """
+        Return a heading paragraph newly added to the end of the document.
+        Behaves like :meth:`.Document.add_heading`.
+        """
+        self.flush()
+        return self._document.add_heading(text, level)
+
+    def add_page_break(self):
+        """
+        Return newly |Paragraph| object containing only a page break.
+        """
+        self.flush()
+        return self._document.add_page_break()
+
+    def add_paragraph(self, text='', style=None):
+        """
+        Return a paragraph newly added to the end of the document, populated
+        with *text* and having paragraph style *style*. Behaves like
+        :meth:`.Document.add_paragraph`.
+        """
+        self.flush()
+        return self._document.add_paragraph(text, style)
+
+    def add_picture(self, image_path_or_stream, width=None, height=None):
+        """
+        Return a new picture shape added in its own paragraph at the end of
+        the document. Behaves like :meth:`.Document.add_picture`.
+        """
+        self.flush()
+        return self._document.add_picture(image_path_or_stream, width, height)
+
+    def add_section(self, start_type=WD_SECTION.NEW_PAGE):
+        """
+        Return a |Section| object representing a new section added at the end
+        of the document. Behaves like :meth:`.Document.add_section`.
+        """
+        self.flush()
+        return self._document.add_section(start_type)
+
+    def add_table(self, rows, cols, style=None):
+        """
+        Return a table having *rows* rows and *cols* columns newly added to
+        the end of the document. Behaves like :meth:`.Document.add_table`.
+        """
+        self.flush()
+        return self._document.add_table(rows, cols, style)
+
+    def add_table_from_rows(self, rows, style=None, header=None):
+        """
+        Return a table newly added to the end of the document having a row
+        for each sequence of cell values in *rows*. Behaves like
+        :meth:`.Document.add_table_from_rows`.
+        """
+        self.flush()
+        return self._document.add_table_from_rows(rows, style, header)
+
+    def close(self):
+        """
+        Write any remaining body content, the document-level section
+        properties, and all the other parts of the package, then close the
+        package. Calling :meth:`close` again has no effect.
+        """
+        if self._closed:
+            return
+        self.flush()
+        sectPr = self._body.sectPr
+        if sectPr is not None:
+            self._write_block(sectPr)
+        self._block_sink.close()
+        self._member.close()
+
+        document_part = self._document.part
+        package = document_part.package
+        parts = package.parts
+        for part in parts:
+            part.before_marshal()
+        PackageWriter.write_streamed(
+            self._phys_writer, package.rels, parts, document_part
+        )
+        self._closed = True
+
+    @property
+    def core_properties(self):
+        """
+        A |CoreProperties| object providing read/write access to the core
+        properties of this document.
+        """
+        return self._document.core_properties
+
+    def flush(self):
+        """
+        Write the body content added so far to the package and drop it from
+        memory. Proxy objects for that content can no longer be used to
+        change the document once it has been flushed.
+        """
+        if self._closed:
+            raise ValueError("document is closed")
+        body = self._body
+        for block in [child for child in body if child is not body.sectPr]:
+            self._write_block(block)
+
+    @property
+    def settings(self):
+        """
+        A |Settings| object providing access to the document-level settings
+        for this document.
+        """
+        return self._document.settings
+
+    @property
+    def styles(self):
+        """
+        A |Styles| object providing access to the styles in this document.
+        """
+        return self._document.styles
+
+    @property
+    def _body(self):
+        """
+        The `w:body` element holding the not-yet-written content.
+        """
+        return self._document.element.body
+
+    def _write_block(self, block):
+        """
+        Remove *block* from the body and write it to the document member.
+        """
+        id_str_lst = block.xpath('.//@id')
+        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
+        if used_ids:
+            self._document.part.reserve_id(max(used_ids))
+        self._body.remove(block)
+        # ---once detached, a block redeclares every namespace in scope; drop the
+        #    ones it does not use---
+        etree.cleanup_namespaces(block)
+        self._block_sink.send(block)
+
+
+def _write_document_xml(stream, document):
+    """
+    Coroutine that writes the XML for *document* to *stream* incrementally.
+    The `w:document` and `w:body` start tags are written on the first
+    `next()` call. Each element subsequently sent is written as the next
+    child of `w:body`. Closing the coroutine writes the closing tags.
+    """
+    body = document.body
+    with etree.xmlfile(stream, encoding='UTF-8') as xf:
+        xf.write_declaration(standalone=True)
+        attrib, nsmap = dict(document.attrib), document.nsmap
+        with xf.element(document.tag, attrib=attrib, nsmap=nsmap):
+            for child in document:
+                if child is body:
+                    break
+                xf.write(child)
+            with xf.element(body.tag, attrib=dict(body.attrib)):
+                try:
+                    while True:
+                        xf.write((yield))
+                except GeneratorExit:
+                    pass
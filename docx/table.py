@@ -6,10 +6,19 @@ The |Table| object and related proxy classes.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import weakref
+
 from .blkcntnr import BlockItemContainer
 from .enum.style import WD_STYLE_TYPE
 from .oxml.simpletypes import ST_Merge
-from .shared import Inches, lazyproperty, Parented
+from .shared import (
+    cached_proxy, Inches, lazyproperty, Parented, proxies_for, proxy_cache, proxy_for
+)
+
+# ---count of the layout changes made through the API to each `w:tbl`
+#    element, shared by every |Table| object for that element so each can
+#    tell when its cached layout grid is stale---
+_layout_changes = weakref.WeakKeyDictionary()
 
 
 class Table(Parented):
@@ -19,6 +28,7 @@ class Table(Parented):
     def __init__(self, tbl, parent):
         super(Table, self).__init__(parent)
         self._element = self._tbl = tbl
+        self._cell_grid = self._cell_grid_key = None
 
     def add_column(self, width):
         """
@@ -31,8 +41,22 @@ class Table(Parented):
         for tr in self._tbl.tr_lst:
             tc = tr.add_tc()
             tc.width = width
+        self._invalidate_cells()
         return _Column(gridCol, self)
 
+    def append_rows(self, rows):
+        """
+        Add a row to the bottom of this table for each sequence of cell
+        values in *rows*, generating the XML for all of them in a single
+        pass. *rows* can be any iterable, including a generator. Each new
+        cell takes the width of its grid column and contains the text of its
+        value, or is empty when the value is |None|. Rows having fewer values
+        than the table has columns are padded with empty cells; a longer row
+        raises |ValueError| and no rows are added.
+        """
+        self._tbl.add_trs_from_rows(rows)
+        self._invalidate_cells()
+
     def add_row(self):
         """
         Return a |_Row| instance, newly added bottom-most to the table.
@@ -42,7 +66,8 @@ class Table(Parented):
         for gridCol in tbl.tblGrid.gridCol_lst:
             tc = tr.add_tc()
             tc.width = gridCol.w
-        return _Row(tr, self)
+        self._invalidate_cells()
+        return proxy_for(_Row, tr, self)
 
     @property
     def alignment(self):
@@ -88,6 +113,17 @@ class Table(Parented):
         idxs = range(column_idx, len(cells), self._column_count)
         return [cells[idx] for idx in idxs]
 
+    def iter_rows_text(self):
+        """
+        Generate a list for each row in this table, top to bottom, containing
+        the text of each cell in that row. A merged cell's text appears once
+        for each grid cell it spans, matching :meth:`row_cells`. Use
+        ``list(table.iter_rows_text())`` to get the table contents as a list
+        of lists.
+        """
+        for row_idx in range(len(self._tbl.tr_lst)):
+            yield [cell.text for cell in self.row_cells(row_idx)]
+
     @lazyproperty
     def columns(self):
         """
@@ -96,6 +132,25 @@ class Table(Parented):
         """
         return _Columns(self._tbl, self)
 
+    def merge_cells(self, regions):
+        """
+        Merge each rectangular region in *regions* and return a list of the
+        resulting merged |_Cell| objects. Each region is a (row_idx, col_idx,
+        row_idx_2, col_idx_2) 4-tuple giving the grid positions of two
+        diagonally opposite corner cells, so the region ``(0, 0, 1, 2)`` is
+        merged the same way as
+        ``table.cell(0, 0).merge(table.cell(1, 2))``. Regions are merged in
+        order, each against the layout left by those before it. The layout
+        grid is computed only once for the whole batch, so this is much
+        faster than merging many regions one at a time. Raises
+        |InvalidSpanError| if a region is not rectangular.
+        """
+        try:
+            tcs = self._tbl.merge_regions(regions)
+        finally:
+            self._invalidate_cells()
+        return proxies_for(_Cell, tcs, self)
+
     def row_cells(self, row_idx):
         """
         Sequence of cells in the row at *row_idx* in this table.
@@ -163,9 +218,30 @@ class Table(Parented):
         """
         A sequence of |_Cell| objects, one for each cell of the layout grid.
         If the table contains a span, one or more |_Cell| object references
-        are repeated.
+        are repeated. The grid is computed on first access and reused until
+        the layout of the table is changed through any |Table| or |_Cell|
+        object for it, or a row or cell is added or removed in the XML.
+        """
+        key = self._layout_key()
+        if self._cell_grid is None or key != self._cell_grid_key:
+            self._cell_grid = self._compute_cells()
+            self._cell_grid_key = key
+        return self._cell_grid
+
+    @property
+    def _column_count(self):
+        """
+        The number of grid columns in this table.
+        """
+        return self._tbl.col_count
+
+    def _compute_cells(self):
+        """
+        Return a new list of |_Cell| objects, one for each cell of the layout
+        grid, computed from the current table XML.
         """
         col_count = self._column_count
+        cache = proxy_cache(self)
         cells = []
         for tc in self._tbl.iter_tcs():
             for grid_span_idx in range(tc.grid_span):
@@ -174,15 +250,32 @@ class Table(Parented):
                 elif grid_span_idx > 0:
                     cells.append(cells[-1])
                 else:
-                    cells.append(_Cell(tc, self))
+                    cells.append(cached_proxy(cache, _Cell, tc, self))
         return cells
 
-    @property
-    def _column_count(self):
+    def _invalidate_cells(self):
         """
-        The number of grid columns in this table.
+        Mark the cached layout grid of every |Table| object for this table
+        as stale, causing it to be recomputed on next access. Called when the
+        number or span of the cells in this table changes.
         """
-        return self._tbl.col_count
+        tbl = self._tbl
+        _layout_changes[tbl] = _layout_changes.get(tbl, 0) + 1
+
+    def _layout_key(self):
+        """
+        Return a value that changes when the layout of this table may have
+        changed. Besides the changes made through the API, it reflects the
+        number of rows and the last cell, which are checked in constant time,
+        so rows and cells added or removed in the XML are noticed too.
+        """
+        tbl = self._tbl
+        last_child = tbl[-1] if len(tbl) else None
+        last_tc = (
+            last_child[-1] if last_child is not None and len(last_child)
+            else None
+        )
+        return (_layout_changes.get(tbl, 0), len(tbl), last_tc)
 
     @property
     def _tblPr(self):
@@ -222,6 +315,21 @@ class _Cell(BlockItemContainer):
         self.add_paragraph()
         return table
 
+    def add_table_from_rows(self, rows, style=None, header=None):
+        """
+        Return a table newly added to this cell after any existing cell
+        content, having a row for each sequence of cell values in *rows*.
+        An empty paragraph is added after the table, as for
+        :meth:`add_table`. See :meth:`.BlockItemContainer.add_table_from_rows`
+        for details.
+        """
+        width = self.width if self.width is not None else Inches(1)
+        table = super(_Cell, self).add_table_from_rows(
+            rows, width, style, header
+        )
+        self.add_paragraph()
+        return table
+
     def merge(self, other_cell):
         """
         Return a merged cell created by spanning the rectangular region
@@ -229,8 +337,11 @@ class _Cell(BlockItemContainer):
         |InvalidSpanError| if the cells do not define a rectangular region.
         """
         tc, tc_2 = self._tc, other_cell._tc
-        merged_tc = tc.merge(tc_2)
-        return _Cell(merged_tc, self._parent)
+        try:
+            merged_tc = tc.merge(tc_2)
+        finally:
+            self._parent.table._invalidate_cells()
+        return proxy_for(_Cell, merged_tc, self._parent)
 
     @property
     def paragraphs(self):
@@ -456,7 +567,7 @@ class _Rows(Parented):
         return list(self)[idx]
 
     def __iter__(self):
-        return (_Row(tr, self) for tr in self._tbl.tr_lst)
+        return (proxy_for(_Row, tr, self) for tr in self._tbl.tr_lst)
 
     def __len__(self):
         return len(self._tbl.tr_lst)
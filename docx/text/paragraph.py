@@ -11,7 +11,7 @@ from __future__ import (
 from ..enum.style import WD_STYLE_TYPE
 from .parfmt import ParagraphFormat
 from .run import Run
-from ..shared import Parented
+from ..shared import Parented, proxies_for, proxy_for
 
 
 class Paragraph(Parented):
@@ -32,7 +32,7 @@ class Paragraph(Parented):
         break.
         """
         r = self._p.add_r()
-        run = Run(r, self)
+        run = proxy_for(Run, r, self)
         if text:
             run.text = text
         if style:
@@ -90,7 +90,7 @@ class Paragraph(Parented):
         Sequence of |Run| instances corresponding to the <w:r> elements in
         this paragraph.
         """
-        return [Run(r, self) for r in self._p.r_lst]
+        return proxies_for(Run, self._p.r_lst, self)
 
     @property
     def style(self):
@@ -126,10 +126,7 @@ class Paragraph(Parented):
         Paragraph-level formatting, such as style, is preserved. All
         run-level formatting, such as bold or italic, is removed.
         """
-        text = ''
-        for run in self.runs:
-            text += run.text
-        return text
+        return self._p.text
 
     @text.setter
     def text(self, text):
@@ -142,4 +139,4 @@ class Paragraph(Parented):
         paragraph.
         """
         p = self._p.add_p_before()
-        return Paragraph(p, self._parent)
+        return proxy_for(Paragraph, p, self._parent)
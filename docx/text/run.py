@@ -51,7 +51,9 @@ class Run(Parented):
         Return an |InlineShape| instance containing the image identified by
         *image_path_or_stream*, added to the end of this run.
         *image_path_or_stream* can be a path (a string) or a file-like object
-        containing a binary image. If neither width nor height is specified,
+        containing a binary image, or an |Image| object returned by
+        :func:`docx.image.probe`, which defers reading the image bytes until
+        the document is saved. If neither width nor height is specified,
         the picture appears at its native size. If only one is specified, it
         is used to compute a scaling factor that is then applied to the
         unspecified dimension, preserving the aspect ratio of the image. The
@@ -4,13 +4,22 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import hashlib
+import os
+
 import pytest
 
 from docx.compat import BytesIO
 from docx.image.bmp import Bmp
 from docx.image.exceptions import UnrecognizedImageError
 from docx.image.gif import Gif
-from docx.image.image import BaseImageHeader, Image, _ImageHeaderFactory
+from docx.image.image import (
+    BaseImageHeader,
+    _BufferStream,
+    Image,
+    _ImageHeaderFactory,
+    probe,
+)
 from docx.image.jpeg import Exif, Jfif
 from docx.image.png import Png
 from docx.image.tiff import Tiff
@@ -54,6 +63,10 @@ class DescribeImage(object):
         _from_stream_.assert_called_once_with(image_stream, blob, None)
         assert image is image_
 
+    def it_returns_an_Image_instance_unchanged_from_file(self):
+        image = Image(b'fO0Bar', None, None)
+        assert Image.from_file(image) is image
+
     def it_can_construct_from_an_image_stream(self, from_stream_fixture):
         stream_, blob_, filename_in = from_stream_fixture[:3]
         _ImageHeaderFactory_, image_header_ = from_stream_fixture[3:5]
@@ -65,6 +78,20 @@ class DescribeImage(object):
         Image__init_.assert_called_once_with(ANY, blob_, filename_out, image_header_)
         assert isinstance(image, Image)
 
+    def it_can_construct_from_a_view_of_an_image(self):
+        with open(test_file('monty-truth.png'), 'rb') as f:
+            blob = f.read()
+        view = memoryview(blob)
+
+        image = Image.from_view(view, lambda: blob)
+
+        assert image.content_type == CT.PNG
+        assert (image.px_width, image.px_height) == (150, 214)
+        assert image.filename == 'image.png'
+        assert image._blob is None
+        assert image.blob is blob
+        assert image.sha1 == hashlib.sha1(blob).hexdigest()
+
     def it_provides_access_to_the_image_blob(self):
         blob = b'foobar'
         image = Image(blob, None, None)
@@ -130,6 +157,30 @@ class DescribeImage(object):
             assert image.horz_dpi == horz_dpi
             assert image.vert_dpi == vert_dpi
 
+    def it_can_probe_an_image_file_without_loading_it(
+        self, known_image_fixture
+    ):
+        image_path, characteristics = known_image_fixture
+        content_type, px_width, px_height, horz_dpi, vert_dpi = (
+            characteristics[1:]
+        )
+        path = test_file(image_path)
+        with open(path, 'rb') as f:
+            blob = f.read()
+
+        image = probe(path)
+
+        assert image._blob is None
+        assert image.filename == image_path
+        assert image.content_type == content_type
+        assert image.px_width == px_width
+        assert image.px_height == px_height
+        assert image.horz_dpi == horz_dpi
+        assert image.vert_dpi == vert_dpi
+        assert image.sha1 == hashlib.sha1(blob).hexdigest()
+        assert image.blob == blob
+        assert image._blob is None
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -270,6 +321,21 @@ class DescribeImage(object):
         return property_mock(request, Image, 'width')
 
 
+class Describe_BufferStream(object):
+
+    def it_reads_a_view_like_a_file(self):
+        stream = _BufferStream(memoryview(b'foobar'))
+
+        assert stream.read(3) == b'foo'
+        assert stream.tell() == 3
+        assert stream.seek(-2, os.SEEK_END) == 4
+        assert stream.read() == b'ar'
+        assert stream.read(1) == b''
+        stream.seek(1)
+        stream.seek(1, os.SEEK_CUR)
+        assert stream.read(8) == b'obar'
+
+
 class Describe_ImageHeaderFactory(object):
 
     def it_constructs_the_right_class_for_a_given_image_stream(
@@ -309,14 +309,22 @@ class Describe_ChunkParser(object):
             return_value=iter(chunk_offsets)
         )
 
-    @pytest.fixture
-    def iter_offsets_fixture(self):
-        bytes_ = b'-filler-\x00\x00\x00\x00IHDRxxxx\x00\x00\x00\x00IEND'
+    @pytest.fixture(params=[
+        (b'IEND', PNG_CHUNK_TYPE.IEND),
+        # ---iteration stops at the image data, ignoring what follows it---
+        (b'IDAT\xff\xff\xff\xff', PNG_CHUNK_TYPE.IDAT),
+    ])
+    def iter_offsets_fixture(self, request):
+        last_chunk_bytes, last_chunk_type = request.param
+        bytes_ = (
+            b'-filler-\x00\x00\x00\x00IHDRxxxx\x00\x00\x00\x00' +
+            last_chunk_bytes
+        )
         stream_rdr = StreamReader(BytesIO(bytes_), BIG_ENDIAN)
         chunk_parser = _ChunkParser(stream_rdr)
         expected_chunk_offsets = [
             (PNG_CHUNK_TYPE.IHDR, 16),
-            (PNG_CHUNK_TYPE.IEND, 28),
+            (last_chunk_type, 28),
         ]
         return chunk_parser, expected_chunk_offsets
 
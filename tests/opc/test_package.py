@@ -6,6 +6,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from zipfile import ZipFile
+
+from docx.api import Document
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
 from docx.opc.package import OpcPackage, Unmarshaller
@@ -13,7 +16,9 @@ from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.part import Part
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
+from docx.opc.phys_pkg import _ZipPkgReader
 from docx.opc.rel import _Relationship, Relationships
+from ..unitutil.file import docx_path
 
 from ..unitutil.mock import (
     call,
@@ -38,11 +43,102 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
+        PackageReader_.from_file.assert_called_once_with(
+            pkg_file, False, None
+        )
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
-                                                        PartFactory_)
+                                                        PartFactory_, None)
+        assert isinstance(pkg, OpcPackage)
+
+    def it_can_open_a_pkg_file_using_worker_threads(
+        self, PackageReader_, PartFactory_, Unmarshaller_
+    ):
+        pkg_file = Mock(name='pkg_file')
+        pkg_reader = PackageReader_.from_file.return_value
+
+        pkg = OpcPackage.open(pkg_file, workers=4)
+
+        PackageReader_.from_file.assert_called_once_with(pkg_file, False, 4)
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            pkg_reader, pkg, PartFactory_, 4
+        )
+
+    def it_ignores_workers_when_opening_lazily(
+        self, PackageReader_, PartFactory_, Unmarshaller_
+    ):
+        pkg_file = Mock(name='pkg_file')
+        pkg_reader = PackageReader_.from_file.return_value
+
+        pkg = OpcPackage.open(pkg_file, lazy=True, workers=4)
+
+        PackageReader_.from_file.assert_called_once_with(pkg_file, True, None)
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            pkg_reader, pkg, PartFactory_, None
+        )
+
+    def it_requires_concurrent_futures_to_use_worker_threads(
+        self, request, PackageReader_
+    ):
+        patch_ = patch('docx.opc.package.futures', None)
+        request.addfinalizer(patch_.stop)
+        patch_.start()
+
+        with pytest.raises(RuntimeError):
+            OpcPackage.open(Mock(name='pkg_file'), workers=4)
+        assert PackageReader_.from_file.call_count == 0
+
+    def it_opens_the_same_package_with_or_without_worker_threads(self):
+        pkg = OpcPackage.open(docx_path('test'))
+        concurrent_pkg = OpcPackage.open(docx_path('test'), workers=4)
+
+        assert [
+            (part.partname, type(part), part.blob) for part in pkg.parts
+        ] == [
+            (part.partname, type(part), part.blob)
+            for part in concurrent_pkg.parts
+        ]
+
+    def it_can_be_created_from_a_package_snapshot(
+        self, PartFactory_, Unmarshaller_
+    ):
+        snapshot = Mock(name='snapshot')
+
+        pkg = OpcPackage.from_snapshot(snapshot)
+
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            snapshot, pkg, PartFactory_
+        )
         assert isinstance(pkg, OpcPackage)
 
+    def it_can_clone_itself(self):
+        # +----------+       +--------+       +--------+
+        # | pkg_rels |-----> | part_1 |-----> | part_2 |
+        # +----------+       +--------+       +--------+
+        #                        |  ^-------------'
+        #                        v
+        #                     external
+        pkg = OpcPackage()
+        part_1 = Part(PackURI('/part/1.xml'), 'ct1', b'blob1', pkg)
+        part_2 = Part(PackURI('/part/2.png'), 'ct2', b'blob2', pkg)
+        pkg.load_rel(RT.OFFICE_DOCUMENT, part_1, 'rId1')
+        part_1.load_rel(RT.IMAGE, part_2, 'rId3')
+        part_1.load_rel(RT.HYPERLINK, 'https://foo.com', 'rId7', True)
+        part_2.load_rel(RT.IMAGE, part_1, 'rId2')
+
+        clone = pkg.clone()
+
+        assert type(clone) is OpcPackage
+        clone_1 = clone.part_related_by(RT.OFFICE_DOCUMENT)
+        clone_2 = clone_1.related_parts['rId3']
+        assert clone_1 is not part_1 and clone_2 is not part_2
+        assert (clone_1.partname, clone_1.blob) == ('/part/1.xml', b'blob1')
+        assert (clone_2.partname, clone_2.blob) == ('/part/2.png', b'blob2')
+        assert clone_1.package is clone and clone_2.package is clone
+        assert clone_1.rels['rId7'].target_ref == 'https://foo.com'
+        assert clone_1.rels['rId7'].is_external
+        assert clone_2.related_parts['rId2'] is clone_1
+        assert len(clone.rels) == 1 and len(clone_1.rels) == 2
+
     def it_initializes_its_rels_collection_on_first_reference(
             self, Relationships_):
         pkg = OpcPackage()
@@ -128,9 +224,52 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, None, None, False
         )
 
+    def it_detaches_lazy_parts_before_saving_over_their_source(
+            self, pkg_file_, PackageWriter_, parts, parts_):
+        part_, part_2_ = parts_
+        part_.source.reads_from.return_value = True
+        part_2_.source.reads_from.return_value = False
+        pkg = OpcPackage()
+
+        pkg.save(pkg_file_)
+
+        part_.source.reads_from.assert_called_once_with(pkg_file_)
+        part_.load_blob.assert_called_once_with(keep_raw=False)
+        assert part_2_.load_blob.call_count == 0
+
+    def it_keeps_the_compressed_form_of_lazy_parts_when_incremental(
+            self, pkg_file_, PackageWriter_, parts, parts_):
+        part_, part_2_ = parts_
+        part_.source.reads_from.return_value = True
+        part_2_.source.reads_from.return_value = False
+        pkg = OpcPackage()
+
+        pkg.save(pkg_file_, incremental=True)
+
+        part_.load_blob.assert_called_once_with(keep_raw=True)
+        PackageWriter_.write.assert_called_once_with(
+            pkg_file_, pkg._rels, parts_, None, None, True
+        )
+
+    def it_rewrites_only_changed_parts_when_saving_incrementally(
+            self, tmpdir):
+        path = str(tmpdir.join('stamped.docx'))
+        Document().save(path)
+        raw_members = _raw_members(path)
+        document = Document(path, lazy=True)
+        document.core_properties.title = 'stamped'
+
+        document.save(path, incremental=True)
+
+        assert [
+            name for name, raw_bytes in _raw_members(path).items()
+            if raw_bytes != raw_members[name]
+        ] == ['docProps/core.xml']
+        assert Document(path).core_properties.title == 'stamped'
+
     def it_provides_access_to_the_core_properties(self, core_props_fixture):
         opc_package, core_properties_ = core_props_fixture
         core_properties = opc_package.core_properties
@@ -335,6 +474,48 @@ class DescribeUnmarshaller(object):
             part.after_unmarshal.assert_called_once_with()
         pkg_.after_unmarshal.assert_called_once_with()
 
+    def it_can_unmarshal_using_worker_threads(
+        self,
+        pkg_reader_,
+        pkg_,
+        part_factory_,
+        _unmarshal_parts_concurrently_,
+        _unmarshal_relationships_,
+        parts_dict_,
+    ):
+        _unmarshal_parts_concurrently_.return_value = parts_dict_
+
+        Unmarshaller.unmarshal(pkg_reader_, pkg_, part_factory_, 4)
+
+        _unmarshal_parts_concurrently_.assert_called_once_with(
+            pkg_reader_, pkg_, part_factory_, 4
+        )
+        _unmarshal_relationships_.assert_called_once_with(
+            pkg_reader_, pkg_, parts_dict_
+        )
+
+    def it_can_unmarshal_parts_concurrently(
+        self, pkg_reader_, pkg_, part_factory_, parts_dict_, partnames_,
+        content_types_, reltypes_, blobs_
+    ):
+        part_factory_.side_effect = (
+            lambda partname, content_type, reltype, blob, package:
+            parts_dict_[partname]
+        )
+
+        parts = Unmarshaller._unmarshal_parts_concurrently(
+            pkg_reader_, pkg_, part_factory_, 2
+        )
+
+        assert sorted(part_factory_.call_args_list, key=str) == sorted([
+            call(partnames_[0], content_types_[0], reltypes_[0], blobs_[0],
+                 pkg_),
+            call(partnames_[1], content_types_[1], reltypes_[1], blobs_[1],
+                 pkg_),
+        ], key=str)
+        assert parts == parts_dict_
+        assert list(parts) == list(partnames_)
+
     def it_can_unmarshal_parts(
             self, pkg_reader_, pkg_, part_factory_, parts_dict_, partnames_,
             content_types_, reltypes_, blobs_):
@@ -456,8 +637,31 @@ class DescribeUnmarshaller(object):
     def _unmarshal_parts_(self, request):
         return method_mock(request, Unmarshaller, '_unmarshal_parts', autospec=False)
 
+    @pytest.fixture
+    def _unmarshal_parts_concurrently_(self, request):
+        return method_mock(
+            request, Unmarshaller, '_unmarshal_parts_concurrently',
+            autospec=False
+        )
+
     @pytest.fixture
     def _unmarshal_relationships_(self, request):
         return method_mock(
             request, Unmarshaller, '_unmarshal_relationships', autospec=False
         )
+
+
+# helpers ------------------------------------------------------------
+
+
+def _raw_members(path):
+    """Return a membername: compressed-bytes dict for the zip file at *path*."""
+    with ZipFile(path) as zipf:
+        membernames = zipf.namelist()
+    phys_reader = _ZipPkgReader(path)
+    raw_members = dict(
+        (name, phys_reader.raw_member_for(PackURI('/%s' % name))[1])
+        for name in membernames
+    )
+    phys_reader.close()
+    return raw_members
@@ -6,9 +6,11 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from docx.compat import BytesIO
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part, PartFactory, XmlPart
+from docx.opc.pkgreader import DeferredBlob, SnapshotBlob
 from docx.opc.rel import _Relationship, Relationships
 from docx.oxml.xmlchemy import BaseOxmlElement
 
@@ -62,6 +64,83 @@ class DescribePart(object):
         part, load_blob = blob_fixture
         assert part.blob is load_blob
 
+    def it_reads_a_deferred_blob_on_first_access(self, deferred_blob_):
+        deferred_blob_.read.return_value = b'foobar'
+        part = Part(None, None, deferred_blob_, None)
+
+        blob = part.blob
+        blob_again = part.blob
+
+        deferred_blob_.read.assert_called_once_with()
+        assert blob == blob_again == b'foobar'
+
+    def it_can_map_its_blob(self, deferred_blob_):
+        part = Part(None, None, deferred_blob_, None)
+
+        view = part.map_blob()
+
+        deferred_blob_.view.assert_called_once_with()
+        assert view is deferred_blob_.view.return_value
+        assert deferred_blob_.read.call_count == 0
+        assert Part(None, None, b'foobar', None).map_blob() == b'foobar'
+
+    def it_is_clean_while_it_has_a_source_to_copy_from(self, deferred_blob_):
+        deferred_blob_.read.return_value = b'foobar'
+        part = Part(None, None, deferred_blob_, None)
+
+        assert part.is_dirty is False
+        part.blob
+        assert part.is_dirty is False
+        assert part.source is deferred_blob_
+
+    def it_can_detach_from_its_source(self, deferred_blob_):
+        deferred_blob_.read.return_value = b'foobar'
+        part = Part(None, None, deferred_blob_, None)
+
+        part.load_blob()
+
+        assert part.source is None
+        assert part.is_dirty is True
+        assert part.blob == b'foobar'
+
+    def it_can_keep_the_compressed_form_when_detaching(self, deferred_blob_):
+        deferred_blob_.read.return_value = b'foobar'
+        deferred_blob_.read_raw.return_value = ('zinfo', b'raw')
+        part = Part(None, None, deferred_blob_, None)
+
+        part.load_blob(keep_raw=True)
+
+        assert isinstance(part.source, SnapshotBlob)
+        assert part.source.read_raw() == ('zinfo', b'raw')
+        assert part.blob == b'foobar'
+        assert part.is_dirty is False
+
+    def it_can_clone_itself_sharing_an_unchanged_source(
+        self, deferred_blob_, package_
+    ):
+        part = Part(PackURI('/foo.bin'), 'ct', deferred_blob_, None)
+
+        clone = part.clone(package_)
+
+        assert type(clone) is Part
+        assert clone.partname == '/foo.bin'
+        assert clone.content_type == 'ct'
+        assert clone.package is package_
+        assert clone.source is deferred_blob_
+        assert deferred_blob_.read.call_count == 0
+
+    def it_can_clone_itself_copying_a_changed_blob(self, package_):
+        part = Part(PackURI('/foo.bin'), 'ct', b'foobar', None)
+
+        clone = part.clone(package_)
+
+        assert clone.blob == b'foobar'
+        assert clone.source is None
+
+    def it_is_dirty_when_it_was_not_lazily_loaded(self, blob_fixture):
+        part, _ = blob_fixture
+        assert part.is_dirty is True
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -108,6 +187,10 @@ class DescribePart(object):
     def content_type_(self, request):
         return instance_mock(request, str)
 
+    @pytest.fixture
+    def deferred_blob_(self, request):
+        return instance_mock(request, DeferredBlob)
+
     @pytest.fixture
     def __init_(self, request):
         return initializer_mock(request, Part)
@@ -454,6 +537,100 @@ class DescribeXmlPart(object):
         xml_part = part_fixture
         assert xml_part.part is xml_part
 
+    def it_defers_parsing_a_deferred_blob_until_first_access(
+        self, deferred_blob_, element_, parse_xml_
+    ):
+        deferred_blob_.read.return_value = b'<foo/>'
+
+        xml_part = XmlPart.load(None, None, deferred_blob_, None)
+
+        assert parse_xml_.call_count == 0
+        assert xml_part.element is element_
+        assert xml_part.element is element_
+        parse_xml_.assert_called_once_with(b'<foo/>')
+        deferred_blob_.read.assert_called_once_with()
+
+    def it_copies_its_element_from_a_snapshot_blob(
+        self, snapshot_blob_, element_, parse_xml_
+    ):
+        snapshot_blob_.copy_element.return_value = element_
+
+        xml_part = XmlPart.load(None, None, snapshot_blob_, None)
+
+        assert xml_part.element is element_
+        assert xml_part.element is element_
+        snapshot_blob_.copy_element.assert_called_once_with()
+        assert parse_xml_.call_count == 0
+
+    def it_passes_an_unparsed_blob_through_unchanged(
+        self, deferred_blob_, parse_xml_, serialize_part_xml_
+    ):
+        deferred_blob_.read.return_value = b'<foo/>'
+        xml_part = XmlPart.load(None, None, deferred_blob_, None)
+
+        blob = xml_part.blob
+
+        assert blob == b'<foo/>'
+        assert parse_xml_.call_count == 0
+        assert serialize_part_xml_.call_count == 0
+
+    def it_maps_its_serialized_xml_once_parsed(
+        self, deferred_blob_, parse_xml_, serialize_part_xml_
+    ):
+        serialize_part_xml_.return_value = b'<bar/>'
+        xml_part = XmlPart.load(None, None, deferred_blob_, None)
+        assert xml_part.map_blob() is deferred_blob_.view.return_value
+
+        xml_part.element
+
+        assert xml_part.map_blob() == b'<bar/>'
+
+    def it_can_write_its_blob_to_a_stream(self):
+        xml_part = XmlPart.load(None, None, b'<foo><bar/></foo>', None)
+        stream = BytesIO()
+
+        xml_part.write_blob(stream)
+
+        assert stream.getvalue() == xml_part.blob
+
+    def it_writes_an_unparsed_blob_through_unchanged(
+        self, deferred_blob_, serialize_part_xml_
+    ):
+        deferred_blob_.read.return_value = b'<foo/>'
+        xml_part = XmlPart.load(None, None, deferred_blob_, None)
+        stream = BytesIO()
+
+        xml_part.write_blob(stream)
+
+        assert stream.getvalue() == b'<foo/>'
+        assert xml_part.is_dirty is False
+
+    def it_becomes_dirty_once_its_xml_is_parsed(
+        self, deferred_blob_, parse_xml_
+    ):
+        deferred_blob_.read.return_value = b'<foo/>'
+        xml_part = XmlPart.load(None, None, deferred_blob_, None)
+        assert xml_part.is_dirty is False
+
+        xml_part.element
+
+        assert xml_part.is_dirty is True
+
+    @pytest.mark.parametrize('keep_raw', (False, True))
+    def it_drops_the_source_of_parsed_xml_when_detaching(
+        self, keep_raw, deferred_blob_, parse_xml_
+    ):
+        deferred_blob_.read.return_value = b'<foo/>'
+        xml_part = XmlPart.load(None, None, deferred_blob_, None)
+        xml_part.element
+
+        xml_part.load_blob(keep_raw)
+
+        assert xml_part.source is None
+        assert xml_part._blob is None
+        assert deferred_blob_.read.call_count == 1
+        assert deferred_blob_.read_raw.call_count == 0
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -475,6 +652,10 @@ class DescribeXmlPart(object):
     def content_type_(self, request):
         return instance_mock(request, str)
 
+    @pytest.fixture
+    def deferred_blob_(self, request):
+        return instance_mock(request, DeferredBlob)
+
     @pytest.fixture
     def element_(self, request):
         return instance_mock(request, BaseOxmlElement)
@@ -502,3 +683,7 @@ class DescribeXmlPart(object):
         return function_mock(
             request, 'docx.opc.part.serialize_part_xml'
         )
+
+    @pytest.fixture
+    def snapshot_blob_(self, request):
+        return instance_mock(request, SnapshotBlob)
@@ -11,19 +11,26 @@ try:
 except ImportError:
     from StringIO import StringIO as BytesIO
 
+import copy
 import hashlib
+import mmap
+import os
 import pytest
 
-from zipfile import ZIP_DEFLATED, ZipFile
+import struct
+import sys
+
+from zipfile import BadZipfile, is_zipfile, ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from docx.opc.exceptions import PackageNotFoundError
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _SpillingZipMember,
+    _ZipPkgReader, _ZipPkgWriter
 )
 
 from ..unitutil.file import absjoin, test_file_dir
-from ..unitutil.mock import class_mock, loose_mock, Mock
+from ..unitutil.mock import class_mock, loose_mock, MagicMock, Mock
 
 
 test_docx_path = absjoin(test_file_dir, 'test.docx')
@@ -61,6 +68,44 @@ class DescribeDirPkgReader(object):
         rels_xml = dir_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_open_the_file_for_a_pack_uri(self, dir_reader):
+        pack_uri = PackURI('/word/document.xml')
+        with dir_reader.open(pack_uri) as f:
+            assert f.read() == dir_reader.blob_for(pack_uri)
+
+    def it_can_map_the_file_for_a_pack_uri_into_memory(self, dir_reader):
+        pack_uri = PackURI('/word/document.xml')
+
+        view = dir_reader.view_for(pack_uri)
+
+        assert isinstance(view, memoryview)
+        assert isinstance(view.obj, mmap.mmap)
+        assert view.tobytes() == dir_reader.blob_for(pack_uri)
+        view.release()
+
+    def it_maps_each_file_once_until_it_is_closed(self):
+        dir_reader = _DirPkgReader(dir_pkg_path)
+        pack_uri = PackURI('/word/document.xml')
+        view = dir_reader.view_for(pack_uri)
+        other_view = dir_reader.view_for(pack_uri)
+        mapping = view.obj
+        assert other_view.obj is mapping
+        view.release()
+        other_view.release()
+
+        dir_reader.close()
+
+        assert mapping.closed
+
+    def it_has_no_compressed_form_of_a_member(self, dir_reader):
+        pack_uri = PackURI('/word/document.xml')
+        assert dir_reader.raw_member_for(pack_uri) is None
+
+    def it_knows_whether_it_reads_from_a_pkg_file(self, dir_reader):
+        assert dir_reader.reads_from(dir_pkg_path) is True
+        assert dir_reader.reads_from(zip_pkg_path) is False
+        assert dir_reader.reads_from(BytesIO()) is False
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -123,6 +168,115 @@ class DescribeZipPkgReader(object):
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_open_the_member_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI('/word/document.xml')
+        f = phys_reader.open(pack_uri)
+        assert f.read() == phys_reader.blob_for(pack_uri)
+        f.close()
+
+    def it_can_retrieve_the_compressed_bytes_for_a_pack_uri(
+            self, phys_reader):
+        pack_uri = PackURI('/word/document.xml')
+        zinfo, raw_bytes = phys_reader.raw_member_for(pack_uri)
+        assert zinfo.filename == 'word/document.xml'
+        assert len(raw_bytes) == zinfo.compress_size
+        assert zinfo.compress_size < zinfo.file_size
+
+    def it_raises_when_a_member_has_no_local_file_header(self, phys_reader):
+        zinfo = phys_reader._zipf.getinfo('word/document.xml')
+        zinfo = copy.copy(zinfo)
+        zinfo.header_offset += 1
+
+        with pytest.raises(BadZipfile):
+            phys_reader._data_offset(zinfo)
+
+    def it_reads_compressed_bytes_under_the_zip_file_lock(self):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        assert phys_reader._lock is phys_reader._zipf._lock
+        lock_ = phys_reader._lock = MagicMock(name='lock')
+
+        phys_reader.raw_member_for(PackURI('/word/document.xml'))
+
+        assert lock_.__enter__.call_count == 2
+        assert lock_.__exit__.call_count == 2
+        phys_reader.close()
+
+    def it_serializes_member_reads_only_when_zipfile_does_not(self):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        lock_ = phys_reader._lock = MagicMock(name='lock')
+        pack_uri = PackURI('/word/document.xml')
+
+        phys_reader.blob_for(pack_uri)
+        assert lock_.__enter__.call_count == 0
+
+        phys_reader._serializes_reads = True
+        phys_reader.blob_for(pack_uri)
+        assert lock_.__enter__.call_count == 1
+        phys_reader.close()
+
+    def it_provides_a_view_of_a_stored_member_in_place(self):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        pack_uri = PackURI('/docProps/thumbnail.jpeg')
+
+        view = phys_reader.view_for(pack_uri)
+        other_view = phys_reader.view_for(pack_uri)
+
+        mapping = view.obj
+        assert isinstance(mapping, mmap.mmap)
+        assert other_view.obj is mapping
+        assert view.tobytes() == phys_reader.blob_for(pack_uri)
+        view.release()
+        other_view.release()
+        phys_reader.close()
+        assert mapping.closed
+
+    def it_provides_a_view_of_the_compressed_bytes_of_a_member(self):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        pack_uri = PackURI('/word/document.xml')
+        zinfo, raw_bytes = phys_reader.raw_member_for(pack_uri)
+
+        raw_zinfo, raw_view = phys_reader.raw_view_for(pack_uri)
+
+        assert raw_zinfo is zinfo
+        assert isinstance(raw_view.obj, mmap.mmap)
+        assert raw_view.tobytes() == raw_bytes
+        raw_view.release()
+        phys_reader.close()
+
+    def it_keeps_a_view_usable_after_it_is_closed(self):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        pack_uri = PackURI('/docProps/thumbnail.jpeg')
+        blob = phys_reader.blob_for(pack_uri)
+        view = phys_reader.view_for(pack_uri)
+
+        phys_reader.close()
+
+        assert view.tobytes() == blob
+        view.release()
+
+    def it_provides_a_view_of_a_deflated_member(self, phys_reader):
+        pack_uri = PackURI('/word/document.xml')
+
+        view = phys_reader.view_for(pack_uri)
+
+        assert isinstance(view.obj, bytes)
+        assert view.tobytes() == phys_reader.blob_for(pack_uri)
+
+    def it_provides_a_view_of_a_member_in_a_stream(self):
+        with open(zip_pkg_path, 'rb') as f:
+            phys_reader = _ZipPkgReader(BytesIO(f.read()))
+        pack_uri = PackURI('/docProps/thumbnail.jpeg')
+
+        view = phys_reader.view_for(pack_uri)
+
+        assert view.tobytes() == phys_reader.blob_for(pack_uri)
+        phys_reader.close()
+
+    def it_knows_whether_it_reads_from_a_pkg_file(self, phys_reader):
+        assert phys_reader.reads_from(zip_pkg_path) is True
+        assert phys_reader.reads_from(dir_pkg_path) is False
+        assert phys_reader.reads_from(BytesIO()) is False
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(scope='class')
@@ -142,16 +296,16 @@ class DescribeZipPkgWriter(object):
         phys_writer = PhysPkgWriter(tmp_docx_path)
         assert isinstance(phys_writer, _ZipPkgWriter)
 
-    def it_opens_pkg_file_zip_on_construction(self, ZipFile_):
+    def it_opens_pkg_file_zip_on_construction(self, _RawZipFile_):
         pkg_file = Mock(name='pkg_file')
         _ZipPkgWriter(pkg_file)
-        ZipFile_.assert_called_once_with(
+        _RawZipFile_.assert_called_once_with(
             pkg_file, 'w', compression=ZIP_DEFLATED
         )
 
-    def it_can_be_closed(self, ZipFile_):
+    def it_can_be_closed(self, _RawZipFile_):
         # mockery ----------------------
-        zipf = ZipFile_.return_value
+        zipf = _RawZipFile_.return_value
         zip_pkg_writer = _ZipPkgWriter(None)
         # exercise ---------------------
         zip_pkg_writer.close()
@@ -174,6 +328,185 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_write_at_a_compression_level(self, pkg_file):
+        blob = b'<Foo>' + b'<Bar/>' * 1000 + b'</Foo>'
+
+        def compress_size(compression):
+            pkg_file.seek(0)
+            pkg_file.truncate()
+            pkg_writer = PhysPkgWriter(pkg_file, compression)
+            pkg_writer.write(PackURI('/part/name.xml'), blob)
+            pkg_writer.close()
+            zipf = ZipFile(pkg_file, 'r')
+            zinfo = zipf.getinfo('part/name.xml')
+            assert zipf.read(zinfo) == blob
+            zipf.close()
+            return zinfo.compress_type, zinfo.compress_size
+
+        assert compress_size(0) == (ZIP_STORED, len(blob))
+        compress_type, size = compress_size(9)
+        assert compress_type == ZIP_DEFLATED
+        assert size < len(blob)
+        if sys.version_info >= (3, 7):
+            assert compress_size(1)[1] >= size
+
+    def it_stores_compressed_images_when_a_level_is_given(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file, 6)
+        pkg_writer.write(PackURI('/word/media/image1.PNG'), b'png' * 100)
+        pkg_writer.write(PackURI('/word/media/image2.jpeg'), b'jpeg' * 100)
+        pkg_writer.write(PackURI('/word/media/image3.bmp'), b'bmp' * 100)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert [zinfo.compress_type for zinfo in zipf.infolist()] == [
+            ZIP_STORED, ZIP_STORED, ZIP_DEFLATED
+        ]
+        assert zipf.testzip() is None
+        zipf.close()
+
+    def it_can_compress_a_member_to_write_later(self, pkg_file):
+        blob = b'<Foo>' + b'<Bar/>' * 1000 + b'</Foo>'
+        pkg_writer = PhysPkgWriter(pkg_file, 0)
+        deflating_writer = PhysPkgWriter(BytesIO())
+
+        stored = pkg_writer.compress(PackURI('/part/stored.xml'), blob)
+        deflated = deflating_writer.compress(PackURI('/part/name.xml'), blob)
+        pkg_writer.write_raw(PackURI('/part/stored.xml'), *stored)
+        pkg_writer.write_raw(PackURI('/part/name.xml'), *deflated)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert [zinfo.compress_type for zinfo in zipf.infolist()] == [
+            ZIP_STORED, ZIP_DEFLATED
+        ]
+        assert zipf.read('part/stored.xml') == zipf.read('part/name.xml') == blob
+        zipf.close()
+
+    @pytest.mark.parametrize(
+        'compression, exception', [
+            (10, ValueError), (-1, ValueError), (True, TypeError),
+            (False, TypeError), (5.0, TypeError), ('5', TypeError),
+        ]
+    )
+    def it_raises_on_an_invalid_compression_level(
+            self, pkg_file, compression, exception):
+        with pytest.raises(exception):
+            PhysPkgWriter(pkg_file, compression)
+
+    def it_can_write_a_member_incrementally(self, pkg_file):
+        pack_uri = PackURI('/part/name.xml')
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        member = pkg_writer.open(pack_uri)
+        member.write(b'<Foo>')
+        member.write(b'</Foo>')
+        member.close()
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.read(pack_uri.membername) == b'<Foo></Foo>'
+        zipf.close()
+
+    def it_writes_a_member_that_stays_small_like_any_other(self, pkg_file):
+        zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        with _SpillingZipMember(zipf, 'small.xml', 16) as member:
+            member.write(b'<Foo>')
+            member.write(b'</Foo>')
+        zipf.writestr('other.xml', b'<Foo></Foo>')
+        zipf.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        small, other = zipf.infolist()
+        assert zipf.read('small.xml') == b'<Foo></Foo>'
+        assert small.extract_version == other.extract_version == 20
+        zipf.close()
+        extra_len, = struct.unpack('<H', pkg_file.getvalue()[28:30])
+        assert extra_len == 0
+
+    def it_streams_a_member_that_grows_large_with_zip64(self, pkg_file):
+        zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        with _SpillingZipMember(zipf, 'large.xml', 8) as member:
+            member.write(b'<Foo>')
+            member.write(b'<Bar/>')
+            member.write(b'</Foo>')
+        zipf.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.read('large.xml') == b'<Foo><Bar/></Foo>'
+        assert zipf.testzip() is None
+        zipf.close()
+        # ---the local file header carries the 20-byte ZIP64 extra field---
+        extra_len, = struct.unpack('<H', pkg_file.getvalue()[28:30])
+        assert extra_len == 20
+
+    def it_can_write_compressed_bytes_verbatim(self, pkg_file):
+        src_pack_uri = PackURI('/word/document.xml')
+        pack_uri = PackURI('/word/copy.xml')
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        zinfo, raw_bytes = phys_reader.raw_member_for(src_pack_uri)
+        expected_blob = phys_reader.blob_for(src_pack_uri)
+        phys_reader.close()
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<Foo/>')
+        pkg_writer.write_raw(pack_uri, zinfo, raw_bytes)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.read(pack_uri.membername) == expected_blob
+        assert zipf.getinfo(pack_uri.membername).compress_size == len(
+            raw_bytes
+        )
+        zipf.close()
+
+    def it_writes_compressed_bytes_under_the_zip_file_lock(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file)
+        member = pkg_writer.compress(PackURI('/part/src.xml'), b'<Foo/>')
+        zipf = pkg_writer._zipf
+        if sys.version_info >= (3, 5):
+            assert zipf._raw_lock is zipf._lock
+        lock_ = zipf._raw_lock = MagicMock(name='lock')
+
+        pkg_writer.write_raw(PackURI('/part/name.xml'), *member)
+
+        assert lock_.__enter__.call_count == 1
+        assert lock_.__exit__.call_count == 1
+        pkg_writer.close()
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 6), reason='ZipFile.open() writes from 3.6'
+    )
+    def it_refuses_compressed_bytes_while_a_member_is_open(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file)
+        raw_member = pkg_writer.compress(PackURI('/part/src.xml'), b'<Foo/>')
+        member = pkg_writer.open(PackURI('/part/open.xml'), force_zip64=False)
+
+        with pytest.raises(ValueError):
+            pkg_writer.write_raw(PackURI('/part/name.xml'), *raw_member)
+
+        member.close()
+        pkg_writer.close()
+
+    def it_can_abort_writing_to_a_stream(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<Foo/>')
+
+        pkg_writer.abort()
+
+        assert not pkg_file.closed
+        assert len(pkg_file.getvalue()) > 0
+        assert not is_zipfile(pkg_file)
+
+    def it_removes_the_pkg_file_when_aborted(self, tmp_docx_path):
+        pkg_writer = PhysPkgWriter(tmp_docx_path)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<Foo/>')
+
+        pkg_writer.abort()
+
+        assert not os.path.exists(tmp_docx_path)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -193,3 +526,8 @@ def tmp_docx_path(tmpdir):
 @pytest.fixture
 def ZipFile_(request):
     return class_mock(request, 'docx.opc.phys_pkg.ZipFile')
+
+
+@pytest.fixture
+def _RawZipFile_(request):
+    return class_mock(request, 'docx.opc.phys_pkg._RawZipFile')
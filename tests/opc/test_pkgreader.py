@@ -11,13 +11,17 @@ from docx.opc.packuri import PackURI
 from docx.opc.phys_pkg import _ZipPkgReader
 from docx.opc.pkgreader import (
     _ContentTypeMap,
+    DeferredBlob,
     PackageReader,
+    PackageSnapshot,
     _SerializedPart,
     _SerializedRelationship,
     _SerializedRelationships,
+    SnapshotBlob,
 )
 
 from .unitdata.types import a_Default, a_Types, an_Override
+from ..unitutil.file import docx_path
 from ..unitutil.mock import (
     ANY,
     call,
@@ -49,7 +53,7 @@ class DescribePackageReader(object):
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
         _srels_for.assert_called_once_with(phys_reader, '/')
         _load_serialized_parts.assert_called_once_with(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, False
         )
         phys_reader.close.assert_called_once_with()
         _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts)
@@ -162,6 +166,79 @@ class DescribePackageReader(object):
         ]
         assert generated_tuples == expected_tuples
 
+    def it_can_defer_reading_blobs_while_walking_phys_pkg_parts(
+            self, _srels_for):
+        partname = '/part/name1.xml'
+        srels = [Mock(name='rId1', is_external=False, reltype='reltype1',
+                      target_partname=partname)]
+        phys_reader = Mock(name='phys_reader')
+        _srels_for.return_value = []
+
+        generated_tuples = list(
+            PackageReader._walk_phys_parts(phys_reader, srels, lazy=True)
+        )
+
+        assert len(generated_tuples) == 1
+        blob = generated_tuples[0][1]
+        assert isinstance(blob, DeferredBlob)
+        assert phys_reader.blob_for.call_count == 0
+        assert blob.read() is phys_reader.blob_for.return_value
+        phys_reader.blob_for.assert_called_once_with(partname)
+        assert blob.view() is phys_reader.view_for.return_value
+        phys_reader.view_for.assert_called_once_with(partname)
+
+    def it_leaves_the_phys_pkg_open_when_lazy(
+        self, _init_, PhysPkgReader_, from_xml, _srels_for, _load_serialized_parts
+    ):
+        phys_reader = PhysPkgReader_.return_value
+
+        PackageReader.from_file('foobar.docx', lazy=True)
+
+        _load_serialized_parts.assert_called_once_with(
+            phys_reader, _srels_for.return_value, from_xml.return_value, True
+        )
+        assert phys_reader.close.call_count == 0
+
+    def it_can_read_the_blobs_using_worker_threads(
+        self, _init_, PhysPkgReader_, from_xml, _srels_for,
+        _load_serialized_parts, _read_blobs_concurrently_
+    ):
+        phys_reader = PhysPkgReader_.return_value
+        sparts = _load_serialized_parts.return_value
+
+        PackageReader.from_file('foobar.docx', workers=4)
+
+        _load_serialized_parts.assert_called_once_with(
+            phys_reader, _srels_for.return_value, from_xml.return_value, True
+        )
+        _read_blobs_concurrently_.assert_called_once_with(sparts, 4)
+        phys_reader.close.assert_called_once_with()
+        _init_.assert_called_once_with(
+            ANY, from_xml.return_value, _srels_for.return_value,
+            _read_blobs_concurrently_.return_value
+        )
+
+    def it_can_read_serialized_part_blobs_concurrently(self):
+        sparts = tuple(
+            _SerializedPart(
+                'partname%d' % n, 'ct%d' % n, 'reltype%d' % n,
+                Mock(name='blob%d' % n, **{'read.return_value': 'bytes%d' % n}),
+                'srels%d' % n
+            )
+            for n in range(3)
+        )
+
+        loaded_sparts = PackageReader._read_blobs_concurrently(sparts, 2)
+
+        assert [
+            (s.partname, s.content_type, s.reltype, s.blob, s.srels)
+            for s in loaded_sparts
+        ] == [
+            ('partname%d' % n, 'ct%d' % n, 'reltype%d' % n, 'bytes%d' % n,
+             'srels%d' % n)
+            for n in range(3)
+        ]
+
     def it_can_retrieve_srels_for_a_source_uri(
             self, _SerializedRelationships_):
         # mockery ----------------------
@@ -209,6 +286,12 @@ class DescribePackageReader(object):
         ]
         return pkg_reader, expected_iter_spart_items
 
+    @pytest.fixture
+    def _read_blobs_concurrently_(self, request):
+        return method_mock(
+            request, PackageReader, '_read_blobs_concurrently', autospec=False
+        )
+
     @pytest.fixture
     def _load_serialized_parts(self, request):
         return method_mock(
@@ -268,6 +351,80 @@ class DescribePackageReader(object):
         return method_mock(request, PackageReader, '_walk_phys_parts', autospec=False)
 
 
+class DescribeDeferredBlob(object):
+
+    def it_provides_a_view_of_the_compressed_bytes_of_its_part(self):
+        phys_reader = _ZipPkgReader(docx_path('test'))
+        partname = PackURI('/word/document.xml')
+        deferred_blob = DeferredBlob(phys_reader, partname)
+
+        zinfo, raw_view = deferred_blob.view_raw()
+
+        assert (zinfo, raw_view.tobytes()) == phys_reader.raw_member_for(partname)
+        raw_view.release()
+        phys_reader.close()
+
+
+class DescribePackageSnapshot(object):
+
+    def it_can_construct_from_pkg_file(self):
+        snapshot = PackageSnapshot.from_file(docx_path('test'))
+
+        pkg_reader = PackageReader.from_file(docx_path('test'))
+        sparts = list(snapshot.iter_sparts())
+        assert [spart[:3] for spart in sparts] == [
+            spart[:3] for spart in pkg_reader.iter_sparts()
+        ]
+        assert [spart[3].read() for spart in sparts] == [
+            spart[3] for spart in pkg_reader.iter_sparts()
+        ]
+        assert [
+            (source_uri, srel.rId) for source_uri, srel in snapshot.iter_srels()
+        ] == [
+            (source_uri, srel.rId) for source_uri, srel in pkg_reader.iter_srels()
+        ]
+
+    def it_provides_the_same_blobs_to_each_package(self):
+        snapshot = PackageSnapshot.from_file(docx_path('test'))
+
+        blobs = [spart[3] for spart in snapshot.iter_sparts()]
+
+        assert all(isinstance(blob, SnapshotBlob) for blob in blobs)
+        assert all(blob.read_raw() is not None for blob in blobs)
+        assert [spart[3] for spart in snapshot.iter_sparts()] == blobs
+
+
+class DescribeSnapshotBlob(object):
+
+    def it_parses_its_xml_only_once(self):
+        snapshot_blob = SnapshotBlob(b'<foo><bar/></foo>')
+
+        element = snapshot_blob.copy_element()
+        element_2 = snapshot_blob.copy_element()
+
+        assert element.tag == 'foo'
+        assert element is not element_2
+        assert snapshot_blob._element is not None
+        assert snapshot_blob._element not in (element, element_2)
+
+    def it_is_not_copied_verbatim_from_a_package_file(self):
+        snapshot_blob = SnapshotBlob(b'png')
+        assert snapshot_blob.read() == b'png'
+        assert snapshot_blob.view() == b'png'
+        assert snapshot_blob.read_raw() is None
+        assert snapshot_blob.view_raw() is None
+        assert snapshot_blob.reads_from('foobar.docx') is False
+
+    def it_provides_a_view_of_the_compressed_bytes_it_holds(self):
+        snapshot_blob = SnapshotBlob(b'png', ('zinfo', b'raw'))
+
+        zinfo, raw_view = snapshot_blob.view_raw()
+
+        assert zinfo == 'zinfo'
+        assert isinstance(raw_view, memoryview)
+        assert raw_view.tobytes() == b'raw'
+
+
 class Describe_ContentTypeMap(object):
 
     def it_can_construct_from_ct_item_xml(self, from_xml_fixture):
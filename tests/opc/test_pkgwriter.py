@@ -8,7 +8,7 @@ import pytest
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.packuri import PackURI
-from docx.opc.part import Part
+from docx.opc.part import Part, XmlPart
 from docx.opc.phys_pkg import _ZipPkgWriter
 from docx.opc.pkgwriter import _ContentTypesItem, PackageWriter
 
@@ -27,17 +27,42 @@ class DescribePackageWriter(object):
         parts = Mock(name='parts')
         phys_writer = PhysPkgWriter_.return_value
         # exercise ---------------------
-        PackageWriter.write(pkg_file, pkg_rels, parts)
+        PackageWriter.write(pkg_file, pkg_rels, parts, 1)
         # verify -----------------------
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_parts(phys_writer, parts, False),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, 1)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
+    def it_can_write_the_parts_using_worker_threads(
+        self, PhysPkgWriter_, _write_methods, _write_parts_concurrently_
+    ):
+        pkg_file, pkg_rels, parts = 'foo.docx', Mock(name='pkg_rels'), []
+        phys_writer = PhysPkgWriter_.return_value
+
+        PackageWriter.write(pkg_file, pkg_rels, parts, None, 4)
+
+        _write_parts_concurrently_.assert_called_once_with(
+            phys_writer, parts, 4, False
+        )
+        assert _write_methods._write_parts.call_count == 0
+        phys_writer.close.assert_called_once_with()
+
+    def it_requires_concurrent_futures_to_use_worker_threads(
+        self, request, PhysPkgWriter_
+    ):
+        patch_ = patch('docx.opc.pkgwriter.futures', None)
+        request.addfinalizer(patch_.stop)
+        patch_.start()
+
+        with pytest.raises(RuntimeError):
+            PackageWriter.write('foo.docx', Mock(name='pkg_rels'), [], None, 4)
+        assert PhysPkgWriter_.call_count == 0
+
     def it_can_write_a_content_types_stream(self, write_cti_fixture):
         _ContentTypesItem_, parts_, phys_pkg_writer_, blob_ = (
             write_cti_fixture
@@ -75,6 +100,154 @@ class DescribePackageWriter(object):
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_serializes_an_xml_part_straight_into_its_member(self):
+        phys_writer = MagicMock(name='phys_writer')
+        member = phys_writer.open.return_value
+        xml_part = Mock(
+            spec=XmlPart, is_dirty=True, partname=PackURI('/foo.xml'),
+            _rels=[]
+        )
+
+        PackageWriter._write_parts(phys_writer, [xml_part])
+
+        phys_writer.open.assert_called_once_with(xml_part.partname)
+        xml_part.write_blob.assert_called_once_with(member)
+        member.__exit__.assert_called_once_with(None, None, None)
+        assert phys_writer.write.call_count == 0
+
+    def it_can_write_a_list_of_parts_concurrently(self):
+        phys_writer = Mock(name='phys_writer')
+        phys_writer.compress.side_effect = lambda pack_uri, blob: (
+            'zinfo', blob
+        )
+        rels = MagicMock(name='rels', xml=b'rels')
+        rels.__len__.return_value = 1
+        part1 = Mock(name='part1', is_dirty=True, blob=b'blob1', _rels=rels)
+        part2 = Mock(name='part2', is_dirty=False, _rels=[])
+        raw_view = Mock(name='raw_view')
+        part2.source.view_raw.return_value = ('zinfo2', raw_view)
+        part3 = Mock(name='part3', is_dirty=True, blob=b'blob3', _rels=[])
+
+        PackageWriter._write_parts_concurrently(
+            phys_writer, [part1, part2, part3], 2
+        )
+
+        assert phys_writer.write_raw.mock_calls == [
+            call(part1.partname, 'zinfo', b'blob1'),
+            call(part1.partname.rels_uri, 'zinfo', b'rels'),
+            call(part2.partname, 'zinfo2', raw_view),
+            call(part3.partname, 'zinfo', b'blob3'),
+        ]
+        assert phys_writer.write.call_count == 0
+
+    def it_compresses_parts_only_a_few_ahead_of_the_one_written(self):
+        compressed, compressed_when_written = [], []
+
+        def compress(pack_uri, blob):
+            compressed.append(blob)
+            return 'zinfo', blob
+
+        def write_raw(pack_uri, zinfo, blob):
+            compressed_when_written.append(len(compressed))
+
+        phys_writer = Mock(name='phys_writer')
+        phys_writer.compress.side_effect = compress
+        phys_writer.write_raw.side_effect = write_raw
+        parts = [
+            Mock(name='part', is_dirty=True, blob=b'%d' % i, _rels=[])
+            for i in range(8)
+        ]
+
+        PackageWriter._write_parts_concurrently(phys_writer, parts, 1)
+
+        assert len(compressed_when_written) == 8
+        for idx, count in enumerate(compressed_when_written):
+            assert count <= idx + 2
+
+    def it_can_complete_a_package_with_a_streamed_part(self, _write_methods):
+        phys_writer = Mock(name='phys_writer')
+        pkg_rels = Mock(name='pkg_rels')
+        rels = MagicMock(name='rels')
+        rels.__len__.return_value = 1
+        streamed_part = Mock(name='streamed_part', _rels=rels)
+        part = Mock(name='part')
+        parts = [streamed_part, part]
+
+        PackageWriter.write_streamed(
+            phys_writer, pkg_rels, parts, streamed_part
+        )
+
+        assert _write_methods.mock_calls == [
+            call._write_content_types_stream(phys_writer, parts),
+            call._write_pkg_rels(phys_writer, pkg_rels),
+            call._write_parts(phys_writer, [part]),
+        ]
+        phys_writer.write.assert_called_once_with(
+            streamed_part.partname.rels_uri, rels.xml
+        )
+        phys_writer.close.assert_called_once_with()
+
+    def it_copies_a_part_that_is_not_dirty_without_recompressing(self):
+        phys_writer = Mock(name='phys_writer')
+        part = Mock(name='part', is_dirty=False, _rels=[])
+        raw_view = Mock(name='raw_view')
+        part.source.view_raw.return_value = ('zinfo', raw_view)
+
+        PackageWriter._write_parts(phys_writer, [part])
+
+        phys_writer.write_raw.assert_called_once_with(
+            part.partname, 'zinfo', raw_view
+        )
+        raw_view.release.assert_called_once_with()
+        assert phys_writer.write.call_count == 0
+
+    def it_copies_unchanged_dirty_parts_when_incremental(self):
+        phys_writer = Mock(name='phys_writer')
+        unchanged = Mock(name='unchanged', is_dirty=True, blob=b'foo', _rels=[])
+        unchanged.source.read.return_value = b'foo'
+        raw_view = Mock(name='raw_view')
+        unchanged.source.view_raw.return_value = ('zinfo', raw_view)
+        changed = Mock(name='changed', is_dirty=True, blob=b'bar', _rels=[])
+        changed.source.read.return_value = b'foo'
+
+        PackageWriter._write_parts(phys_writer, [unchanged, changed], True)
+
+        phys_writer.write_raw.assert_called_once_with(
+            unchanged.partname, 'zinfo', raw_view
+        )
+        phys_writer.write.assert_called_once_with(changed.partname, b'bar')
+
+    def it_copies_unchanged_dirty_parts_concurrently_when_incremental(self):
+        phys_writer = Mock(name='phys_writer')
+        phys_writer.compress.side_effect = lambda pack_uri, blob: (
+            'zinfo', blob
+        )
+        unchanged = Mock(name='unchanged', is_dirty=True, blob=b'foo', _rels=[])
+        unchanged.source.read.return_value = b'foo'
+        raw_view = Mock(name='raw_view')
+        unchanged.source.view_raw.return_value = ('zinfo1', raw_view)
+        changed = Mock(name='changed', is_dirty=True, blob=b'bar', _rels=[])
+        changed.source.read.return_value = b'foo'
+
+        PackageWriter._write_parts_concurrently(
+            phys_writer, [unchanged, changed], 2, True
+        )
+
+        assert phys_writer.write_raw.mock_calls == [
+            call(unchanged.partname, 'zinfo1', raw_view),
+            call(changed.partname, 'zinfo', b'bar'),
+        ]
+
+    def but_it_writes_the_blob_when_the_source_is_not_a_zip(self):
+        phys_writer = Mock(name='phys_writer')
+        part = Mock(name='part', is_dirty=False, _rels=[])
+        part.source.view_raw.return_value = None
+
+        PackageWriter._write_parts(phys_writer, [part])
+
+        phys_writer.write.assert_called_once_with(part.partname, part.blob)
+        assert phys_writer.write_raw.call_count == 0
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -112,6 +285,12 @@ class DescribePackageWriter(object):
             self, _ContentTypesItem_, parts_, phys_pkg_writer_, blob_):
         return _ContentTypesItem_, parts_, phys_pkg_writer_, blob_
 
+    @pytest.fixture
+    def _write_parts_concurrently_(self, request):
+        return method_mock(
+            request, PackageWriter, '_write_parts_concurrently', autospec=False
+        )
+
     @pytest.fixture
     def _write_methods(self, request):
         """Mock that patches all the _write_* methods of PackageWriter"""
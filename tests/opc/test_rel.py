@@ -138,6 +138,37 @@ class DescribeRelationships(object):
         next_rId = rels._next_rId
         assert next_rId == expected_next_rId
 
+    def it_reuses_the_rId_of_a_deleted_relationship(self, reltype, url):
+        rels = Relationships(None)
+        for n in range(3):
+            rels.get_or_add_ext_rel(reltype, '%s/%d' % (url, n))
+        assert rels._next_rId == 'rId4'
+
+        del rels['rId2']
+
+        assert rels._next_rId == 'rId2'
+        assert rels.get_or_add_ext_rel(reltype, url) == 'rId2'
+        assert rels._next_rId == 'rId4'
+
+    def it_updates_its_indexes_when_a_relationship_is_deleted(
+            self, request, reltype):
+        rels = Relationships(None)
+        part_ = instance_mock(request, Part)
+        rels.add_relationship(reltype, part_, 'rId1')
+        rels.add_relationship(reltype, part_, 'rId2')
+        assert rels.get_or_add(reltype, part_).rId == 'rId1'
+
+        del rels['rId1']
+
+        assert rels.get_or_add(reltype, part_).rId == 'rId2'
+        assert rels.part_with_reltype(reltype) is part_
+        assert 'rId1' not in rels.related_parts
+
+        del rels['rId2']
+
+        with pytest.raises(KeyError):
+            rels.part_with_reltype(reltype)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,77 @@
+# encoding: utf-8
+
+"""
+Test suite for docx.oxml.simpletypes
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from docx.oxml import simpletypes
+from docx.oxml.simpletypes import (
+    ST_DecimalNumber, ST_HpsMeasure, ST_OnOff, _memoize
+)
+from docx.shared import Pt
+
+from ..unitutil.mock import method_mock
+
+
+class DescribeBaseSimpleType(object):
+
+    def it_memoizes_conversion_from_xml(self, convert_from_xml_):
+        convert_from_xml_.return_value = 42
+
+        assert ST_DecimalNumber.from_xml('42') == 42
+        assert ST_DecimalNumber.from_xml('42') == 42
+
+        convert_from_xml_.assert_called_once_with('42')
+
+    def it_memoizes_conversion_to_xml(self, convert_to_xml_):
+        convert_to_xml_.return_value = '42'
+
+        assert ST_DecimalNumber.to_xml(42) == '42'
+        assert ST_DecimalNumber.to_xml(42) == '42'
+
+        convert_to_xml_.assert_called_once_with(42)
+
+    def it_keeps_memoized_values_separate_for_each_type(self):
+        assert ST_OnOff.from_xml('on') is True
+        assert ST_HpsMeasure.from_xml('24') == Pt(12)
+        assert ST_DecimalNumber.from_xml('24') == 24
+
+    def it_still_validates_a_value_equal_to_a_memoized_one(self):
+        assert ST_DecimalNumber.to_xml(1) == '1'
+        with pytest.raises(TypeError):
+            ST_DecimalNumber.to_xml(1.0)
+
+    def it_does_not_memoize_an_invalid_xml_value(self):
+        with pytest.raises(ValueError):
+            ST_DecimalNumber.from_xml('foo')
+        assert (ST_DecimalNumber, 'foo') not in simpletypes._from_xml_memo
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(autouse=True)
+    def clear_memos(self):
+        simpletypes._from_xml_memo.clear()
+        simpletypes._to_xml_memo.clear()
+
+    @pytest.fixture
+    def convert_from_xml_(self, request):
+        return method_mock(request, ST_DecimalNumber, 'convert_from_xml')
+
+    @pytest.fixture
+    def convert_to_xml_(self, request):
+        return method_mock(request, ST_DecimalNumber, 'convert_to_xml')
+
+
+class Describe_memoize(object):
+
+    def it_clears_the_memo_when_it_is_full(self, monkeypatch):
+        monkeypatch.setattr(simpletypes, '_MEMO_SIZE', 2)
+        memo = {'a': 1, 'b': 2}
+
+        _memoize(memo, 'c', 3)
+
+        assert memo == {'c': 3}
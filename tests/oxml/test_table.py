@@ -8,11 +8,14 @@ import pytest
 
 from docx.exceptions import InvalidSpanError
 from docx.oxml import parse_xml
-from docx.oxml.table import CT_Row, CT_Tc
+from docx.oxml.table import CT_Tbl, CT_Tc, _TcGrid
+from docx.shared import Twips
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
-from ..unitutil.mock import call, instance_mock, method_mock, property_mock
+from ..unitutil.mock import (
+    call, class_mock, instance_mock, method_mock, property_mock
+)
 
 
 class DescribeCT_Row(object):
@@ -49,23 +52,140 @@ class DescribeCT_Row(object):
         return tr, col_idx
 
 
+class DescribeCT_Tbl(object):
+
+    def it_can_create_a_new_tbl_from_row_data(self, from_rows_fixture):
+        rows, header, expected_trs_cxml = from_rows_fixture
+        tbl = CT_Tbl.new_tbl_from_rows(iter(rows), Twips(2880), header)
+        assert len(tbl.tblGrid.gridCol_lst) == 2
+        assert [tr.xml for tr in tbl.tr_lst] == [
+            xml(tr_cxml) for tr_cxml in expected_trs_cxml
+        ]
+
+    def it_escapes_markup_characters_in_row_data(self):
+        tbl = CT_Tbl.new_tbl_from_rows([('<a & b>',)], Twips(1440))
+        assert tbl.xpath('string(.//w:t)') == '<a & b>'
+
+    def it_can_create_a_new_tbl_from_no_rows(self):
+        tbl = CT_Tbl.new_tbl_from_rows(iter(()), Twips(2880))
+        assert tbl.col_count == 0
+        assert tbl.tr_lst == []
+
+    def it_can_add_trs_from_row_data(self):
+        tbl = element(
+            'w:tbl/(w:tblPr,w:tblGrid/(w:gridCol{w:w=720},w:gridCol))'
+        )
+        tbl.add_trs_from_rows(row for row in [('a', 'b')])
+        assert tbl.xml == xml(
+            'w:tbl/(w:tblPr,w:tblGrid/(w:gridCol{w:w=720},w:gridCol),w:tr/('
+            'w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=720},w:p/w:r/w:t"a"),'
+            'w:tc/w:p/w:r/w:t"b"))'
+        )
+
+    def it_can_merge_a_batch_of_regions(self, merge_regions_fixture):
+        tbl, regions, expected_xml = merge_regions_fixture
+        top_tcs = tbl.merge_regions(regions)
+        assert tbl.xml == expected_xml
+        assert len(top_tcs) == len(regions)
+        assert all(tc.getparent() is not None for tc in top_tcs)
+
+    def it_raises_on_a_row_wider_than_the_table(self):
+        tbl = element('w:tbl/(w:tblPr,w:tblGrid/w:gridCol{w:w=720})')
+        with pytest.raises(ValueError):
+            tbl.add_trs_from_rows([('a',), ('b', 'c')])
+        assert tbl.tr_lst == []
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ([(0, 0, 0, 1), (1, 0, 1, 2)],
+         'w:tr/(w:tc/(w:tcPr/w:gridSpan{w:val=2},w:p),w:tc/w:p),'
+         'w:tr/w:tc/(w:tcPr/w:gridSpan{w:val=3},w:p)'),
+        ([(1, 2, 0, 2)],
+         'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/(w:tcPr/w:vMerge{w:val=restart},w:p)),'
+         'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/(w:tcPr/w:vMerge,w:p))'),
+        ([(0, 0, 1, 1), (1, 2, 0, 0)],
+         'w:tr/w:tc/(w:tcPr/(w:gridSpan{w:val=3},w:vMerge{w:val=restart}),'
+         'w:p),w:tr/w:tc/(w:tcPr/(w:gridSpan{w:val=3},w:vMerge),w:p)'),
+    ])
+    def merge_regions_fixture(self, request):
+        regions, expected_trs_cxml = request.param
+        grid_cxml = 'w:tblGrid/(w:gridCol,w:gridCol,w:gridCol)'
+        tbl = element(
+            'w:tbl/(%s,w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p),'
+            'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p))' % grid_cxml
+        )
+        expected_xml = xml('w:tbl/(%s,%s)' % (grid_cxml, expected_trs_cxml))
+        return tbl, regions, expected_xml
+
+    @pytest.fixture(params=[
+        ([('a', 'b'), (1, None)], None,
+         ['w:tr/(w:tc/(%s,w:p/w:r/w:t"a"),w:tc/(%s,w:p/w:r/w:t"b"))',
+          'w:tr/(w:tc/(%s,w:p/w:r/w:t"1"),w:tc/(%s,w:p))']),
+        ([('a',)], ('x', 'y'),
+         ['w:tr/(w:trPr/w:tblHeader,w:tc/(%s,w:p/w:r/w:t"x"),'
+          'w:tc/(%s,w:p/w:r/w:t"y"))',
+          'w:tr/(w:tc/(%s,w:p/w:r/w:t"a"),w:tc/(%s,w:p))']),
+        ([('a\tb\nc', 2.5)], None,
+         ['w:tr/(w:tc/(%s,w:p/w:r/(w:t"a",w:tab,w:t"b",w:br,w:t"c")),'
+          'w:tc/(%s,w:p/w:r/w:t"2.5"))']),
+        ([(' a', 'b ')], None,
+         ['w:tr/(w:tc/(%s,w:p/w:r/w:t{xml:space=preserve}" a"),'
+          'w:tc/(%s,w:p/w:r/w:t{xml:space=preserve}"b "))']),
+    ])
+    def from_rows_fixture(self, request):
+        rows, header, trs_cxml = request.param
+        tcPr_cxml = 'w:tcPr/w:tcW{w:type=dxa,w:w=1440}'
+        expected_trs_cxml = [
+            tr_cxml % (tcPr_cxml, tcPr_cxml) for tr_cxml in trs_cxml
+        ]
+        return rows, header, expected_trs_cxml
+
+
+class Describe_TcGrid(object):
+
+    def it_locates_the_cell_at_a_grid_position(self):
+        tbl = parse_xml(snippet_seq('tbl-cells')[4])
+        grid = _TcGrid(tbl)
+        tr_lst = tbl.tr_lst
+        assert grid.tc_at(0, 0) is tr_lst[0].tc_lst[0]
+        assert grid.tc_at(1, 1) is tr_lst[1].tc_lst[1]
+        # ---a vertically merged position gives the top cell of the span---
+        assert grid.tc_at(2, 1) is tr_lst[1].tc_lst[1]
+
+    def it_raises_on_a_grid_position_out_of_range(self):
+        grid = _TcGrid(element('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p)'))
+        with pytest.raises(IndexError):
+            grid.tc_at(1, 0)
+        with pytest.raises(IndexError):
+            grid.tc_at(0, 1)
+
+    def it_reindexes_when_a_merge_cuts_a_vertical_span(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p),'
+            'w:tr/(w:tc/w:p,w:tc/(w:tcPr/w:vMerge{w:val=restart},w:p),w:tc/w:p),'
+            'w:tr/(w:tc/w:p,w:tc/(w:tcPr/w:vMerge,w:p),w:tc/w:p))'
+        )
+        grid = _TcGrid(tbl)
+        tc_below = tbl.tr_lst[2].tc_lst[1]
+
+        grid.merge(grid.tc_at(0, 0), grid.tc_at(1, 2))
+
+        assert grid.tc_at(2, 1) is tc_below
+
+
 class DescribeCT_Tc(object):
 
-    def it_can_merge_to_another_tc(
-        self, tr_, _span_dimensions_, _tbl_, _grow_to_, top_tc_
-    ):
-        top_tr_ = tr_
+    def it_can_merge_to_another_tc(self, _tbl_, _TcGrid_, top_tc_):
         tc, other_tc = element('w:tc'), element('w:tc')
-        top, left, height, width = 0, 1, 2, 3
-        _span_dimensions_.return_value = top, left, height, width
-        _tbl_.return_value.tr_lst = [tr_]
-        tr_.tc_at_grid_col.return_value = top_tc_
+        grid_ = _TcGrid_.return_value
+        grid_.merge.return_value = top_tc_
 
         merged_tc = tc.merge(other_tc)
 
-        _span_dimensions_.assert_called_once_with(tc, other_tc)
-        top_tr_.tc_at_grid_col.assert_called_once_with(left)
-        top_tc_._grow_to.assert_called_once_with(width, height)
+        _TcGrid_.assert_called_once_with(_tbl_.return_value)
+        grid_.merge.assert_called_once_with(tc, other_tc)
         assert merged_tc is top_tc_
 
     def it_knows_its_extents_to_help(self, extents_fixture):
@@ -83,11 +203,6 @@ class DescribeCT_Tc(object):
         with pytest.raises(InvalidSpanError):
             tc._span_dimensions(other_tc)
 
-    def it_can_grow_itself_to_help_merge(self, grow_to_fixture):
-        tc, width, height, top_tc, expected_calls = grow_to_fixture
-        tc._grow_to(width, height, top_tc)
-        assert tc._span_to_width.call_args_list == expected_calls
-
     def it_can_extend_its_horz_span_to_help_merge(
         self, top_tc_, grid_span_, _move_content_to_, _swallow_next_tc_
     ):
@@ -173,28 +288,6 @@ class DescribeCT_Tc(object):
         tc = tbl.tr_lst[row].tc_lst[col]
         return tc, attr_name, expected_value
 
-    @pytest.fixture(params=[
-        (0, 0, 0, 2, 1),
-        (0, 0, 1, 1, 2),
-        (0, 1, 1, 2, 2),
-        (1, 0, 0, 2, 2),
-        (2, 0, 0, 2, 2),
-        (2, 1, 2, 1, 2),
-    ])
-    def grow_to_fixture(self, request, _span_to_width_):
-        snippet_idx, row, col, width, height = request.param
-        tbl = self._snippet_tbl(snippet_idx)
-        tc = tbl.tr_lst[row].tc_lst[col]
-        start = 0 if height == 1 else 1
-        end = start + height
-        expected_calls = [
-            call(width, tc, None),
-            call(width, tc, 'restart'),
-            call(width, tc, 'continue'),
-            call(width, tc, 'continue'),
-        ][start:end]
-        return tc, width, height, None, expected_calls
-
     @pytest.fixture(params=[
         ('w:tc/w:p',             'w:tc/w:p',
          'w:tc/w:p',             'w:tc/w:p'),
@@ -294,22 +387,10 @@ class DescribeCT_Tc(object):
     def grid_span_(self, request):
         return property_mock(request, CT_Tc, 'grid_span')
 
-    @pytest.fixture
-    def _grow_to_(self, request):
-        return method_mock(request, CT_Tc, '_grow_to')
-
     @pytest.fixture
     def _move_content_to_(self, request):
         return method_mock(request, CT_Tc, '_move_content_to')
 
-    @pytest.fixture
-    def _span_dimensions_(self, request):
-        return method_mock(request, CT_Tc, '_span_dimensions')
-
-    @pytest.fixture
-    def _span_to_width_(self, request):
-        return method_mock(request, CT_Tc, '_span_to_width', autospec=False)
-
     def _snippet_tbl(self, idx):
         """
         Return a <w:tbl> element for snippet at *idx* in 'tbl-cells' snippet
@@ -326,9 +407,9 @@ class DescribeCT_Tc(object):
         return property_mock(request, CT_Tc, '_tbl')
 
     @pytest.fixture
-    def top_tc_(self, request):
-        return instance_mock(request, CT_Tc)
+    def _TcGrid_(self, request):
+        return class_mock(request, 'docx.oxml.table._TcGrid')
 
     @pytest.fixture
-    def tr_(self, request):
-        return instance_mock(request, CT_Row)
+    def top_tc_(self, request):
+        return instance_mock(request, CT_Tc)
@@ -20,6 +20,10 @@ class DescribeCT_R(object):
         r.add_t(text)
         assert r.xml == expected_xml
 
+    def it_knows_the_text_it_contains(self, text_get_fixture):
+        r, expected_text = text_get_fixture
+        assert r.text == expected_text
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -33,3 +37,14 @@ class DescribeCT_R(object):
         r = element(initial_cxml)
         expected_xml = xml(expected_cxml)
         return r, text, expected_xml
+
+    @pytest.fixture(params=[
+        ('w:r', ''),
+        ('w:r/w:t', ''),
+        ('w:r/(w:rPr/w:b, w:t"foo", w:tab, w:t"bar")', 'foo\tbar'),
+        ('w:r/(w:t"foo", w:br{w:type=page}, w:cr, w:drawing, w:t"bar")',
+         'foo\n\nbar'),
+    ])
+    def text_get_fixture(self, request):
+        r_cxml, expected_text = request.param
+        return element(r_cxml), expected_text
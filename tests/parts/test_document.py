@@ -82,8 +82,8 @@ class DescribeDocumentPart(object):
 
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
-        document.save(file_)
-        document._package.save.assert_called_once_with(file_)
+        document.save(file_, 6, 2, True)
+        document._package.save.assert_called_once_with(file_, 6, 2, True)
 
     def it_provides_access_to_the_document_settings(self, settings_fixture):
         document_part, settings_ = settings_fixture
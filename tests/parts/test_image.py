@@ -4,11 +4,15 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import hashlib
+import shutil
+
 import pytest
 
 from docx.image.image import Image
 from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PackURI
+from docx.opc.pkgreader import DeferredBlob
 from docx.opc.part import PartFactory
 from docx.package import Package
 from docx.parts.image import ImagePart
@@ -37,10 +41,15 @@ class DescribeImagePart(object):
         image_part = ImagePart.from_image(image_, partname_)
 
         _init_.assert_called_once_with(
-            ANY, partname_, image_.content_type, image_.blob, image_
+            ANY, partname_, image_.content_type, None, image_
         )
         assert isinstance(image_part, ImagePart)
 
+    def it_gets_its_blob_from_its_image_when_it_has_one(self, image_):
+        image_.blob = b'fO0Bar'
+        assert ImagePart(None, None, None, image_).blob == b'fO0Bar'
+        assert ImagePart(None, None, b'b1ob', image_).blob == b'b1ob'
+
     def it_knows_its_default_dimensions_in_EMU(self, dimensions_fixture):
         image_part, cx, cy = dimensions_fixture
         assert image_part.default_cx == cx
@@ -55,6 +64,52 @@ class DescribeImagePart(object):
         image_part = ImagePart(None, None, blob)
         assert image_part.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
 
+    def it_characterizes_a_lazily_loaded_image_from_its_bytes(
+        self, tmpdir
+    ):
+        path = str(tmpdir.join('having-images.docx'))
+        shutil.copy(test_file('having-images.docx'), path)
+        package = Package.open(path, lazy=True)
+        image_part = next(iter(package.image_parts))
+        image = image_part.image
+
+        package.save(path)
+
+        assert isinstance(image.blob, bytes)
+        assert image.blob == image_part.blob
+        assert image_part.sha1 == hashlib.sha1(image.blob).hexdigest()
+
+    def it_characterizes_a_lazily_loaded_image_through_a_view(self, request):
+        view = memoryview(b'png')
+        map_blob_ = method_mock(request, ImagePart, 'map_blob', return_value=view)
+        image_ = instance_mock(request, Image)
+        from_view_ = method_mock(
+            request, Image, 'from_view', autospec=False, return_value=image_
+        )
+        image_part = ImagePart(None, None, instance_mock(request, DeferredBlob))
+
+        image = image_part.image
+
+        map_blob_.assert_called_once_with(image_part)
+        from_view_.assert_called_once_with(view, image_part._read_blob)
+        assert image is image_
+        with pytest.raises(ValueError):
+            view.tobytes()
+
+    def it_hashes_a_lazily_loaded_image_through_a_view(self, request):
+        view = memoryview(b'fO0Bar')
+        method_mock(request, ImagePart, 'map_blob', return_value=view)
+        image_part = ImagePart(None, None, instance_mock(request, DeferredBlob))
+
+        assert image_part.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
+        with pytest.raises(ValueError):
+            view.tobytes()
+
+    def it_uses_the_sha1_of_its_image_when_it_has_one(self, request):
+        image_ = instance_mock(request, Image, sha1='f005ba11')
+        image_part = ImagePart(None, None, b'fO0Bar', image_)
+        assert image_part.sha1 == 'f005ba11'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
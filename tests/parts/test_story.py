@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from weakref import WeakValueDictionary
+
 import pytest
 
 from docx.enum.style import WD_STYLE_TYPE
@@ -17,7 +19,7 @@ from docx.styles.style import BaseStyle
 
 from ..unitutil.cxml import element
 from ..unitutil.file import snippet_text
-from ..unitutil.mock import instance_mock, method_mock, property_mock
+from ..unitutil.mock import instance_mock, method_mock, property_mock, var_mock
 
 
 class DescribeBaseStoryPart(object):
@@ -75,6 +77,7 @@ class DescribeBaseStoryPart(object):
         get_or_add_image_.assert_called_once_with(story_part, "foo/bar.png")
         image_.scaled_dimensions.assert_called_once_with(100, 200)
         assert inline.xml == expected_xml
+        assert story_part._reserved_id == 24
 
     def it_knows_the_next_available_xml_id(self, next_id_fixture):
         story_element, expected_value = next_id_fixture
@@ -84,6 +87,65 @@ class DescribeBaseStoryPart(object):
 
         assert next_id == expected_value
 
+    def it_does_not_reuse_a_reserved_id(self):
+        story_part = BaseStoryPart(None, None, element("w:document/w:p{id=2}"), None)
+
+        story_part.reserve_id(6)
+        story_part.reserve_id(4)
+
+        assert story_part.next_id == 7
+
+    def it_scans_for_ids_only_when_its_element_is_replaced(self):
+        story_part = BaseStoryPart(None, None, element("w:hdr/w:p{id=2}"), None)
+        assert story_part.next_id == 3
+
+        story_part.element.append(element("w:p{id=8}"))
+        assert story_part.next_id == 3
+
+        story_part._element = element("w:hdr/w:p{id=5}")
+        assert story_part.next_id == 6
+
+    def it_scans_again_when_an_id_added_to_its_xml_is_in_use(self):
+        story_part = BaseStoryPart(None, None, element("w:hdr/w:p{id=2}"), None)
+        story_part.reserve_id(story_part.next_id)
+
+        story_part.element.append(element("w:p/(w:r{id=4},w:r{id=9})"))
+
+        assert story_part.next_id == 10
+
+    def it_checks_ids_only_when_the_last_element_of_its_xml_changes(self, request):
+        _id_is_used_ = var_mock(
+            request, "docx.parts.story._id_is_used", return_value=False
+        )
+        story_part = BaseStoryPart(
+            None, None, element("w:document/w:body/(w:p{id=2},w:sectPr)"), None
+        )
+        body = story_part.element[0]
+
+        story_part.reserve_id(story_part.next_id)
+        body.insert(1, element("w:p"))
+        assert story_part.next_id == 4
+        assert _id_is_used_.call_count == 0
+
+        body.append(element("w:p"))
+        assert story_part.next_id == 4
+        _id_is_used_.assert_called_once_with(story_part.element, id=4)
+
+    def it_has_no_proxy_cache_unless_its_package_caches_proxies(self, package_):
+        package_.cache_proxies = False
+        story_part = BaseStoryPart(None, None, None, package_)
+
+        assert story_part.proxy_cache is None
+
+    def it_provides_a_proxy_cache_when_its_package_caches_proxies(self, package_):
+        package_.cache_proxies = True
+        story_part = BaseStoryPart(None, None, None, package_)
+
+        proxy_cache = story_part.proxy_cache
+
+        assert isinstance(proxy_cache, WeakValueDictionary)
+        assert story_part.proxy_cache is proxy_cache
+
     def it_knows_the_main_document_part_to_help(self, package_, document_part_):
         package_.main_document_part = document_part_
         story_part = BaseStoryPart(None, None, None, package_)
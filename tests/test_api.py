@@ -8,14 +8,18 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import os
+import shutil
+
 import pytest
 
 import docx
 
-from docx.api import Document
+from docx.api import Document, DocumentTemplate, register_template
 from docx.opc.constants import CONTENT_TYPE as CT
 
-from .unitutil.mock import function_mock, instance_mock, class_mock
+from .unitutil.file import docx_path
+from .unitutil.mock import function_mock, instance_mock, class_mock, patch
 
 
 class DescribeDocument(object):
@@ -23,15 +27,78 @@ class DescribeDocument(object):
     def it_opens_a_docx_file(self, open_fixture):
         docx, Package_, document_ = open_fixture
         document = Document(docx)
-        Package_.open.assert_called_once_with(docx)
+        Package_.open.assert_called_once_with(docx, False, None)
         assert document is document_
 
     def it_opens_the_default_docx_if_none_specified(self, default_fixture):
         docx, Package_, document_ = default_fixture
         document = Document()
-        Package_.open.assert_called_once_with(docx)
+        Package_.open.assert_called_once_with(docx, False, None)
         assert document is document_
 
+    def it_creates_documents_from_a_registered_template(
+        self, template_fixture
+    ):
+        path, DocumentTemplate_, document_ = template_fixture
+        register_template(path)
+
+        document = Document(path)
+        Document(path)
+
+        DocumentTemplate_.assert_called_once_with(path)
+        assert DocumentTemplate_.return_value.instantiate.call_count == 2
+        assert document is document_
+
+    def it_rereads_a_registered_template_when_its_file_changes(
+        self, template_fixture
+    ):
+        path, DocumentTemplate_, _ = template_fixture
+        register_template(path)
+        Document(path)
+
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        Document(path)
+
+        assert DocumentTemplate_.call_count == 2
+
+    def it_rereads_a_template_rewritten_with_the_same_mtime(self, template_fixture):
+        path, DocumentTemplate_, _ = template_fixture
+        register_template(path)
+        Document(path)
+        stat = os.stat(path)
+
+        with open(path, 'ab') as f:
+            f.write(b'\0')
+        os.utime(path, (stat.st_atime, stat.st_mtime))
+        Document(path)
+
+        assert DocumentTemplate_.call_count == 2
+
+    def it_does_not_check_the_default_template_file_again(
+        self, template_fixture, _default_docx_path_, request
+    ):
+        path, DocumentTemplate_, _ = template_fixture
+        _default_docx_path_.return_value = path
+        register_template(path)
+        _file_key_ = function_mock(request, 'docx.api._file_key')
+
+        Document()
+        Document()
+
+        assert _file_key_.call_count == 0
+        DocumentTemplate_.assert_called_once_with(path)
+
+    @pytest.mark.parametrize('kwargs', ({'lazy': True}, {'workers': 2}))
+    def it_raises_on_lazy_or_workers_for_a_registered_template(
+        self, template_fixture, kwargs
+    ):
+        path, _, _ = template_fixture
+        register_template(path)
+
+        with pytest.raises(ValueError):
+            Document(path, **kwargs)
+
     def it_raises_on_not_a_Word_file(self, raise_fixture):
         not_a_docx = raise_fixture
         with pytest.raises(ValueError):
@@ -62,6 +129,17 @@ class DescribeDocument(object):
         Package_.open.return_value.main_document_part.content_type = 'BOGUS'
         return not_a_docx
 
+    @pytest.fixture
+    def template_fixture(self, request, tmpdir, document_):
+        path = str(tmpdir.join('template.docx'))
+        shutil.copyfile(docx_path('test'), path)
+        DocumentTemplate_ = class_mock(request, 'docx.api.DocumentTemplate')
+        DocumentTemplate_.return_value.instantiate.return_value = document_
+        _templates = patch.dict('docx.api._templates')
+        _templates.start()
+        request.addfinalizer(_templates.stop)
+        return path, DocumentTemplate_, document_
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -75,3 +153,46 @@ class DescribeDocument(object):
     @pytest.fixture
     def Package_(self, request):
         return class_mock(request, 'docx.api.Package')
+
+
+class DescribeDocumentTemplate(object):
+
+    def it_reads_its_package_once(self, Package_, PackageSnapshot_):
+        package = Package_.from_snapshot.return_value
+        package.main_document_part.content_type = CT.WML_DOCUMENT_MAIN
+
+        template = DocumentTemplate('foobar.docx')
+
+        PackageSnapshot_.from_file.assert_called_once_with('foobar.docx')
+        Package_.from_snapshot.assert_called_once_with(
+            PackageSnapshot_.from_file.return_value
+        )
+        assert template._package is package
+
+    def it_raises_on_not_a_Word_file(self, Package_, PackageSnapshot_):
+        package = Package_.from_snapshot.return_value
+        package.main_document_part.content_type = 'BOGUS'
+        with pytest.raises(ValueError):
+            DocumentTemplate('foobar.xlsx')
+
+    def it_creates_independent_documents(self):
+        template = DocumentTemplate(docx_path('test'))
+
+        document = template.instantiate()
+        document.add_paragraph('foobar')
+        document_2 = template.instantiate()
+
+        assert isinstance(document, docx.document.Document)
+        assert document_2 is not document
+        assert document_2.part.package is not document.part.package
+        assert len(document.paragraphs) == len(document_2.paragraphs) + 1
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def Package_(self, request):
+        return class_mock(request, 'docx.api.Package')
+
+    @pytest.fixture
+    def PackageSnapshot_(self, request):
+        return class_mock(request, 'docx.api.PackageSnapshot')
@@ -0,0 +1,151 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.batch module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import pickle
+
+import pytest
+
+from docx.batch import (
+    BatchResult, BrokenProcessPool, map_documents, _iter_chunks, _process_chunk
+)
+
+from .unitutil.file import docx_path
+from .unitutil.mock import class_mock, Mock
+
+
+class DescribeMapDocuments(object):
+
+    def it_generates_a_result_for_each_document_in_order(self, paths):
+        results = list(map_documents(paths, _paragraph_count, workers=2))
+
+        assert [r.path for r in results] == paths
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[0].value == results[2].value == 2
+        assert results[1].value is None
+
+    def it_can_generate_results_as_they_are_completed(self, paths):
+        results = list(
+            map_documents(paths, _paragraph_count, workers=2, ordered=False)
+        )
+        assert sorted(r.path for r in results) == sorted(paths)
+
+    def it_captures_the_error_for_each_failed_document(self, paths):
+        result = list(map_documents(paths, _paragraph_count, workers=1))[1]
+
+        assert isinstance(result.error, Exception)
+        assert 'Traceback' in result.traceback
+
+    @pytest.mark.parametrize('ordered', (True, False))
+    def it_captures_a_worker_process_dying_for_that_document_alone(self, ordered):
+        paths = [docx_path('test'), docx_path('having-images')] + (
+            [docx_path('test')] * 4
+        )
+
+        results = list(
+            map_documents(
+                paths, _exit_on_image, workers=2, ordered=ordered, chunksize=2
+            )
+        )
+
+        assert sorted(r.path for r in results) == sorted(paths)
+        failed = [r for r in results if not r.ok]
+        assert [r.path for r in failed] == [docx_path('having-images')]
+        assert isinstance(failed[0].error, BrokenProcessPool)
+        assert all(r.value == 2 for r in results if r.ok)
+
+    def it_reports_progress_as_results_are_generated(self, paths):
+        calls = []
+
+        list(
+            map_documents(
+                paths, _paragraph_count, workers=2, chunksize=2,
+                progress=lambda done, total: calls.append((done, total)),
+            )
+        )
+
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+
+    def it_consumes_paths_lazily(self):
+        paths = iter([docx_path('test')] * 5)
+
+        results = map_documents(paths, _paragraph_count, workers=1, max_pending=2)
+        next(results)
+
+        assert len(list(paths)) == 2
+        results.close()
+
+    def it_does_not_wait_for_pending_chunks_when_closed_early(self, request):
+        executor_ = class_mock(
+            request, 'docx.batch.futures.ProcessPoolExecutor'
+        ).return_value
+        future_ = Mock(name='future')
+        future_.result.return_value = [
+            (docx_path('test'), pickle.dumps(2), None, None)
+        ]
+        executor_.submit.return_value = future_
+        paths = [docx_path('test')] * 5
+
+        results = map_documents(paths, _paragraph_count, workers=1, max_pending=2)
+        next(results)
+        results.close()
+
+        assert future_.cancel.call_count == 2
+        executor_.shutdown.assert_called_once_with(wait=False)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def paths(self):
+        return [docx_path('test'), docx_path('no-such-file'), docx_path('test')]
+
+
+class DescribeBatchResult(object):
+
+    def it_knows_whether_the_document_was_processed_ok(self):
+        assert BatchResult('a.docx', 42).ok is True
+        assert BatchResult('a.docx', error=ValueError('x')).ok is False
+
+
+class Describe_process_chunk(object):
+
+    def it_reports_a_value_that_cannot_be_pickled_as_an_error(self):
+        path = docx_path('test')
+
+        (result_path, pickled_value, error, traceback), = _process_chunk(
+            _first_paragraph, [path], False
+        )
+
+        assert result_path == path
+        assert pickled_value is None
+        assert isinstance(error, TypeError)
+        assert 'paragraph.text' in str(error)
+
+
+class Describe_iter_chunks(object):
+
+    def it_splits_paths_into_chunks(self):
+        assert list(_iter_chunks(iter('abcde'), 2)) == [
+            ['a', 'b'], ['c', 'd'], ['e']
+        ]
+
+
+# helpers ------------------------------------------------------------
+# these must be at module level so they can be pickled for worker processes
+
+
+def _exit_on_image(document):
+    if document.inline_shapes:
+        os._exit(1)
+    return len(document.paragraphs)
+
+
+def _first_paragraph(document):
+    return document.paragraphs[0]
+
+
+def _paragraph_count(document):
+    return len(document.paragraphs)
@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from docx.blkcntnr import BlockItemContainer
+from docx.oxml.ns import qn
 from docx.shared import Inches
 from docx.table import Table
 from docx.text.paragraph import Paragraph
@@ -37,6 +38,53 @@ class DescribeBlockItemContainer(object):
         assert table._element.xml == expected_xml
         assert table._parent is blkcntnr
 
+    def it_can_add_a_table_from_row_data(self):
+        blkcntnr = BlockItemContainer(element('w:body/w:p'), None)
+        rows = (('a', 'b') for _ in range(3))
+
+        table = blkcntnr.add_table_from_rows(rows, Inches(2), header=('x', 'y'))
+
+        assert isinstance(table, Table)
+        assert table._parent is blkcntnr
+        assert blkcntnr._element[-1] is table._tbl
+        assert table._tbl.col_count == 2
+        assert list(table.iter_rows_text()) == [['x', 'y']] + [['a', 'b']] * 3
+
+    def it_can_iterate_its_inner_content(self):
+        body = element('w:body/(w:p,w:tbl/w:tr/w:tc/w:p,w:p,w:sectPr)')
+        blkcntnr = BlockItemContainer(body, None)
+
+        items = list(blkcntnr.iter_inner_content())
+
+        assert [type(item) for item in items] == [Paragraph, Table, Paragraph]
+        assert [item._element for item in items] == [body[0], body[1], body[2]]
+        assert all(item._parent is blkcntnr for item in items)
+
+    def it_can_iterate_its_inner_content_recursively(self):
+        body = element(
+            'w:body/(w:p{w:id=1},w:tbl{w:id=2}/w:tr/(w:tc/w:p{w:id=3},w:tc/('
+            'w:tbl{w:id=4}/w:tr/w:tc/w:p{w:id=5},w:p{w:id=6})),w:p{w:id=7})'
+        )
+        blkcntnr = BlockItemContainer(body, None)
+
+        items = blkcntnr.iter_inner_content(recursive=True)
+
+        assert [item._element.get(qn('w:id')) for item in items] == [
+            '1', '2', '3', '4', '5', '6', '7'
+        ]
+
+    def it_can_iterate_the_text_of_its_paragraphs(self):
+        body = element(
+            'w:body/(w:p/w:r/w:t"a",w:tbl/w:tr/(w:tc/w:p/w:r/w:t"b",w:tc/('
+            'w:tbl/w:tr/w:tc/w:p/w:r/w:t"c",w:p)),w:p/w:r/(w:t"d",w:tab),w:sectPr)'
+        )
+        blkcntnr = BlockItemContainer(body, None)
+
+        assert list(blkcntnr.iter_paragraph_text()) == ['a', 'd\t']
+        assert list(blkcntnr.iter_paragraph_text(recursive=True)) == [
+            'a', 'b', 'c', '', 'd\t'
+        ]
+
     def it_provides_access_to_the_paragraphs_it_contains(
             self, paragraphs_fixture):
         # test len(), iterable, and indexed access
@@ -88,10 +88,39 @@ class DescribeDocument(object):
         assert table == table_
         assert table.style == style
 
+    def it_can_add_a_table_from_row_data(
+            self, _block_width_prop_, body_prop_, table_):
+        body_prop_.return_value.add_table_from_rows.return_value = table_
+        _block_width_prop_.return_value = width = 42
+        document = Document(None, None)
+        rows, style, header = [('a', 'b')], 'Table Grid', ('x', 'y')
+
+        table = document.add_table_from_rows(rows, style, header)
+
+        document._body.add_table_from_rows.assert_called_once_with(
+            rows, width, style, header
+        )
+        assert table is table_
+
     def it_can_save_the_document_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._part.save.assert_called_once_with(file_)
+        document._part.save.assert_called_once_with(file_, None, None, False)
+
+    def it_can_save_the_document_at_a_compression_level(self, save_fixture):
+        document, file_ = save_fixture
+        document.save(file_, compression=1)
+        document._part.save.assert_called_once_with(file_, 1, None, False)
+
+    def it_can_save_the_document_using_worker_threads(self, save_fixture):
+        document, file_ = save_fixture
+        document.save(file_, workers=4)
+        document._part.save.assert_called_once_with(file_, None, 4, False)
+
+    def it_can_save_the_document_incrementally(self, save_fixture):
+        document, file_ = save_fixture
+        document.save(file_, incremental=True)
+        document._part.save.assert_called_once_with(file_, None, None, True)
 
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document, core_properties_ = core_props_fixture
@@ -102,6 +131,33 @@ class DescribeDocument(object):
         document, inline_shapes_ = inline_shapes_fixture
         assert document.inline_shapes is inline_shapes_
 
+    def it_can_turn_proxy_caching_on_and_off(self, document_part_):
+        document_part_.package.cache_proxies = False
+        document = Document(None, document_part_)
+
+        document.cache_proxies = 1
+
+        assert document_part_.package.cache_proxies is True
+        assert document.cache_proxies is True
+
+    def it_can_iterate_its_inner_content(self, body_prop_):
+        body_prop_.return_value.iter_inner_content.return_value = iter(())
+        document = Document(None, None)
+
+        items = document.iter_inner_content(recursive=True)
+
+        body_prop_.return_value.iter_inner_content.assert_called_once_with(True)
+        assert list(items) == []
+
+    def it_can_iterate_the_text_of_its_paragraphs(self, body_prop_):
+        body_prop_.return_value.iter_paragraph_text.return_value = iter(['foo'])
+        document = Document(None, None)
+
+        texts = document.iter_paragraph_text()
+
+        body_prop_.return_value.iter_paragraph_text.assert_called_once_with(False)
+        assert list(texts) == ['foo']
+
     def it_provides_access_to_its_paragraphs(self, paragraphs_fixture):
         document, paragraphs_ = paragraphs_fixture
         paragraphs = document.paragraphs
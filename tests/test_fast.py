@@ -0,0 +1,63 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.fast module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.api import Document
+from docx.compat import BytesIO
+from docx.fast import iter_text
+
+from .unitutil.file import absjoin, test_file_dir
+
+
+class DescribeIterText(object):
+
+    def it_generates_the_text_of_each_paragraph_in_document_order(self, docx):
+        assert list(iter_text(docx)) == [
+            "foo\tbar\nbaz",
+            "cell 0",
+            "nested",
+            "",
+            "cell 1",
+            "last",
+        ]
+
+    def it_matches_the_text_reported_by_the_proxy_api(self, docx):
+        document = Document(docx)
+        body_texts = [p.text for p in document.paragraphs]
+        docx.seek(0)
+
+        texts = list(iter_text(docx))
+
+        assert [texts[0], texts[-1]] == body_texts
+
+    def it_can_include_header_and_footer_text(self, docx):
+        texts = list(iter_text(docx, include_headers_footers=True))
+        assert texts[-2:] == ["header", "footer"]
+
+    def it_can_read_an_expanded_package(self):
+        texts = list(iter_text(absjoin(test_file_dir, 'expanded_docx')))
+        assert "python-docx was here!" in texts
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def docx(self):
+        document = Document()
+        document.add_paragraph("foo\tbar\nbaz")
+        table = document.add_table(1, 2)
+        cell = table.cell(0, 0)
+        cell.text = "cell 0"
+        cell.add_table(1, 1).cell(0, 0).text = "nested"
+        table.cell(0, 1).text = "cell 1"
+        document.add_paragraph("last")
+        section = document.sections[0]
+        section.header.paragraphs[0].text = "header"
+        section.footer.paragraphs[0].text = "footer"
+        stream = BytesIO()
+        document.save(stream)
+        stream.seek(0)
+        return stream
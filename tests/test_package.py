@@ -10,6 +10,7 @@ from docx.image.image import Image
 from docx.opc.packuri import PackURI
 from docx.package import ImageParts, Package
 from docx.parts.image import ImagePart
+from docx.shared import proxy_caching_packages
 
 from .unitutil.file import docx_path
 from .unitutil.mock import class_mock, instance_mock, method_mock, property_mock
@@ -29,6 +30,18 @@ class DescribePackage(object):
         image_parts_.get_or_add_image_part.assert_called_once_with("image.png")
         assert image_part is image_part_
 
+    def it_can_turn_proxy_caching_on_and_off(self):
+        package = Package()
+        assert package.cache_proxies is False
+
+        package.cache_proxies = True
+        assert package.cache_proxies is True
+        assert package in proxy_caching_packages
+
+        package.cache_proxies = False
+        assert package.cache_proxies is False
+        assert package not in proxy_caching_packages
+
     def it_gathers_package_image_parts_after_unmarshalling(self):
         package = Package.open(docx_path('having-images'))
         image_parts = package.image_parts
@@ -83,6 +96,24 @@ class DescribeImageParts(object):
         _add_image_part_.assert_called_once_with(image_parts, image_)
         assert image_part is image_part_
 
+    def it_can_find_an_image_part_by_sha1(self, request):
+        def image_part_(n, sha1):
+            partname = PackURI('/word/media/image%d.png' % n)
+            return instance_mock(request, ImagePart, partname=partname, sha1=sha1)
+
+        image_parts = ImageParts()
+        image_part_1, image_part_2 = image_part_(1, 'f00'), image_part_(2, 'ba7')
+        image_parts.append(image_part_1)
+
+        assert image_parts._get_by_sha1('f00') is image_part_1
+        assert image_parts._get_by_sha1('ba7') is None
+
+        image_parts.append(image_part_2)
+        image_parts.append(image_part_(3, 'f00'))
+
+        assert image_parts._get_by_sha1('ba7') is image_part_2
+        assert image_parts._get_by_sha1('f00') is image_part_1
+
     def it_knows_the_next_available_image_partname(self, next_partname_fixture):
         image_parts, ext, expected_partname = next_partname_fixture
         assert image_parts._next_image_partname(ext) == expected_partname
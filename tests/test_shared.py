@@ -8,15 +8,22 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import gc
+from weakref import WeakValueDictionary
+
 import pytest
 
 from docx.opc.part import XmlPart
+from docx.package import Package
 from docx.shared import (
-    ElementProxy, Length, Cm, Emu, Inches, Mm, Pt, RGBColor, Twips
+    cached_proxy, ElementProxy, Length, Cm, Emu, Inches, Mm, Parented,
+    proxies_for, proxy_cache, proxy_for, Pt, RGBColor, Twips
 )
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
 
 from .unitutil.cxml import element
-from .unitutil.mock import instance_mock
+from .unitutil.mock import Mock, instance_mock
 
 
 class DescribeElementProxy(object):
@@ -74,6 +81,108 @@ class DescribeElementProxy(object):
         return instance_mock(request, XmlPart)
 
 
+class Describe_proxy_for(object):
+
+    def it_creates_a_new_proxy_when_proxies_are_not_cached(self, caching_):
+        p, parent = element('w:p'), Mock(part=Mock(proxy_cache=None))
+
+        proxy = proxy_for(Paragraph, p, parent)
+
+        assert isinstance(proxy, Paragraph)
+        assert proxy._p is p
+        assert proxy._parent is parent
+        assert proxy_for(Paragraph, p, parent) is not proxy
+
+    def it_reuses_a_cached_proxy_while_it_is_in_use(self, parent):
+        p = element('w:p')
+
+        proxy = proxy_for(Paragraph, p, parent)
+
+        assert proxy_for(Paragraph, p, parent) is proxy
+        assert proxy_for(Paragraph, element('w:p'), parent) is not proxy
+
+    def it_creates_a_new_proxy_for_another_parent(self, parent):
+        p = element('w:p')
+        other_parent = Mock(part=parent.part)
+        proxy = proxy_for(Paragraph, p, parent)
+
+        other_proxy = proxy_for(Paragraph, p, other_parent)
+
+        assert other_proxy is not proxy
+        assert other_proxy._parent is other_parent
+        assert proxy_for(Paragraph, p, parent) is proxy
+
+    def it_replaces_a_cached_proxy_of_another_type(self, parent):
+        p = element('w:p')
+        run = proxy_for(Run, p, parent)
+
+        paragraph = proxy_for(Paragraph, p, parent)
+
+        assert isinstance(paragraph, Paragraph)
+        assert parent.part.proxy_cache[(p, id(parent))] is paragraph
+        assert run is not paragraph
+
+    def it_drops_a_cached_proxy_once_it_is_no_longer_used(self, parent):
+        proxy_for(Paragraph, element('w:p'), parent)
+        gc.collect()
+
+        assert len(parent.part.proxy_cache) == 0
+
+    def it_can_get_proxies_for_a_sequence_of_elements(self, parent):
+        p, p_2 = element('w:p'), element('w:p')
+        proxy = proxy_for(Paragraph, p, parent)
+
+        proxies = proxies_for(Paragraph, [p, p_2], parent)
+
+        assert proxies[0] is proxy
+        assert proxies[1]._p is p_2
+
+    def it_creates_a_new_proxy_when_parent_has_no_part(self, caching_):
+        proxy = proxy_for(Paragraph, element('w:p'), None)
+        assert proxy._parent is None
+
+    def it_does_not_look_for_a_cache_when_no_package_caches_proxies(self):
+        parent = Mock(part=Mock(proxy_cache=WeakValueDictionary()))
+
+        proxy = proxy_for(Paragraph, element('w:p'), parent)
+
+        assert proxy_cache(parent) is None
+        assert proxy_for(Paragraph, proxy._p, parent) is not proxy
+        assert len(parent.part.proxy_cache) == 0
+
+    def it_can_look_up_a_cache_once_for_many_proxies(self, parent):
+        p = element('w:p')
+        cache = proxy_cache(parent)
+
+        proxy = cached_proxy(cache, Paragraph, p, parent)
+
+        assert cache is parent.part.proxy_cache
+        assert cached_proxy(cache, Paragraph, p, parent) is proxy
+        assert cached_proxy(None, Paragraph, p, parent) is not proxy
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def caching_(self, request):
+        # ---any package caching proxies makes them look for a cache---
+        package = Package()
+        package.cache_proxies = True
+        request.addfinalizer(lambda: setattr(package, 'cache_proxies', False))
+        return package
+
+    @pytest.fixture
+    def parent(self, caching_):
+        return Mock(part=Mock(proxy_cache=WeakValueDictionary()))
+
+
+class DescribeParented(object):
+
+    def it_accepts_attributes_set_on_it(self):
+        parented = Parented(None)
+        parented.foo = 42
+        assert parented.foo == 42
+
+
 class DescribeLength(object):
 
     def it_can_construct_from_convenient_units(self, construct_fixture):
@@ -0,0 +1,126 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.streaming module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import zipfile
+
+import pytest
+
+from docx.api import Document
+from docx.compat import BytesIO
+from docx.streaming import StreamingDocument
+from docx.text.paragraph import Paragraph
+
+from .unitutil.file import test_file
+
+
+class DescribeStreamingDocument(object):
+
+    def it_writes_the_blocks_added_to_it_in_order(self, stream):
+        with StreamingDocument(stream) as document:
+            document.add_heading("Title", 0)
+            document.add_paragraph("foo")
+            table = document.add_table(2, 2)
+            table.cell(0, 0).text = "bar"
+            document.add_page_break()
+
+        saved = Document(stream)
+        assert [p.text for p in saved.paragraphs] == ["Title", "foo", "\n"]
+        assert saved.paragraphs[0].style.name == "Title"
+        assert saved.tables[0].cell(0, 0).text == "bar"
+        assert saved.element.body.sectPr is not None
+
+    def it_keeps_the_last_block_editable_until_the_next_is_added(self, stream):
+        with StreamingDocument(stream) as document:
+            paragraph = document.add_paragraph("foo")
+            paragraph.add_run("bar").bold = True
+            document.add_paragraph("baz")
+            paragraph.add_run("ignored")
+
+        saved = Document(stream)
+        assert [p.text for p in saved.paragraphs] == ["foobar", "baz"]
+        assert saved.paragraphs[0].runs[1].bold is True
+
+    def it_drops_flushed_blocks_from_memory(self, stream):
+        document = StreamingDocument(stream)
+        document.add_paragraph("foo")
+        document.add_paragraph("bar")
+
+        document.flush()
+
+        assert len(document._body.p_lst) == 0
+        document.close()
+
+    def it_keeps_shape_ids_unique_across_flushes(self, stream):
+        with StreamingDocument(stream) as document:
+            document.add_picture(test_file("monty-truth.png"))
+            document.add_picture(test_file("monty-truth.png"))
+
+        saved = Document(stream)
+        ids = [shape._inline.docPr.id for shape in saved.inline_shapes]
+        assert ids == [1, 2]
+
+    def it_returns_the_usual_proxy_objects(self, stream):
+        with StreamingDocument(stream) as document:
+            paragraph = document.add_paragraph()
+        assert isinstance(paragraph, Paragraph)
+
+    def it_can_add_a_table_from_row_data(self, stream):
+        with StreamingDocument(stream) as document:
+            document.add_table_from_rows(
+                (('a', i) for i in range(3)), header=('x', 'y')
+            )
+            document.add_paragraph('after')
+
+        saved = Document(stream)
+        assert list(saved.tables[0].iter_rows_text()) == [
+            ['x', 'y'], ['a', '0'], ['a', '1'], ['a', '2']
+        ]
+
+    def it_removes_the_package_when_the_with_block_raises(self, tmpdir):
+        path = str(tmpdir.join('report.docx'))
+
+        with pytest.raises(KeyError):
+            with StreamingDocument(path) as document:
+                document.add_paragraph("foo")
+                raise KeyError("foo")
+
+        assert not os.path.exists(path)
+
+    def it_leaves_a_stream_unreadable_when_the_with_block_raises(self, stream):
+        with pytest.raises(KeyError):
+            with StreamingDocument(stream) as document:
+                document.add_paragraph("foo")
+                document.flush()
+                raise KeyError("foo")
+
+        assert len(stream.getvalue()) > 0
+        assert not zipfile.is_zipfile(stream)
+
+    def it_can_be_aborted_more_than_once(self, stream):
+        document = StreamingDocument(stream)
+        document.abort()
+        document.abort()
+        document.close()
+        with pytest.raises(ValueError):
+            document.add_paragraph("foo")
+
+    def it_can_be_closed_more_than_once(self, stream):
+        document = StreamingDocument(stream)
+        document.close()
+        document.close()
+
+    def but_it_raises_when_content_is_added_after_close(self, stream):
+        document = StreamingDocument(stream)
+        document.close()
+        with pytest.raises(ValueError):
+            document.add_paragraph("foo")
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def stream(self):
+        return BytesIO()
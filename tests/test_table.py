@@ -10,7 +10,9 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.table import (
     WD_ALIGN_VERTICAL, WD_ROW_HEIGHT, WD_TABLE_ALIGNMENT, WD_TABLE_DIRECTION
 )
+from docx.exceptions import InvalidSpanError
 from docx.oxml import parse_xml
+from docx.oxml.ns import qn
 from docx.oxml.table import CT_Tc
 from docx.parts.document import DocumentPart
 from docx.shared import Inches
@@ -34,6 +36,22 @@ class DescribeTable(object):
         assert row._tr is table._tbl.tr_lst[-1]
         assert row._parent is table
 
+    def it_can_append_rows_of_data(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=1440}),'
+            'w:tr/(w:tc/w:p,w:tc/w:p))'
+        ), None)
+        cells = table._cells
+
+        table.append_rows(row for row in [('a', 'b'), ('c',)])
+
+        assert table._cells is not cells
+        assert list(table.iter_rows_text()) == [
+            ['', ''], ['a', 'b'], ['c', '']
+        ]
+        for tr in table._tbl.tr_lst[1:]:
+            assert [tc.width for tc in tr.tc_lst] == [Inches(1), Inches(1)]
+
     def it_can_add_a_column(self, add_column_fixture):
         table, width, expected_xml = add_column_fixture
         column = table.add_column(width)
@@ -126,6 +144,91 @@ class DescribeTable(object):
             for idx in matching_idxs[1:]:
                 assert cells[idx] is cells[comparator_idx]
 
+    def it_reuses_its_cell_grid_until_the_layout_changes(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=1440}),'
+            'w:tr/(w:tc/w:p,w:tc/w:p),w:tr/(w:tc/w:p,w:tc/w:p))'
+        ), None)
+        cells = table._cells
+        assert table._cells is cells
+
+        table.add_row()
+        assert table._cells is not cells
+        assert len(table._cells) == 6
+
+        cells = table._cells
+        table.add_column(Inches(1))
+        assert table._cells is not cells
+        assert len(table._cells) == 9
+
+    def it_notices_layout_changes_made_through_another_table_object(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=1440}),'
+            'w:tr/(w:tc/w:p,w:tc/w:p),w:tr/(w:tc/w:p,w:tc/w:p))'
+        )
+        table, other_table = Table(tbl, None), Table(tbl, None)
+        table.cell(0, 0)
+
+        other_table.add_row()
+        assert table.cell(2, 0)._tc is tbl.tr_lst[2].tc_lst[0]
+
+        other_table.cell(1, 0).merge(other_table.cell(2, 0))
+        assert table.cell(2, 0) is table.cell(1, 0)
+
+    def it_notices_rows_and_cells_added_to_the_xml_directly(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:p,w:tc/w:p))'
+        )
+        table = Table(tbl, None)
+        table.cell(0, 0)
+
+        tr = tbl.add_tr()
+        tr.add_tc()
+        assert len(table._cells) == 3
+        tr.add_tc()
+        assert table.cell(1, 1)._tc is tr.tc_lst[1]
+
+    def it_sees_the_current_layout_after_a_merge_that_fails(self):
+        tbl = element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol,w:gridCol,'
+            'w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p,w:tc/w:p,w:tc/w:p),'
+            'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p,w:tc/w:p,w:tc/w:p),'
+            'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p,w:tc/w:p,w:tc/w:p),'
+            'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p,w:tc/w:p,w:tc/w:p))'
+        )
+        table = Table(tbl, None)
+        table.cell(2, 3).merge(table.cell(2, 4))
+
+        with pytest.raises(InvalidSpanError):
+            table.cell(2, 2).merge(table.cell(0, 3))
+
+        fresh_table = Table(tbl, None)
+        assert [c._tc for c in table._cells] == [
+            c._tc for c in fresh_table._cells
+        ]
+        assert table.cell(3, 4)._tc is fresh_table.cell(3, 4)._tc
+
+    def it_can_merge_a_batch_of_regions(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:p,w:tc/w:p),w:tr/(w:tc/w:p,w:tc/w:p))'
+        ), None)
+        cells = table._cells
+
+        merged_cells = table.merge_cells([(0, 0, 0, 1), (1, 1, 1, 0)])
+
+        assert table._cells is not cells
+        assert [cell._tc for cell in merged_cells] == [
+            tr.tc_lst[0] for tr in table._tbl.tr_lst
+        ]
+        assert all(cell._parent is table for cell in merged_cells)
+        assert table.cell(1, 1) is table.cell(1, 0)
+
+    def it_can_generate_the_text_of_each_row(self, rows_text_fixture):
+        table, expected_value = rows_text_fixture
+        assert list(table.iter_rows_text()) == expected_value
+
     def it_knows_its_column_count_to_help(self, column_count_fixture):
         table, expected_value = column_count_fixture
         column_count = table._column_count
@@ -260,6 +363,20 @@ class DescribeTable(object):
         expected_xml = xml(expected_cxml)
         return table, new_value, expected_xml
 
+    @pytest.fixture(params=[
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p/w:r/w:t"a",'
+         'w:tc/w:p/w:r/w:t"b"),w:tr/(w:tc/w:p/w:r/w:t"c",w:tc/w:p))',
+         [['a', 'b'], ['c', '']]),
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/w:tc/(w:tcPr/w:gridSpan'
+         '{w:val=2},w:p/w:r/w:t"a"),w:tr/(w:tc/(w:p/w:r/w:t"b",w:p/w:r/w:t"c"'
+         '),w:tc/w:p))',
+         [['a', 'a'], ['b\nc', '']]),
+    ])
+    def rows_text_fixture(self, request):
+        tbl_cxml, expected_value = request.param
+        table = Table(element(tbl_cxml), None)
+        return table, expected_value
+
     @pytest.fixture
     def row_cells_fixture(self, _cells_, _column_count_):
         table = Table(None, None)
@@ -393,10 +510,22 @@ class Describe_Cell(object):
         assert cell._element.xml == expected_xml
         assert isinstance(table, Table)
 
+    def it_can_add_a_table_from_row_data(self):
+        cell = _Cell(element('w:tc/(w:tcPr/w:tcW{w:w=2880,w:type=dxa},w:p)'), None)
+
+        table = cell.add_table_from_rows([('a', 'b')], header=('x', 'y'))
+
+        assert isinstance(table, Table)
+        assert cell._tc[-2] is table._tbl
+        assert cell._tc[-1].tag == qn('w:p')
+        assert table._tbl.tblGrid.gridCol_lst[0].w == Inches(1)
+        assert list(table.iter_rows_text()) == [['x', 'y'], ['a', 'b']]
+
     def it_can_merge_itself_with_other_cells(self, merge_fixture):
         cell, other_cell, merged_tc_ = merge_fixture
         merged_cell = cell.merge(other_cell)
         cell._tc.merge.assert_called_once_with(other_cell._tc)
+        cell._parent.table._invalidate_cells.assert_called_once_with()
         assert isinstance(merged_cell, _Cell)
         assert merged_cell._tc is merged_tc_
         assert merged_cell._parent is cell._parent